@@ -0,0 +1,80 @@
+"""
+DocxLib 直接格式与命名样式性能对比
+
+对 2,000 个单元格（500 行 × 4 列）的网格填充同一样式：
+    - direct: column_styles 使用 StyleSpec，每个文本范围写入直接格式
+    - named: register_style 注册段落样式，column_styles 使用样式名称
+
+对比填充耗时、保存耗时、重新加载耗时以及 document.xml 大小。
+
+用法（在仓库根目录运行）:
+    python -m benchmarks.bench_named_styles [行数] [次数]
+"""
+
+import sys
+import time
+import zipfile
+from io import BytesIO
+
+from spire.doc import Document
+
+from docxlib import StyleSpec, fill_grid, load_docx, register_style, to_docx_bytes
+
+COLUMNS = 4
+STYLE = StyleSpec(font_name="仿宋", font_size=12, color="#1F3864", bold=True, h_align="center")
+
+
+def make_document(rows: int) -> bytes:
+    """生成一个 rows × COLUMNS 的空表格文档"""
+    doc = Document()
+    doc.AddSection().AddTable(True).ResetCells(rows, COLUMNS)
+    return to_docx_bytes(doc)
+
+
+def run(template: bytes, rows: int, named: bool) -> dict:
+    """填充、保存并重新加载一次，返回各阶段耗时（毫秒）和 document.xml 大小"""
+    data = [[f"{r}-{c}" for c in range(COLUMNS)] for r in range(rows)]
+    doc = load_docx(template)
+
+    start = time.perf_counter()
+    if named:
+        register_style(doc, "FieldValue", STYLE)
+        column_styles = ["FieldValue"] * COLUMNS
+    else:
+        column_styles = [STYLE] * COLUMNS
+    fill_grid(doc, data, (1, 1, 1, 1), column_styles=column_styles)
+    fill_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    output = to_docx_bytes(doc)
+    save_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    load_docx(output)
+    load_ms = (time.perf_counter() - start) * 1000
+
+    with zipfile.ZipFile(BytesIO(output)) as package:
+        xml_size = package.getinfo("word/document.xml").file_size
+    return {"fill": fill_ms, "save": save_ms, "load": load_ms, "xml": xml_size, "docx": len(output)}
+
+
+def main():
+    """性能对比"""
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    template = make_document(rows)
+    run(template, rows, named=False)  # 预热
+    print(f"{rows} 行 × {COLUMNS} 列（{rows * COLUMNS} 个单元格），每种方式 {rounds} 次")
+    print(f"  {'':<8} {'填充':>9} {'保存':>9} {'加载':>9} {'document.xml':>14} {'docx':>10}")
+    for label, named in (("direct", False), ("named", True)):
+        results = [run(template, rows, named) for _ in range(rounds)]
+        avg = {key: sum(r[key] for r in results) / rounds for key in results[0]}
+        print(
+            f"  {label:<8} {avg['fill']:7.1f}ms {avg['save']:7.1f}ms {avg['load']:7.1f}ms "
+            f"{avg['xml'] / 1024:11.1f} KB {avg['docx'] / 1024:7.1f} KB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+DocxLib 模板副本获取方式性能对比
+
+对比批量生成时获取模板副本的三种方式：
+    - load_docx: 每条记录从磁盘重新加载模板
+    - stream: TemplatePool 从内存字节数据 LoadFromStream
+    - clone: TemplatePool 对常驻模板调用 Spire.Doc 原生 Clone
+
+用法（在仓库根目录运行）:
+    python -m benchmarks.bench_template_pool [模板路径] [次数]
+"""
+
+import sys
+import time
+
+from docxlib import TemplatePool, load_docx
+
+
+def bench(label: str, func, rounds: int) -> float:
+    """运行 func rounds 次并打印平均耗时（毫秒）"""
+    func()  # 预热
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    avg_ms = (time.perf_counter() - start) / rounds * 1000
+    print(f"  {label:<12} {avg_ms:8.2f} ms/份")
+    return avg_ms
+
+
+def main():
+    """性能对比"""
+    template_path = sys.argv[1] if len(sys.argv) > 1 else "fixtures/templates/sample.docx"
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    stream_pool = TemplatePool(template_path, strategy=TemplatePool.STREAM)
+    clone_pool = TemplatePool(template_path, strategy=TemplatePool.CLONE)
+
+    print(f"模板: {template_path}，每种方式 {rounds} 次")
+    baseline = bench("load_docx", lambda: load_docx(template_path), rounds)
+    for label, pool in (("stream", stream_pool), ("clone", clone_pool)):
+        avg_ms = bench(label, pool.acquire, rounds)
+        print(f"  {'':<12} 相对 load_docx: {baseline / avg_ms:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
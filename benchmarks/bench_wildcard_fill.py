@@ -0,0 +1,127 @@
+"""
+DocxLib 通配符文本填充性能对比
+
+对比通配符位置填充同一文本的两种方式：
+    - per_cell: 优化前的实现，每个单元格逐项设置字体、字号、颜色、粗体、
+      斜体、下划线和对齐，颜色和对齐方式每次重新解析
+    - clone: fill_text 只在第一个单元格设置样式，其余单元格复制该段落
+
+用法（在仓库根目录运行）:
+    python -m benchmarks.bench_wildcard_fill [表格数] [次数]
+"""
+
+import sys
+import time
+
+import re
+
+from spire.doc import Color, Document, HorizontalAlignment, UnderlineStyle, VerticalAlignment
+
+from docxlib import fill_text, get_cells, load_docx, to_docx_bytes
+from docxlib.constants import COLOR_MAP
+
+STYLE = dict(
+    font_name="黑体",
+    font_size=14,
+    color="#C00000",
+    bold=True,
+    italic=True,
+    underline=True,
+    h_align="center",
+    v_align="center",
+)
+
+
+def make_document(tables: int) -> bytes:
+    """生成包含多个 4×4 表格的文档"""
+    doc = Document()
+    section = doc.AddSection()
+    for _ in range(tables):
+        section.AddTable(True).ResetCells(4, 4)
+        # 相邻表格之间需要段落分隔，否则保存时会合并为一个表格
+        section.AddParagraph()
+    return to_docx_bytes(doc)
+
+
+def old_parse_color(color_str: str) -> Color:
+    """旧版 parse_color：没有缓存，每次调用都重新解析并创建 Color"""
+    color_str = color_str.strip().lower()
+    hex_str = COLOR_MAP.get(color_str, color_str).lstrip("#")
+    if not re.match(r"^[0-9a-f]{6}$", hex_str):
+        return Color.get_Black()
+    return Color.FromArgb(255, int(hex_str[0:2], 16), int(hex_str[2:4], 16), int(hex_str[4:6], 16))
+
+
+def old_fill_single_cell_text(cell, value: str) -> None:
+    """旧版 _fill_single_cell_text 与 apply_font_style 的代码路径"""
+    cell.Paragraphs.Clear()
+    paragraph = cell.AddParagraph()
+    run = paragraph.AppendText(value)
+
+    if STYLE["font_name"]:
+        run.CharacterFormat.FontName = STYLE["font_name"]
+    if STYLE["font_size"] > 0:
+        run.CharacterFormat.FontSize = STYLE["font_size"]
+    if STYLE["color"]:
+        run.CharacterFormat.TextColor = old_parse_color(STYLE["color"])
+    run.CharacterFormat.Bold = STYLE["bold"]
+    run.CharacterFormat.Italic = STYLE["italic"]
+    if STYLE["underline"]:
+        run.CharacterFormat.UnderlineStyle = UnderlineStyle.Single
+
+    h_alignment_map = {
+        "left": HorizontalAlignment.Left,
+        "center": HorizontalAlignment.Center,
+        "right": HorizontalAlignment.Right,
+        "justify": HorizontalAlignment.Justify,
+    }
+    if STYLE["h_align"] in h_alignment_map:
+        paragraph.Format.HorizontalAlignment = h_alignment_map[STYLE["h_align"]]
+    v_alignment_map = {
+        "top": VerticalAlignment.Top,
+        "center": VerticalAlignment.Middle,
+        "bottom": VerticalAlignment.Bottom,
+    }
+    if STYLE["v_align"] in v_alignment_map:
+        cell.CellFormat.VerticalAlignment = v_alignment_map[STYLE["v_align"]]
+
+
+def fill_per_cell(doc) -> None:
+    """旧实现：每个单元格分别设置样式"""
+    for *_, cell in get_cells(doc, 1, 0, 1, 0):
+        old_fill_single_cell_text(cell, "表头")
+
+
+def fill_clone(doc) -> None:
+    """新实现：fill_text 通配符位置复制第一个段落"""
+    fill_text(doc, (1, 0, 1, 0), "表头", **STYLE)
+
+
+def bench(label: str, func, template: bytes, rounds: int) -> float:
+    """在新加载的文档上运行 func rounds 次并打印平均耗时（毫秒，不含加载）"""
+    func(load_docx(template))  # 预热
+    total = 0.0
+    for _ in range(rounds):
+        doc = load_docx(template)
+        start = time.perf_counter()
+        func(doc)
+        total += time.perf_counter() - start
+    avg_ms = total / rounds * 1000
+    print(f"  {label:<10} {avg_ms:8.2f} ms/次")
+    return avg_ms
+
+
+def main():
+    """性能对比"""
+    tables = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    template = make_document(tables)
+    print(f"{tables} 个表格的首行（{tables * 4} 个单元格），每种方式 {rounds} 次")
+    baseline = bench("per_cell", fill_per_cell, template, rounds)
+    avg_ms = bench("clone", fill_clone, template, rounds)
+    print(f"  {'':<10} 相对 per_cell: {baseline / avg_ms:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
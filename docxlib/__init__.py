@@ -26,29 +26,32 @@ DocxLib - Word 文档处理库
 __version__ = "0.1.0"
 __author__ = "DocxLib Contributors"
 
-# ==================== 文档操作 ====================
+# 常量、异常、文档后端、图片缓存、只读文档和工具函数不依赖 Spire.Doc，直接导入
+from .backend import (
+    BackendDocument,
+    DocumentBackend,
+    SpireBackend,
+    XmlBackend,
+    get_backend,
+    open_docx,
+    register_backend,
+    set_default_backend,
+)
 from .constants import (
+    DEFAULT_BACKEND,
     DEFAULT_COLOR,
     DEFAULT_FONT,
     DEFAULT_FONT_SIZE,
+    BackendType,
     FileFormat,
     FillMode,
     HorizontalAlignment,
     MatchMode,
     Position,
     SUPPORTED_IMAGE_FORMATS,
+    SPIRE_AVAILABLE,
     VerticalAlignment,
 )
-from .document import (
-    copy_doc,
-    get_document_properties,
-    load_docx,
-    merge_docs,
-    save_docx,
-    to_images,
-    to_pdf,
-    to_pdf_file,
-)
 from .errors import (
     DocumentError,
     DocxLibError,
@@ -59,39 +62,14 @@ from .errors import (
     VariableNotFoundError,
     VariableSyntaxError,
 )
-from .fill import (
-    clear_cell,
-    fill_date,
-    fill_grid,
-    fill_image,
-    fill_template,
-    fill_text,
-    replace_all,
-    validate_template_data,
-    extract_template_vars,
-)
-from .style import (
-    apply_cell_alignment,
-    apply_font_style,
-    apply_paragraph_alignment,
-    get_cell_style,
-    get_paragraph_style,
-    parse_color,
-    set_cell_border,
-)
-from .table import (
-    find_text,
-    get_cell,
-    get_cell_text,
-    get_cells,
-    get_section_count,
-    get_section_table_count,
-    get_table_column_text,
-    get_table_dimensions,
-    get_table_row_text,
-    get_table_text,
-    iterate_cells,
+from .image import (
+    CachedImage,
+    ImageCache,
+    clear_image_cache,
+    get_image_cache,
+    get_image_size,
 )
+from .reader import DocxReader
 from .utils import (
     ensure_directory,
     is_valid_docx,
@@ -101,6 +79,90 @@ from .utils import (
     validate_date_string,
     validate_docx,
 )
+from .xmlfill import fill_template_bytes
+
+# ==================== 延迟导入 ====================
+# 以下子模块依赖 Spire.Doc，导入时会启动 .NET 运行时。
+# 首次访问对应名称时才导入子模块（PEP 562），使 CLI 等轻量用法无需加载引擎。
+
+_LAZY_ATTRS = {
+    # 文档操作
+    "TemplatePool": "document",
+    "copy_doc": "document",
+    "get_document_properties": "document",
+    "iter_images": "document",
+    "load_docx": "document",
+    "merge_docs": "document",
+    "save_docx": "document",
+    "to_images": "document",
+    "to_docx_bytes": "document",
+    "to_pdf": "document",
+    "to_pdf_file": "document",
+    # 表格操作
+    "DocumentIndex": "table",
+    "find_text": "table",
+    "get_document_index": "table",
+    "get_cell": "table",
+    "get_cell_text": "table",
+    "get_cells": "table",
+    "get_section_count": "table",
+    "get_section_table_count": "table",
+    "get_table_column_text": "table",
+    "get_table_dimensions": "table",
+    "get_table_row_text": "table",
+    "get_table_text": "table",
+    "invalidate_index": "table",
+    "iterate_cells": "table",
+    # 字段填充
+    "clear_cell": "fill",
+    "fill_date": "fill",
+    "fill_form": "fill",
+    "fill_grid": "fill",
+    "fill_image": "fill",
+    "fill_template": "fill",
+    "fill_text": "fill",
+    "replace_all": "fill",
+    "validate_template_data": "fill",
+    "extract_template_vars": "fill",
+    # 模板编译
+    "CompiledTemplate": "template",
+    "compile_template": "template",
+    "render_batch": "batch",
+    # 样式管理
+    "apply_cell_alignment": "style",
+    "apply_font_style": "style",
+    "apply_paragraph_alignment": "style",
+    "get_cell_style": "style",
+    "get_paragraph_style": "style",
+    "get_table_styles": "style",
+    "get_document_styles": "style",
+    "parse_color": "style",
+    "StyleSpec": "style",
+    "register_style": "style",
+    "set_minimal_formatting": "style",
+    "get_format_stats": "style",
+    "reset_format_stats": "style",
+    "set_cell_border": "style",
+}
+
+
+def __getattr__(name: str):
+    """按需导入依赖 Spire.Doc 的子模块，并缓存导出的名称"""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 
 # ==================== 导出列表 ====================
 __all__ = [
@@ -110,11 +172,14 @@ __all__ = [
     # 文档操作
     "load_docx",
     "save_docx",
+    "to_docx_bytes",
     "merge_docs",
     "to_pdf",
     "to_images",
+    "iter_images",
     "to_pdf_file",
     "copy_doc",
+    "TemplatePool",
     "get_document_properties",
     # 表格操作
     "get_cell",
@@ -128,24 +193,56 @@ __all__ = [
     "get_table_dimensions",
     "get_section_table_count",
     "get_section_count",
+    "DocumentIndex",
+    "get_document_index",
+    "invalidate_index",
+    "DocxReader",
     # 字段填充
     "fill_text",
+    "fill_form",
     "fill_image",
     "fill_date",
     "fill_grid",
     "replace_all",
     "clear_cell",
     "fill_template",
+    "fill_template_bytes",
     "extract_template_vars",
     "validate_template_data",
+    # 文档后端
+    "open_docx",
+    "BackendDocument",
+    "DocumentBackend",
+    "SpireBackend",
+    "XmlBackend",
+    "get_backend",
+    "register_backend",
+    "set_default_backend",
+    # 图片缓存
+    "ImageCache",
+    "CachedImage",
+    "get_image_cache",
+    "clear_image_cache",
+    "get_image_size",
+    # 模板编译
+    "compile_template",
+    "CompiledTemplate",
+    "render_batch",
     # 样式管理
     "parse_color",
+    "StyleSpec",
+    "register_style",
+    "set_minimal_formatting",
+    "get_format_stats",
+    "reset_format_stats",
     "apply_font_style",
     "apply_paragraph_alignment",
     "apply_cell_alignment",
     "set_cell_border",
     "get_cell_style",
     "get_paragraph_style",
+    "get_table_styles",
+    "get_document_styles",
     # 异常类
     "DocxLibError",
     "DocumentError",
@@ -166,6 +263,9 @@ __all__ = [
     "FillMode",
     "MatchMode",
     "Position",
+    "SPIRE_AVAILABLE",
+    "BackendType",
+    "DEFAULT_BACKEND",
     # 工具函数
     "is_valid_docx",
     "validate_docx",
@@ -0,0 +1,808 @@
+"""
+DocxLib 文档后端模块
+
+定义文档后端协议（加载、遍历单元格、读取文本、写入文本、插入图片、保存），
+提供 Spire.Doc 后端和轻量的 ZIP/XML 后端。后端可以按调用选择
+（open_docx(source, backend="xml")），也可以设置 open_docx 的默认后端
+（set_default_backend）。load_docx、fill_* 等函数始终直接使用 Spire.Doc，
+不受后端设置影响。
+"""
+
+import hashlib
+import io
+import re
+import zipfile
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Tuple, Union
+from xml.sax.saxutils import escape, quoteattr
+
+from .constants import (
+    DEFAULT_BACKEND,
+    DEFAULT_COLOR,
+    DEFAULT_FONT,
+    DEFAULT_FONT_SIZE,
+    BackendType,
+    Position,
+)
+from .errors import FillError, PositionError, ValidationError
+from .image import _IMAGE_SIGNATURES, CachedImage, _display_size, get_image_cache
+from .reader import DocxReader
+from .utils import _color_to_hex, _read_docx_source, ensure_directory
+from .xmlfill import (
+    _DOCUMENT_PART,
+    _DOCUMENT_RELS,
+    _MAIN_NS,
+    _MAIN_PREFIX_RE,
+    _TAG_RE,
+    _apply_edits,
+)
+
+
+class DocumentBackend(ABC):
+    """文档后端协议
+
+    后端负责文档的加载、单元格读写、图片插入和保存。load 返回的文档
+    对象由后端自行定义，只会传回同一个后端的其他方法。位置索引从 1 开始；
+    set_cell_text / insert_image 的位置可以包含通配符 0（与 get_cells 相同）。
+
+    自定义后端继承本类并实现全部抽象方法（缺少任何一个时无法实例化），
+    再通过 register_backend 注册。
+    """
+
+    name: str = ""
+
+    @abstractmethod
+    def load(self, source: Union[str, bytes, Path]) -> Any:
+        """加载文档，返回后端的文档对象"""
+
+    @abstractmethod
+    def iterate_cells(self, doc: Any) -> Iterator[Tuple[int, int, int, int, str]]:
+        """遍历所有单元格，生成 (section, table, row, col, text)"""
+
+    @abstractmethod
+    def get_cell_text(self, doc: Any, position: Position) -> str:
+        """获取单元格文本（各段落去除首尾空白后拼接）"""
+
+    @abstractmethod
+    def set_cell_text(
+        self,
+        doc: Any,
+        position: Position,
+        text: str,
+        *,
+        font_name: str = DEFAULT_FONT,
+        font_size: float = DEFAULT_FONT_SIZE,
+        color: str = DEFAULT_COLOR,
+        bold: bool = False,
+        italic: bool = False,
+        underline: bool = False,
+    ) -> None:
+        """清空单元格段落并写入一段带样式的文本"""
+
+    @abstractmethod
+    def insert_image(
+        self,
+        doc: Any,
+        position: Position,
+        image: Union[str, bytes, Path],
+        *,
+        width: float = None,
+        height: float = None,
+        maintain_ratio: bool = True,
+    ) -> None:
+        """清空单元格段落并插入一张内联图片（尺寸单位：磅）"""
+
+    @abstractmethod
+    def save(self, doc: Any) -> bytes:
+        """保存文档，返回 DOCX 字节数据"""
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} name={self.name!r}>"
+
+
+# ==================== Spire.Doc 后端 ====================
+
+
+class SpireBackend(DocumentBackend):
+    """Spire.Doc 后端：委托给 docxlib 的现有函数，文档对象为 Spire.Doc Document
+
+    首次使用时才导入 Spire.Doc。
+    """
+
+    name = BackendType.SPIRE
+
+    def load(self, source):
+        from .document import load_docx
+
+        return load_docx(source)
+
+    def iterate_cells(self, doc):
+        from .table import _get_cell_text, iterate_cells
+
+        for sec, tbl, row, col, cell in iterate_cells(doc):
+            yield sec, tbl, row, col, _get_cell_text(cell)
+
+    def get_cell_text(self, doc, position):
+        from .table import get_cell_text
+
+        return get_cell_text(doc, *position)
+
+    def set_cell_text(
+        self,
+        doc,
+        position,
+        text,
+        *,
+        font_name=DEFAULT_FONT,
+        font_size=DEFAULT_FONT_SIZE,
+        color=DEFAULT_COLOR,
+        bold=False,
+        italic=False,
+        underline=False,
+    ):
+        from .fill import fill_text
+
+        fill_text(
+            doc,
+            position,
+            text,
+            font_name=font_name,
+            font_size=font_size,
+            color=color,
+            bold=bold,
+            italic=italic,
+            underline=underline,
+        )
+
+    def insert_image(self, doc, position, image, *, width=None, height=None, maintain_ratio=True):
+        from .fill import fill_image
+
+        fill_image(
+            doc,
+            position,
+            image,
+            width=width,
+            height=height,
+            maintain_ratio=maintain_ratio,
+        )
+
+    def save(self, doc):
+        from .document import to_docx_bytes
+
+        return to_docx_bytes(doc)
+
+
+# ==================== ZIP/XML 后端 ====================
+
+_RELS_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_IMAGE_REL_TYPE = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/image"
+)
+_EMPTY_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    f'<Relationships xmlns="{_RELS_NS}"></Relationships>'
+)
+
+# 1 磅 = 12700 EMU
+_EMU_PER_POINT = 12700
+
+_IMAGE_PARAGRAPH = (
+    '<w:p xmlns:w="{w}"><w:r><w:drawing>'
+    '<wp:inline xmlns:wp="http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing"'
+    ' distT="0" distB="0" distL="0" distR="0">'
+    '<wp:extent cx="{cx}" cy="{cy}"/>'
+    '<wp:docPr id="{shape_id}" name="Picture {shape_id}"/>'
+    '<a:graphic xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">'
+    '<a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/picture">'
+    '<pic:pic xmlns:pic="http://schemas.openxmlformats.org/drawingml/2006/picture">'
+    '<pic:nvPicPr><pic:cNvPr id="0" name={name}/><pic:cNvPicPr/></pic:nvPicPr>'
+    '<pic:blipFill><a:blip xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"'
+    ' r:embed="{rel_id}"/><a:stretch><a:fillRect/></a:stretch></pic:blipFill>'
+    '<pic:spPr><a:xfrm><a:off x="0" y="0"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom></pic:spPr>'
+    "</pic:pic></a:graphicData></a:graphic></wp:inline></w:drawing></w:r></w:p>"
+)
+
+_DOC_PR_ID_RE = re.compile(r"docPr\b[^>]*?\bid=\"(\d+)\"")
+_REL_ID_RE = re.compile(r"\bId=\"([^\"]+)\"")
+
+
+def _scan_cells(xml: str) -> Dict[Position, Tuple[List[Tuple[int, int]], int]]:
+    """扫描正文 XML，记录每个顶层表格单元格的直接子段落位置
+
+    节和表格的划分与 DocxReader（以及 Spire.Doc）一致。
+
+    Args:
+        xml: word/document.xml 文本
+
+    Returns:
+        Dict: {(节, 表格, 行, 列): ([(段落起始偏移, 段落结束偏移), ...], </w:tc> 偏移)}
+
+    Raises:
+        ValidationError: 未找到 WordprocessingML 命名空间
+    """
+    prefix_match = _MAIN_PREFIX_RE.search(xml)
+    if prefix_match is None:
+        raise ValidationError("文档中未找到 WordprocessingML 命名空间")
+    prefix = prefix_match.group(1)
+    body, p, ppr, sect_pr, tbl, tr, tc = (
+        f"{prefix}:{name}" if prefix else name
+        for name in ("body", "p", "pPr", "sectPr", "tbl", "tr", "tc")
+    )
+    body_path = [body]
+    table_path = [body, tbl]
+    row_path = [body, tbl, tr]
+    cell_path = [body, tbl, tr, tc]
+    break_path = [body, p, ppr]
+
+    cells = {}
+    path = []
+    section = 1
+    table = row = col = 0
+    section_break = False
+    paragraph_start = 0
+    current = None
+
+    for match in _TAG_RE.finditer(xml):
+        closing, name, self_closing = match.groups()
+        if name[0] in "?!":
+            continue
+
+        if closing:
+            path.pop()
+            if name == p and path[-1:] == body_path:
+                # 段落属性中的 sectPr 表示该段落是本节的最后一段
+                if section_break:
+                    section += 1
+                    table = 0
+                    section_break = False
+            elif name == p and path[-4:] == cell_path:
+                cells[current][0].append((paragraph_start, match.end()))
+            elif name == tc and path[-3:] == row_path:
+                cells[current] = (cells[current][0], match.start())
+            continue
+
+        if name == sect_pr and path[-3:] == break_path:
+            section_break = True
+        elif name == p and path[-4:] == cell_path:
+            if self_closing:
+                cells[current][0].append((match.start(), match.end()))
+            paragraph_start = match.start()
+        elif self_closing:
+            pass
+        elif name == tbl and path[-1:] == body_path:
+            table += 1
+            row = 0
+        elif name == tr and path[-2:] == table_path:
+            row += 1
+            col = 0
+        elif name == tc and path[-3:] == row_path:
+            col += 1
+            current = (section, table, row, col)
+            cells[current] = ([], None)
+
+        if not self_closing:
+            path.append(name)
+
+    return cells
+
+
+def _text_paragraph_xml(
+    text: str,
+    font_name: str,
+    font_size: float,
+    color: str,
+    bold: bool,
+    italic: bool,
+    underline: bool,
+) -> str:
+    """生成带样式文本的段落 XML（每行一个段落，制表符转换为 w:tab）"""
+    rpr = []
+    if font_name:
+        font = quoteattr(font_name)
+        rpr.append(
+            f"<w:rFonts w:ascii={font} w:hAnsi={font} w:eastAsia={font} w:cs={font}/>"
+        )
+    if bold:
+        rpr.append("<w:b/>")
+    if italic:
+        rpr.append("<w:i/>")
+    rpr.append(f'<w:color w:val="{_color_to_hex(color or "") or "000000"}"/>')
+    if font_size:
+        half_points = int(round(font_size * 2))
+        rpr.append(f'<w:sz w:val="{half_points}"/><w:szCs w:val="{half_points}"/>')
+    if underline:
+        rpr.append('<w:u w:val="single"/>')
+
+    # 与 Spire.Doc 的 AppendText 相同，每个换行开始一个新段落
+    paragraphs = []
+    for line in text.replace("\r\n", "\n").split("\n"):
+        content = []
+        for part_idx, part in enumerate(line.split("\t")):
+            if part_idx:
+                content.append("<w:tab/>")
+            if part:
+                content.append(f'<w:t xml:space="preserve">{escape(part)}</w:t>')
+        paragraphs.append(
+            f'<w:p xmlns:w="{_MAIN_NS}"><w:r><w:rPr>{"".join(rpr)}</w:rPr>'
+            f'{"".join(content)}</w:r></w:p>'
+        )
+    return "".join(paragraphs)
+
+
+def _image_extent(
+    image: CachedImage, width: float, height: float, maintain_ratio: bool
+) -> Tuple[int, int]:
+    """计算图片显示尺寸（EMU），规则与 fill_image 相同"""
+    width, height = _display_size(width, height, maintain_ratio, image.width_px, image.height_px)
+    if not width or not height:
+        raise FillError("无法获取图片尺寸，请同时指定 width 和 height")
+    return int(round(width * _EMU_PER_POINT)), int(round(height * _EMU_PER_POINT))
+
+
+class XmlPackage:
+    """XML 后端的文档对象
+
+    保存原始 DOCX 字节数据和尚未写入的修改。读取通过 DocxReader 完成，
+    修改在保存时一次性写入 word/document.xml，其余部件原样复制。
+    """
+
+    def __init__(self, data: bytes):
+        """
+        Args:
+            data: DOCX 字节数据
+
+        Raises:
+            ValidationError: 文件格式无效
+            DocumentError: 解析失败
+        """
+        self.data = data
+        self.reader = DocxReader(data)
+        self._cells = None
+        # {位置: (新段落 XML, 新单元格文本)}
+        self._contents: Dict[Position, Tuple[str, str]] = {}
+        # [(压缩包内路径, 关系 ID, 扩展名, 内容类型, 图片数据), ...]
+        self._images: List[Tuple[str, str, str, str, bytes]] = []
+        # 图片内容的 SHA-256 -> 关系 ID（相同图片只写入一个部件）
+        self._image_ids: Dict[str, str] = {}
+        self._xml = None
+        self._rels = None
+        self._names = None
+        self._next_shape_id = None
+
+    def _load_parts(self) -> None:
+        """首次修改时读取正文 XML 和关系部件"""
+        if self._xml is not None:
+            return
+        with zipfile.ZipFile(io.BytesIO(self.data)) as package:
+            self._names = set(package.namelist())
+            self._xml = package.read(_DOCUMENT_PART).decode("utf-8")
+            if _DOCUMENT_RELS in self._names:
+                self._rels = package.read(_DOCUMENT_RELS).decode("utf-8")
+            else:
+                self._rels = _EMPTY_RELS
+        self._cells = _scan_cells(self._xml)
+        shape_ids = [int(value) for value in _DOC_PR_ID_RE.findall(self._xml)]
+        self._next_shape_id = max(shape_ids, default=0) + 1
+
+    @property
+    def modified(self) -> bool:
+        """是否有尚未保存的修改"""
+        return bool(self._contents)
+
+    def resolve(self, position: Position) -> List[Position]:
+        """解析位置（支持通配符 0），返回存在的单元格位置列表
+
+        Raises:
+            PositionError: 单元格不存在或通配符未匹配到任何单元格
+        """
+        self._load_parts()
+        if 0 in position:
+            matched = [
+                pos
+                for pos in self._cells
+                if all(want == 0 or want == got for want, got in zip(position, pos))
+            ]
+            if not matched:
+                raise PositionError(f"通配符位置 {position} 未匹配到任何单元格")
+            return matched
+
+        position = tuple(position)
+        if position not in self._cells:
+            raise PositionError(f"无法获取位置 {position} 的单元格")
+        return [position]
+
+    def set_content(self, position: Position, paragraph_xml: str, text: str) -> None:
+        """记录单元格的新内容（替换单元格的全部直接子段落）"""
+        self._contents[position] = (paragraph_xml, text)
+
+    def get_text(self, position: Position) -> Union[str, None]:
+        """获取已修改单元格的文本，未修改时返回 None"""
+        content = self._contents.get(tuple(position))
+        return content[1] if content is not None else None
+
+    def add_image(self, data: bytes, digest: str = None) -> str:
+        """添加图片部件，返回关系 ID
+
+        内容相同的图片只添加一次，之后返回已有的关系 ID。
+
+        Args:
+            data: 图片数据
+            digest: 图片内容的 SHA-256 十六进制（已知时传入，避免重复计算）
+
+        Raises:
+            FillError: 图片格式不支持
+        """
+        if digest is None:
+            digest = hashlib.sha256(data).hexdigest()
+        rel_id = self._image_ids.get(digest)
+        if rel_id is not None:
+            return rel_id
+
+        for signature, extension, content_type in _IMAGE_SIGNATURES:
+            if data.startswith(signature):
+                break
+        else:
+            raise FillError("不支持的图片格式（支持 PNG、JPEG、GIF、BMP）")
+
+        self._load_parts()
+        used_names = self._names | {image[0] for image in self._images}
+        index = 1
+        while f"word/media/image{index}.{extension}" in used_names:
+            index += 1
+        part_name = f"word/media/image{index}.{extension}"
+
+        used_ids = set(_REL_ID_RE.findall(self._rels)) | {image[1] for image in self._images}
+        rel_index = len(used_ids) + 1
+        while f"rId{rel_index}" in used_ids:
+            rel_index += 1
+        rel_id = f"rId{rel_index}"
+
+        self._images.append((part_name, rel_id, extension, content_type, data))
+        self._image_ids[digest] = rel_id
+        return rel_id
+
+    def next_shape_id(self) -> int:
+        """分配文档内唯一的图形 ID"""
+        self._load_parts()
+        shape_id = self._next_shape_id
+        self._next_shape_id += 1
+        return shape_id
+
+    def to_bytes(self) -> bytes:
+        """写入全部修改，返回 DOCX 字节数据"""
+        if not self._contents:
+            return self.data
+
+        edits = []
+        for position, (paragraph_xml, _) in self._contents.items():
+            paragraphs, end = self._cells[position]
+            edits.extend((start, stop, "") for start, stop in paragraphs)
+            edits.append((end, end, paragraph_xml))
+        new_parts = {_DOCUMENT_PART: _apply_edits(self._xml, edits)}
+
+        # 只写入仍被单元格引用的图片
+        content_xml = "".join(xml for xml, _ in self._contents.values())
+        images = [image for image in self._images if f'"{image[1]}"' in content_xml]
+
+        if images:
+            relationships = "".join(
+                f'<Relationship Id="{rel_id}" Type="{_IMAGE_REL_TYPE}" '
+                f'Target="{part_name[len("word/"):]}"/>'
+                for part_name, rel_id, _, _, _ in images
+            )
+            new_parts[_DOCUMENT_RELS] = self._rels.replace(
+                "</Relationships>", relationships + "</Relationships>"
+            )
+
+        output = io.BytesIO()
+        with zipfile.ZipFile(io.BytesIO(self.data)) as package:
+            if images:
+                new_parts["[Content_Types].xml"] = _add_content_types(
+                    package.read("[Content_Types].xml").decode("utf-8"), images
+                )
+            with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as target:
+                for info in package.infolist():
+                    content = new_parts.pop(info.filename, None)
+                    if content is None:
+                        target.writestr(info, package.read(info))
+                    else:
+                        target.writestr(info, content.encode("utf-8"))
+                for part_name, content in new_parts.items():
+                    target.writestr(part_name, content.encode("utf-8"))
+                for part_name, _, _, _, data in images:
+                    target.writestr(part_name, data)
+
+        return output.getvalue()
+
+
+def _add_content_types(content_types: str, images: list) -> str:
+    """为新增图片的扩展名补充 Default 内容类型"""
+    declared = {
+        extension.lower()
+        for extension in re.findall(r'<Default\b[^>]*\bExtension="([^"]+)"', content_types)
+    }
+    defaults = []
+    for _, _, extension, content_type, _ in images:
+        if extension not in declared:
+            declared.add(extension)
+            defaults.append(
+                f'<Default Extension="{extension}" ContentType="{content_type}"/>'
+            )
+    return content_types.replace("</Types>", "".join(defaults) + "</Types>")
+
+
+class XmlBackend(DocumentBackend):
+    """ZIP/XML 后端：直接读写 DOCX 中的 XML，不加载 Spire.Doc
+
+    适合读取和纯文本/图片填充；格式转换、排版等功能请使用 Spire.Doc 后端。
+    文档对象为 XmlPackage。
+    """
+
+    name = BackendType.XML
+
+    def load(self, source):
+        return XmlPackage(_read_docx_source(source))
+
+    def iterate_cells(self, doc):
+        for sec, tbl, row, col, text in doc.reader.iterate_cells():
+            override = doc.get_text((sec, tbl, row, col))
+            yield sec, tbl, row, col, text if override is None else override
+
+    def get_cell_text(self, doc, position):
+        override = doc.get_text(position)
+        if override is not None:
+            return override
+        return doc.reader.get_cell_text(*position)
+
+    def set_cell_text(
+        self,
+        doc,
+        position,
+        text,
+        *,
+        font_name=DEFAULT_FONT,
+        font_size=DEFAULT_FONT_SIZE,
+        color=DEFAULT_COLOR,
+        bold=False,
+        italic=False,
+        underline=False,
+    ):
+        text = str(text)
+        paragraph_xml = _text_paragraph_xml(
+            text, font_name, font_size, color, bold, italic, underline
+        )
+        # 与重新读取文档时的单元格文本一致（各段落去除首尾空白后拼接）
+        cell_text = "".join(
+            line.strip() for line in text.replace("\r\n", "\n").split("\n")
+        )
+        for target in doc.resolve(position):
+            doc.set_content(target, paragraph_xml, cell_text)
+
+    def insert_image(self, doc, position, image, *, width=None, height=None, maintain_ratio=True):
+        cache = get_image_cache()
+        with cache.pinned():
+            cached = cache.get(image)
+            data = cached.read_bytes()
+        targets = doc.resolve(position)
+        cx, cy = _image_extent(cached, width, height, maintain_ratio)
+        rel_id = doc.add_image(data, cached.digest)
+        for target in targets:
+            shape_id = doc.next_shape_id()
+            paragraph_xml = _IMAGE_PARAGRAPH.format(
+                w=_MAIN_NS,
+                cx=cx,
+                cy=cy,
+                shape_id=shape_id,
+                name=quoteattr(f"image{shape_id}"),
+                rel_id=rel_id,
+            )
+            doc.set_content(target, paragraph_xml, "")
+
+    def save(self, doc):
+        return doc.to_bytes()
+
+
+# ==================== 后端注册 ====================
+
+_backends: Dict[str, DocumentBackend] = {
+    BackendType.SPIRE: SpireBackend(),
+    BackendType.XML: XmlBackend(),
+}
+_default_backend: str = DEFAULT_BACKEND
+
+
+def register_backend(name: str, backend: DocumentBackend) -> None:
+    """注册文档后端（同名后端会被替换）
+
+    Args:
+        name: 后端名称
+        backend: DocumentBackend 实例
+
+    Raises:
+        ValidationError: backend 不是 DocumentBackend 实例
+    """
+    if not isinstance(backend, DocumentBackend):
+        raise ValidationError(f"文档后端必须是 DocumentBackend 实例: {type(backend)}")
+    _backends[name] = backend
+
+
+def get_backend(backend: Union[str, DocumentBackend] = None) -> DocumentBackend:
+    """获取文档后端
+
+    Args:
+        backend: 后端名称或 DocumentBackend 实例，None 表示当前默认后端
+
+    Returns:
+        DocumentBackend: 后端实例
+
+    Raises:
+        ValidationError: 后端名称未注册
+    """
+    if isinstance(backend, DocumentBackend):
+        return backend
+    name = _default_backend if backend is None else backend
+    try:
+        return _backends[name]
+    except KeyError:
+        raise ValidationError(
+            f"未知的文档后端: {name}（可用: {', '.join(sorted(_backends))}）"
+        )
+
+
+def set_default_backend(backend: str) -> None:
+    """设置 open_docx 的默认文档后端
+
+    只影响 open_docx / get_backend() 的默认选择；load_docx、fill_*、
+    find_text 等函数始终直接使用 Spire.Doc。
+
+    Args:
+        backend: 已注册的后端名称（"spire" | "xml"）
+
+    Raises:
+        ValidationError: 后端名称未注册
+
+    Examples:
+        >>> set_default_backend("xml")
+        >>> doc = open_docx("template.docx")  # 使用 XML 后端
+    """
+    global _default_backend
+    get_backend(backend)
+    _default_backend = backend
+
+
+# ==================== 文档对象 ====================
+
+
+class BackendDocument:
+    """通过文档后端打开的文档
+
+    由 open_docx 创建，将读写操作转发给所选后端。
+
+    Attributes:
+        backend: 文档后端
+        doc: 后端的文档对象（Spire.Doc 后端为 Document，XML 后端为 XmlPackage）
+
+    Examples:
+        >>> doc = open_docx("form.docx", backend="xml")
+        >>> pos = doc.find_text("姓名：")[0]
+        >>> doc.set_cell_text((pos[0], pos[1], pos[2], pos[3] + 1), "张三")
+        >>> doc.save("output.docx")
+    """
+
+    def __init__(self, backend: DocumentBackend, doc: Any):
+        self.backend = backend
+        self.doc = doc
+
+    def iterate_cells(self) -> Iterator[Tuple[int, int, int, int, str]]:
+        """遍历所有单元格，生成 (section, table, row, col, text)"""
+        return self.backend.iterate_cells(self.doc)
+
+    def get_cell_text(self, section: int, table: int, row: int, col: int) -> str:
+        """获取单元格文本
+
+        Raises:
+            PositionError: 位置越界
+        """
+        return self.backend.get_cell_text(self.doc, (section, table, row, col))
+
+    def find_text(self, text: str) -> List[Position]:
+        """查找文本与之完全相同的所有单元格位置"""
+        return [
+            (sec, tbl, row, col)
+            for sec, tbl, row, col, cell_text in self.iterate_cells()
+            if cell_text == text
+        ]
+
+    def set_cell_text(self, position: Position, text: str, **style) -> None:
+        """清空单元格并写入文本
+
+        Args:
+            position: 位置元组（支持通配符 0）
+            text: 文本
+            **style: font_name / font_size / color / bold / italic / underline
+
+        Raises:
+            PositionError: 位置无效
+        """
+        self.backend.set_cell_text(self.doc, position, text, **style)
+
+    def insert_image(
+        self,
+        position: Position,
+        image: Union[str, bytes, Path],
+        *,
+        width: float = None,
+        height: float = None,
+        maintain_ratio: bool = True,
+    ) -> None:
+        """清空单元格并插入图片
+
+        Args:
+            position: 位置元组（支持通配符 0）
+            image: 图片文件路径或字节数据
+            width: 宽度（磅）
+            height: 高度（磅）
+            maintain_ratio: 是否保持宽高比
+
+        Raises:
+            PositionError: 位置无效
+            FillError: 图片不存在、格式不支持或无法确定尺寸
+        """
+        self.backend.insert_image(
+            self.doc,
+            position,
+            image,
+            width=width,
+            height=height,
+            maintain_ratio=maintain_ratio,
+        )
+
+    def to_bytes(self) -> bytes:
+        """保存为 DOCX 字节数据"""
+        return self.backend.save(self.doc)
+
+    def save(self, target: Union[str, Path, BinaryIO]) -> None:
+        """保存到文件路径或可写的文件对象
+
+        Raises:
+            DocumentError: 保存失败
+        """
+        data = self.to_bytes()
+        if hasattr(target, "write"):
+            target.write(data)
+            return
+        ensure_directory(target)
+        Path(target).write_bytes(data)
+
+    def __repr__(self) -> str:
+        return f"<BackendDocument backend={self.backend.name!r}>"
+
+
+def open_docx(
+    source: Union[str, bytes, Path],
+    backend: Union[str, DocumentBackend] = None,
+) -> BackendDocument:
+    """使用指定的文档后端打开文档
+
+    Args:
+        source: 文件路径（str/Path）或字节数据（bytes）
+        backend: 后端名称（"spire" | "xml"）或 DocumentBackend 实例，
+            默认使用 set_default_backend 设置的全局后端
+
+    Returns:
+        BackendDocument: 文档对象
+
+    Raises:
+        DocumentError: 文件不存在或加载失败
+        ValidationError: 文件格式无效或后端名称未注册
+
+    Examples:
+        >>> doc = open_docx("form.docx", backend="xml")
+        >>> doc.set_cell_text((1, 1, 2, 2), "张三")
+        >>> doc.insert_image((1, 1, 3, 2), "logo.png", width=60, height=30)
+        >>> doc.save("output.docx")
+    """
+    selected = get_backend(backend)
+    return BackendDocument(selected, selected.load(source))
@@ -0,0 +1,259 @@
+"""
+DocxLib 批量渲染模块
+
+使用多进程并行渲染模板，适合一次生成成千上万份文档。
+"""
+
+import multiprocessing
+import os
+import queue
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, Tuple, Union
+
+from .constants import (
+    DEFAULT_MISSING_VAR_ACTION,
+    DEFAULT_VAR_PREFIX,
+    DEFAULT_VAR_SUFFIX,
+)
+from .document import save_docx
+from .errors import ValidationError
+from .template import compile_template
+from .utils import _read_docx_source
+
+# 默认输出文件名格式，可使用 {index} 以及记录中的字段
+DEFAULT_BATCH_FILENAME: str = "{index}.docx"
+
+# 工作进程内常驻的已编译模板（由 _init_worker 创建）
+_worker_template = None
+
+
+def _init_worker(
+    template_bytes: bytes, placeholder_prefix: str, placeholder_suffix: str
+) -> None:
+    """工作进程初始化：加载 Spire.Doc 运行时并编译模板（每个进程仅一次）
+
+    Args:
+        template_bytes: 模板 DOCX 字节数据
+        placeholder_prefix: 变量前缀
+        placeholder_suffix: 变量后缀
+    """
+    global _worker_template
+    _worker_template = compile_template(
+        template_bytes,
+        placeholder_prefix=placeholder_prefix,
+        placeholder_suffix=placeholder_suffix,
+    )
+
+
+def _render_one(template, task: Tuple[int, Dict[str, Any], str, str, str]) -> Dict[str, Any]:
+    """渲染并保存一条记录
+
+    Args:
+        template: CompiledTemplate 对象
+        task: (记录序号, 数据字典, 输出路径, 缺失变量处理方式, 错误信息)，
+            无法确定输出路径时输出路径为 None，错误信息说明原因
+
+    Returns:
+        Dict: 单条记录的处理结果，格式见 render_batch
+    """
+    index, record, output_path, missing_var_action, error = task
+    if output_path is None:
+        return {"index": index, "path": None, "ok": False, "error": error}
+    try:
+        doc = template.render(record, missing_var_action=missing_var_action)
+        save_docx(doc, output_path)
+        return {"index": index, "path": output_path, "ok": True, "error": None}
+    except Exception as e:
+        return {"index": index, "path": output_path, "ok": False, "error": str(e)}
+
+
+def _render_chunk(tasks: list) -> list:
+    """工作进程入口：使用进程内常驻的模板依次处理一组记录"""
+    return [_render_one(_worker_template, task) for task in tasks]
+
+
+def _output_path(
+    output_dir: Path,
+    filename: Union[str, Callable[[int, Dict[str, Any]], str]],
+    index: int,
+    record: Dict[str, Any],
+) -> str:
+    """计算一条记录的输出文件路径
+
+    Args:
+        output_dir: 输出目录
+        filename: 文件名格式字符串或 (序号, 记录) -> 文件名 的函数
+        index: 记录序号（从0开始）
+        record: 数据字典
+
+    Returns:
+        str: 输出文件路径
+
+    Raises:
+        ValidationError: 文件名格式中引用了记录中不存在的字段
+    """
+    if callable(filename):
+        name = filename(index, record)
+    else:
+        try:
+            name = filename.format(index=index, **record)
+        except KeyError as e:
+            raise ValidationError(f"第 {index} 条记录缺少文件名字段: {e}")
+    return str(output_dir / name)
+
+
+def _make_task(
+    output_dir: Path,
+    filename: Union[str, Callable[[int, Dict[str, Any]], str]],
+    index: int,
+    record: Dict[str, Any],
+    missing_var_action: str,
+) -> Tuple[int, Dict[str, Any], str, str, str]:
+    """生成一条记录的任务，输出路径无法确定时记录错误而不是抛出异常
+
+    Args:
+        output_dir: 输出目录
+        filename: 文件名格式字符串或 (序号, 记录) -> 文件名 的函数
+        index: 记录序号（从0开始）
+        record: 数据字典
+        missing_var_action: 缺失变量处理方式
+
+    Returns:
+        tuple: (记录序号, 数据字典, 输出路径, 缺失变量处理方式, 错误信息)
+    """
+    try:
+        output_path = _output_path(output_dir, filename, index, record)
+    except Exception as e:
+        # 包括文件名字段缺失（ValidationError）和文件名函数抛出的任何异常
+        return (index, record, None, missing_var_action, str(e))
+    return (index, record, output_path, missing_var_action, None)
+
+
+def render_batch(
+    template: Union[str, bytes, Path],
+    records: Iterable[Dict[str, Any]],
+    output_dir: Union[str, Path],
+    workers: int = None,
+    *,
+    filename: Union[str, Callable[[int, Dict[str, Any]], str]] = DEFAULT_BATCH_FILENAME,
+    missing_var_action: str = DEFAULT_MISSING_VAR_ACTION,
+    placeholder_prefix: str = DEFAULT_VAR_PREFIX,
+    placeholder_suffix: str = DEFAULT_VAR_SUFFIX,
+    chunksize: int = 8,
+) -> Iterator[Dict[str, Any]]:
+    """多进程批量渲染模板
+
+    模板和参数在调用时立即校验；返回的迭代器被消费时才开始渲染。
+    每个工作进程只加载一次 Spire.Doc 运行时并编译一次模板，之后持续
+    处理分配到的记录（渲染模板变量并保存文档）。结果按完成顺序逐条返回，
+    便于调用方跟踪进度；单条记录失败不会中断整个批次。
+
+    Args:
+        template: 模板文件路径（str/Path）或字节数据（bytes）
+        records: 数据字典的可迭代对象（可以是生成器）
+        output_dir: 输出目录（不存在时自动创建）
+        workers: 工作进程数，默认使用 CPU 核心数；为 1 时在当前进程中顺序处理
+        filename: 输出文件名格式，可使用 {index} 和记录中的字段，
+            如 "{index:05d}_{name}.docx"；也可以是 (序号, 记录) -> 文件名 的函数
+        missing_var_action: 缺失变量处理方式 ("error" | "ignore" | "empty")
+        placeholder_prefix: 变量前缀
+        placeholder_suffix: 变量后缀
+        chunksize: 每次分配给工作进程的记录数；同时在途的记录最多为
+            workers * chunksize * 2 条，records 按需读取
+
+    Returns:
+        Iterator[Dict]: 按完成顺序返回的单条记录处理结果
+        {
+            "index": 0,              # 记录序号（从0开始）
+            "path": "output/0.docx", # 输出文件路径（无法确定文件名时为 None）
+            "ok": True,              # 是否成功
+            "error": None,           # 失败时的错误信息
+        }
+
+    Raises:
+        DocumentError: 模板文件不存在或读取失败
+        ValidationError: 模板格式无效或参数错误
+
+    Examples:
+        >>> results = render_batch("certificate.docx", records, "output/", workers=8)
+        >>> for result in results:
+        ...     if not result["ok"]:
+        ...         print(f"第 {result['index']} 条失败: {result['error']}")
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValidationError(f"workers 必须大于 0: {workers}")
+    if chunksize < 1:
+        raise ValidationError(f"chunksize 必须大于 0: {chunksize}")
+
+    template_bytes = _read_docx_source(template)
+    # 先在当前进程编译一次，模板无效时立即报错，而不是让工作进程反复初始化失败
+    compiled = compile_template(
+        template_bytes,
+        placeholder_prefix=placeholder_prefix,
+        placeholder_suffix=placeholder_suffix,
+    )
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    tasks = (
+        _make_task(output_dir, filename, index, record, missing_var_action)
+        for index, record in enumerate(records)
+    )
+
+    if workers == 1:
+        return (_render_one(compiled, task) for task in tasks)
+
+    initargs = (template_bytes, placeholder_prefix, placeholder_suffix)
+    return _iter_pool_results(tasks, workers, initargs, chunksize)
+
+
+def _iter_pool_results(
+    tasks: Iterable[Tuple[int, Dict[str, Any], str, str, str]],
+    workers: int,
+    initargs: tuple,
+    chunksize: int,
+) -> Iterator[Dict[str, Any]]:
+    """在进程池中处理任务，按完成顺序逐条返回结果
+
+    每次只提交 workers * 2 组任务，一组完成后再从 tasks 读取下一组，
+    避免一次性读完 records 生成器并把全部任务堆积在进程池队列中。
+
+    Args:
+        tasks: 任务的可迭代对象
+        workers: 工作进程数
+        initargs: 传给 _init_worker 的参数
+        chunksize: 每次分配给工作进程的任务数
+
+    Yields:
+        Dict: 单条记录的处理结果
+    """
+    # 使用 spawn 启动工作进程，避免 fork 继承已初始化的原生运行时
+    context = multiprocessing.get_context("spawn")
+    tasks = iter(tasks)
+    done = queue.SimpleQueue()
+    with context.Pool(workers, initializer=_init_worker, initargs=initargs) as pool:
+
+        def submit() -> bool:
+            chunk = list(islice(tasks, chunksize))
+            if not chunk:
+                return False
+            pool.apply_async(
+                _render_chunk, (chunk,), callback=done.put, error_callback=done.put
+            )
+            return True
+
+        pending = 0
+        while pending < workers * 2 and submit():
+            pending += 1
+        while pending:
+            results = done.get()
+            pending -= 1
+            if isinstance(results, BaseException):
+                raise results
+            if submit():
+                pending += 1
+            yield from results
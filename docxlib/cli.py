@@ -73,7 +73,7 @@ def cmd_validate(args: argparse.Namespace) -> int:
 def cmd_inspect(args: argparse.Namespace) -> int:
     """检查文档信息"""
     from pathlib import Path
-    from docxlib import load_docx, get_section_count, get_table_dimensions
+    from docxlib import DocxReader
 
     file_path = Path(args.file)
     if not file_path.exists():
@@ -81,14 +81,15 @@ def cmd_inspect(args: argparse.Namespace) -> int:
         return 1
 
     try:
-        doc = load_docx(file_path)
+        # 只读取文档结构，直接解析 XML，无需加载 Spire.Doc
+        reader = DocxReader(file_path)
 
         print("=" * 50)
         print(f"Document: {file_path.name}")
         print("=" * 50)
 
         # 节数量
-        section_count = get_section_count(doc)
+        section_count = reader.get_section_count()
         print(f"Sections: {section_count}")
 
         # 遍历所有节和表格
@@ -97,14 +98,12 @@ def cmd_inspect(args: argparse.Namespace) -> int:
             print("-" * 30)
 
             try:
-                from docxlib import get_section_table_count
-
-                table_count = get_section_table_count(doc, sec_idx)
+                table_count = reader.get_section_table_count(sec_idx)
                 print(f"  Tables: {table_count}")
 
                 for tbl_idx in range(1, table_count + 1):
                     try:
-                        rows, cols = get_table_dimensions(doc, sec_idx, tbl_idx)
+                        rows, cols = reader.get_table_dimensions(sec_idx, tbl_idx)
                         print(f"    Table {tbl_idx}: {rows} rows x {cols} cols")
                     except Exception as e:
                         print(f"    Table {tbl_idx}: Error - {e}")
@@ -122,7 +121,7 @@ def cmd_inspect(args: argparse.Namespace) -> int:
 def cmd_extract_vars(args: argparse.Namespace) -> int:
     """提取模板变量"""
     from pathlib import Path
-    from docxlib import load_docx, extract_template_vars
+    from docxlib import DocxReader
     import json
 
     file_path = Path(args.file)
@@ -131,10 +130,11 @@ def cmd_extract_vars(args: argparse.Namespace) -> int:
         return 1
 
     try:
-        doc = load_docx(file_path)
+        # 只读取文本，直接解析 XML，无需加载 Spire.Doc
+        reader = DocxReader(file_path)
 
         # 提取变量
-        vars_list = extract_template_vars(doc, unique=True)
+        vars_list = reader.extract_template_vars(unique=True)
 
         print("=" * 50)
         print(f"Template: {file_path.name}")
@@ -161,7 +161,7 @@ def cmd_extract_vars(args: argparse.Namespace) -> int:
 def cmd_fill(args: argparse.Namespace) -> int:
     """填充模板文档"""
     from pathlib import Path
-    from docxlib import load_docx, fill_template, save_docx, parse_json
+    from docxlib import ensure_directory, fill_template_bytes, parse_json
 
     template_path = Path(args.template)
     data_path = Path(args.data)
@@ -176,9 +176,6 @@ def cmd_fill(args: argparse.Namespace) -> int:
         return 1
 
     try:
-        # 加载模板和数据
-        doc = load_docx(template_path)
-
         # 解析数据
         if data_path.suffix.lower() == ".json":
             data = parse_json(data_path)
@@ -186,8 +183,8 @@ def cmd_fill(args: argparse.Namespace) -> int:
             print(f"Error: Unsupported data format: {data_path.suffix}")
             return 1
 
-        # 填充模板
-        result = fill_template(doc, data)
+        # 填充模板（纯文本替换时直接改写 XML，不加载 Spire.Doc）
+        docx_bytes, result = fill_template_bytes(template_path, data)
 
         print("=" * 50)
         print("Template Fill Result:")
@@ -201,7 +198,8 @@ def cmd_fill(args: argparse.Namespace) -> int:
         if not output_path:
             output_path = template_path.parent / f"{template_path.stem}_filled{template_path.suffix}"
 
-        save_docx(doc, output_path)
+        ensure_directory(output_path)
+        Path(output_path).write_bytes(docx_bytes)
         print(f"Document saved to: {output_path}")
 
         return 0
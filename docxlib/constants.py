@@ -4,6 +4,7 @@ DocxLib 常量定义
 定义了库中使用的所有常量，包括默认值、文件格式、填充模式等。
 """
 
+import importlib.util
 from typing import Dict
 
 
@@ -68,6 +69,19 @@ class MatchMode:
     FIRST = "first"  # 仅填充第一个匹配位置
 
 
+# ==================== 文档后端 ====================
+
+
+class BackendType:
+    """文档后端名称常量"""
+
+    SPIRE = "spire"  # Spire.Doc 引擎：功能完整，支持格式转换和排版
+    XML = "xml"  # 直接读写 DOCX 中的 XML：启动快、开销小，仅支持文本和图片填充
+
+
+DEFAULT_BACKEND: str = BackendType.SPIRE  # 默认文档后端
+
+
 # ==================== 模板变量 ====================
 
 # 模板变量默认值
@@ -104,10 +118,14 @@ Position = tuple[int, int, int, int]
 
 # ==================== Spire.Doc 相关 ====================
 
-# 尝试导入 Spire.Doc，如果失败则设置为 None
-try:
-    from spire.doc import *
 
-    SPIRE_AVAILABLE = True
-except ImportError:
-    SPIRE_AVAILABLE = False
+def _spire_installed() -> bool:
+    """检查 spire.doc 包是否可导入（只查找模块规格，不执行导入）"""
+    try:
+        return importlib.util.find_spec("spire.doc") is not None
+    except (ImportError, ValueError):
+        return False
+
+
+# 只探测 Spire.Doc 是否已安装，不导入它（导入会启动 .NET 运行时，耗时较长）
+SPIRE_AVAILABLE: bool = _spire_installed()
@@ -5,24 +5,28 @@ DocxLib 文档操作模块
 """
 
 import io
+import multiprocessing
 from pathlib import Path
-from typing import Union, List
+from typing import BinaryIO, Iterable, Iterator, List, Union
 
 from spire.doc import *
 from spire.doc.common import *
 from spire.doc import FileFormat as SpireFileFormat
 
 from .errors import DocumentError, ValidationError
-from .utils import is_valid_docx, ensure_directory
+from .utils import _read_docx_source, ensure_directory, is_valid_docx
 
 
-def load_docx(source: Union[str, bytes, Path]) -> Document:
+def load_docx(source: Union[str, bytes, Path], validate: bool = True) -> Document:
     """加载文档
 
-    从文件路径或字节数据加载 Word 文档。
+    从文件路径或字节数据加载 Word 文档。文件只读取一次：格式校验和
+    Spire.Doc 解析使用同一份内存数据。
 
     Args:
         source: 文件路径（str/Path）或字节数据（bytes）
+        validate: 是否在解析前校验 DOCX 的 ZIP 结构；
+            对可信来源可设为 False 以跳过校验
 
     Returns:
         Document: Spire.Doc Document 对象
@@ -38,53 +42,40 @@ def load_docx(source: Union[str, bytes, Path]) -> Document:
         >>> with open("sample.docx", "rb") as f:
         ...     data = f.read()
         >>> doc = load_docx(data)
-    """
-    doc = Document()
-
-    if isinstance(source, (str, Path)):
-        file_path = Path(source)
-
-        # 检查文件是否存在
-        if not file_path.exists():
-            raise DocumentError(f"文件不存在: {source}")
 
-        # 检查文件扩展名
-        if file_path.suffix.lower() not in [".docx", ".dotx"]:
-            raise ValidationError(f"文件格式不是 .docx: {source}")
+        >>> # 可信来源跳过结构校验
+        >>> doc = load_docx("templates/contract.docx", validate=False)
+    """
+    from_path = isinstance(source, (str, Path))
+    data = _read_docx_source(source)
 
-        # 验证 DOCX 格式
-        if not is_valid_docx(file_path):
+    # 验证 DOCX 格式
+    if validate and not is_valid_docx(data):
+        if from_path:
             raise ValidationError(f"文件不是有效的 DOCX 格式: {source}")
+        raise ValidationError("字节数据不是有效的 DOCX 格式")
 
-        try:
-            doc.LoadFromFile(str(file_path))
-        except Exception as e:
+    doc = Document()
+    try:
+        # 由 Spire 按内容识别格式，.dotx 模板不会被当作 .docx 读取
+        doc.LoadFromStream(Stream(data), SpireFileFormat.Auto)
+    except Exception as e:
+        if from_path:
             raise DocumentError(f"加载文档失败: {e}")
-
-    elif isinstance(source, bytes):
-        # 验证字节数据
-        if not is_valid_docx(source):
-            raise ValidationError("字节数据不是有效的 DOCX 格式")
-
-        try:
-            stream = io.BytesIO(source)
-            doc.LoadFromStream(stream)
-        except Exception as e:
-            raise DocumentError(f"从字节数据加载文档失败: {e}")
-    else:
-        raise ValidationError(f"不支持的源类型: {type(source)}")
+        raise DocumentError(f"从字节数据加载文档失败: {e}")
 
     return doc
 
 
-def save_docx(doc: Document, target: Union[str, Path]) -> None:
+def save_docx(doc: Document, target: Union[str, Path, BinaryIO]) -> None:
     """保存文档
 
-    将文档保存到指定路径。自动创建不存在的目录。
+    将文档保存到指定路径，或写入可写的二进制文件对象（如 BytesIO、
+    HTTP 响应流）。保存到路径时自动创建不存在的目录。
 
     Args:
         doc: Document 对象
-        target: 保存路径
+        target: 保存路径，或带 write 方法的二进制文件对象
 
     Raises:
         DocumentError: 保存失败
@@ -94,7 +85,19 @@ def save_docx(doc: Document, target: Union[str, Path]) -> None:
 
         >>> # 自动创建目录
         >>> save_docx(doc, "output/reports/report.docx")
+
+        >>> # 写入文件对象，不经过磁盘
+        >>> buffer = io.BytesIO()
+        >>> save_docx(doc, buffer)
     """
+    if hasattr(target, "write"):
+        data = to_docx_bytes(doc)
+        try:
+            target.write(data)
+        except Exception as e:
+            raise DocumentError(f"写入文件对象失败: {e}")
+        return
+
     target_path = Path(target)
 
     # 确保目录存在
@@ -110,6 +113,32 @@ def save_docx(doc: Document, target: Union[str, Path]) -> None:
         raise DocumentError(f"保存文档失败: {e}")
 
 
+def to_docx_bytes(doc: Document) -> bytes:
+    """将文档保存为 DOCX 字节数据
+
+    通过 SaveToStream 在内存中完成，不经过临时文件。
+
+    Args:
+        doc: Document 对象
+
+    Returns:
+        bytes: DOCX 文件字节数据
+
+    Raises:
+        DocumentError: 保存失败
+
+    Examples:
+        >>> data = to_docx_bytes(doc)
+        >>> response.write(data)
+    """
+    try:
+        stream = Stream()
+        doc.SaveToStream(stream, SpireFileFormat.Docx)
+        return stream.ToArray()
+    except Exception as e:
+        raise DocumentError(f"保存文档失败: {e}")
+
+
 def merge_docs(doc_list: List[Document]) -> Document:
     """合并多个文档
 
@@ -187,18 +216,190 @@ def to_pdf(doc: Document) -> bytes:
         raise DocumentError(f"转换为 PDF 失败: {e}")
 
 
-def to_images(doc: Document) -> List[bytes]:
+# 工作进程内常驻的文档（由 _init_image_worker 加载）
+_worker_doc = None
+
+
+def _init_image_worker(doc_bytes: bytes) -> None:
+    """图片渲染工作进程初始化：加载一次文档
+
+    Args:
+        doc_bytes: DOCX 字节数据
+    """
+    global _worker_doc
+    _worker_doc = Document()
+    _worker_doc.LoadFromStream(Stream(doc_bytes), SpireFileFormat.Auto)
+
+
+def _render_worker_page(task: tuple) -> bytes:
+    """工作进程入口：渲染一页
+
+    Args:
+        task: (页索引（从0开始）, 图片格式, JPEG 质量)
+
+    Returns:
+        bytes: 图片字节数据
+    """
+    page_index, image_format, quality = task
+    return _render_page(_worker_doc, page_index, image_format, quality)
+
+
+def _render_page(doc: Document, page_index: int, image_format: str, quality: int) -> bytes:
+    """将文档的一页渲染为图片
+
+    Args:
+        doc: Document 对象
+        page_index: 页索引（从0开始）
+        image_format: "png" 或 "jpeg"
+        quality: JPEG 质量（1-95）
+
+    Returns:
+        bytes: 图片字节数据
+    """
+    # Spire.Doc 输出 PNG
+    image_bytes = doc.SaveImageToStreams(page_index, ImageType.Bitmap).ToArray()
+    if image_format == "png":
+        return image_bytes
+
+    from PIL import Image as PILImage
+
+    output = io.BytesIO()
+    with PILImage.open(io.BytesIO(image_bytes)) as image:
+        image.convert("RGB").save(output, format="JPEG", quality=quality)
+    return output.getvalue()
+
+
+def _normalize_image_format(image_format: str) -> str:
+    """规范化图片格式名称
+
+    Args:
+        image_format: "png"、"jpeg"、"jpg"，可带 "." 前缀，不区分大小写
+
+    Returns:
+        str: "png" 或 "jpeg"
+
+    Raises:
+        ValidationError: 格式不支持，或输出 JPEG 但未安装 Pillow
+    """
+    fmt = image_format.lower().lstrip(".")
+    if fmt == "jpg":
+        fmt = "jpeg"
+    if fmt not in ("png", "jpeg"):
+        raise ValidationError(f"不支持的图片格式: {image_format}")
+
+    if fmt == "jpeg":
+        try:
+            import PIL  # noqa: F401
+        except ImportError:
+            raise ValidationError("输出 JPEG 图片需要安装 Pillow")
+
+    return fmt
+
+
+def iter_images(
+    doc: Document,
+    pages: Union[int, Iterable[int]] = None,
+    image_format: str = "png",
+    quality: int = 85,
+    workers: int = None,
+) -> Iterator[bytes]:
+    """逐页将文档转换为图片（生成器）
+
+    每次只渲染并返回一页，调用方处理完后即可释放，内存占用与页数无关。
+
+    Args:
+        doc: Document 对象
+        pages: 要渲染的页码（从1开始），可以是单个页码或页码序列
+            （如 range(1, 4)），默认所有页
+        image_format: 图片格式，"png"（默认）或 "jpeg"（需要 Pillow）
+        quality: JPEG 质量（1-95），仅对 jpeg 有效
+        workers: 并行渲染的进程数；默认在当前进程中逐页渲染。
+            使用多进程时每个进程会加载一份文档，结果仍按页码顺序返回
+
+    Yields:
+        bytes: 每页的图片字节数据，顺序与 pages 一致
+
+    Raises:
+        ValidationError: 页码超出范围或图片格式不支持
+        DocumentError: 转换失败
+
+    Examples:
+        >>> # 只渲染第1页作为预览
+        >>> preview = next(iter_images(doc, pages=1))
+
+        >>> # 第2~5页输出为 JPEG，4 个进程并行
+        >>> for i, img in enumerate(iter_images(doc, range(2, 6), "jpeg", workers=4)):
+        ...     with open(f"page_{i + 2}.jpg", "wb") as f:
+        ...         f.write(img)
+    """
+    image_format = _normalize_image_format(image_format)
+
+    try:
+        page_count = doc.GetPageCount()
+    except Exception as e:
+        raise DocumentError(f"获取页数失败: {e}")
+
+    if pages is None:
+        page_numbers = list(range(1, page_count + 1))
+    elif isinstance(pages, int):
+        page_numbers = [pages]
+    else:
+        page_numbers = list(pages)
+
+    for page in page_numbers:
+        if not 1 <= page <= page_count:
+            raise ValidationError(f"页码超出范围: {page}（共 {page_count} 页）")
+
+    if workers is not None and workers < 1:
+        raise ValidationError(f"workers 必须大于 0: {workers}")
+
+    if workers is None or workers == 1 or len(page_numbers) <= 1:
+        for page in page_numbers:
+            try:
+                yield _render_page(doc, page - 1, image_format, quality)
+            except Exception as e:
+                raise DocumentError(f"转换为图片失败: {e}")
+        return
+
+    tasks = [(page - 1, image_format, quality) for page in page_numbers]
+    doc_bytes = to_docx_bytes(doc)
+
+    # 使用 spawn 启动工作进程，避免 fork 继承已初始化的原生运行时
+    context = multiprocessing.get_context("spawn")
+    try:
+        with context.Pool(
+            min(workers, len(tasks)),
+            initializer=_init_image_worker,
+            initargs=(doc_bytes,),
+        ) as pool:
+            yield from pool.imap(_render_worker_page, tasks)
+    except Exception as e:
+        raise DocumentError(f"转换为图片失败: {e}")
+
+
+def to_images(
+    doc: Document,
+    pages: Union[int, Iterable[int]] = None,
+    image_format: str = "png",
+    quality: int = 85,
+    workers: int = None,
+) -> List[bytes]:
     """将文档转换为图片列表
 
-    每一页转换为一张图片。
+    每一页转换为一张图片。页数较多时建议使用 iter_images 逐页处理。
 
     Args:
         doc: Document 对象
+        pages: 要渲染的页码（从1开始），单个页码或页码序列，默认所有页
+        image_format: 图片格式，"png"（默认）或 "jpeg"（需要 Pillow）
+        quality: JPEG 质量（1-95），仅对 jpeg 有效
+        workers: 并行渲染的进程数，默认在当前进程中渲染
 
     Returns:
         List[bytes]: 图片字节数据列表
 
     Raises:
+        ValidationError: 页码超出范围或图片格式不支持
         DocumentError: 转换失败
 
     Examples:
@@ -208,14 +409,7 @@ def to_images(doc: Document) -> List[bytes]:
         ...     with open(f"page_{i+1}.png", "wb") as f:
         ...         f.write(img_bytes)
     """
-    try:
-        images = []
-        for page_index in range(doc.PageCount):
-            image_stream = doc.SaveImageToStreams(page_index, ImageType.Bitmap)
-            images.append(image_stream.ToArray())
-        return images
-    except Exception as e:
-        raise DocumentError(f"转换为图片失败: {e}")
+    return list(iter_images(doc, pages, image_format, quality, workers))
 
 
 def to_pdf_file(doc: Document, file_path: Union[str, Path]) -> None:
@@ -250,7 +444,7 @@ def to_pdf_file(doc: Document, file_path: Union[str, Path]) -> None:
 def copy_doc(doc: Document) -> Document:
     """复制文档
 
-    创建文档的深拷贝，用于批量生成时复用模板。
+    使用 Spire.Doc 原生的 Clone 创建文档的深拷贝，用于批量生成时复用模板。
 
     Args:
         doc: Document 对象
@@ -264,15 +458,94 @@ def copy_doc(doc: Document) -> Document:
         ...     doc = copy_doc(template)
         ...     # 修改文档...
         ...     save_docx(doc, f"output_{i}.docx")
-    """
-    import copy
 
+    Note:
+        copy.deepcopy 只会复制 Python 包装对象，副本与原文档共享同一个
+        原生对象，副本被回收后原文档随之失效，请勿对 Document 使用 deepcopy。
+    """
     try:
-        return copy.deepcopy(doc)
+        return doc.Clone()
     except Exception as e:
         raise DocumentError(f"复制文档失败: {e}")
 
 
+class TemplatePool:
+    """内存模板池
+
+    模板只从磁盘读取并解析一次，字节数据常驻内存。每次 acquire() 返回
+    一个互不影响的新 Document，批量生成时无需为每条记录重新打开文件、
+    校验 ZIP 并读取磁盘。
+
+    支持两种复制策略（可用 benchmarks/bench_template_pool.py 对比）：
+        - "clone": 对常驻的模板文档调用 Spire.Doc 原生 Clone（默认，更快）
+        - "stream": 每次通过 LoadFromStream 从内存字节数据重新加载
+
+    Attributes:
+        strategy: 复制策略
+
+    Examples:
+        >>> pool = TemplatePool("sample.docx")
+        >>> for i, item in enumerate(records):
+        ...     doc = pool.acquire()
+        ...     fill_form(doc, item)
+        ...     save_docx(doc, f"output/report_{i}.docx")
+    """
+
+    CLONE = "clone"
+    STREAM = "stream"
+
+    def __init__(
+        self, source: Union[str, bytes, Path, Document], strategy: str = CLONE
+    ):
+        """
+        Args:
+            source: 模板文件路径（str/Path）、字节数据（bytes）或 Document 对象
+            strategy: 复制策略，"clone" 或 "stream"
+
+        Raises:
+            DocumentError: 文件不存在或加载失败
+            ValidationError: 文件格式无效或策略不支持
+        """
+        if strategy not in (self.CLONE, self.STREAM):
+            raise ValidationError(f"不支持的复制策略: {strategy}")
+        self.strategy = strategy
+
+        if isinstance(source, Document):
+            self._source = to_docx_bytes(source)
+        else:
+            self._source = _read_docx_source(source)
+
+        # 解析一次模板；clone 策略以它为母本
+        self._template = load_docx(self._source)
+
+    @property
+    def source(self) -> bytes:
+        """模板 DOCX 字节数据"""
+        return self._source
+
+    def acquire(self) -> Document:
+        """获取一个独立的模板副本
+
+        Returns:
+            Document: 新的 Document 对象，修改它不会影响模板或其他副本
+
+        Raises:
+            DocumentError: 复制失败
+        """
+        try:
+            if self.strategy == self.CLONE:
+                return self._template.Clone()
+
+            doc = Document()
+            doc.LoadFromStream(Stream(self._source), SpireFileFormat.Auto)
+            return doc
+        except Exception as e:
+            raise DocumentError(f"获取模板副本失败: {e}")
+
+    def __repr__(self) -> str:
+        return f"<TemplatePool strategy={self.strategy!r} size={len(self._source)}>"
+
+
 def get_document_properties(doc: Document) -> dict:
     """获取文档属性（标题、作者等）
 
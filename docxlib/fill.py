@@ -4,8 +4,9 @@ DocxLib 字段填充模块
 提供文本、图片、日期、网格数据填充等功能。
 """
 
+from collections import Counter
 from pathlib import Path
-from typing import Any, Dict, List, Tuple, Union
+from typing import Any, Dict, Generator, Iterable, List, Sequence, Tuple, Union
 import re
 
 from spire.doc import *
@@ -24,9 +25,42 @@ from .constants import (
     Position,
     VerticalAlignment,
 )
-from .errors import FillError, PositionError, ValidationError, VariableNotFoundError
-from .style import apply_cell_alignment, apply_font_style, apply_paragraph_alignment
-from .table import find_text, get_cell, get_cells
+from .errors import (
+    FillError,
+    PositionError,
+    ValidationError,
+    VariableNotFoundError,
+    VariableSyntaxError,
+)
+from .image import _POINTS_PER_PIXEL, _display_size, get_image_cache
+from .reader import DocxReader
+from .style import (
+    StyleSpec,
+    _new_format_baseline,
+    _resolve_style,
+    apply_cell_alignment,
+    apply_paragraph_alignment,
+)
+from .table import (
+    _get_cell_text,
+    _get_table_rows,
+    _update_index,
+    find_text,
+    get_cell,
+    get_cells,
+    invalidate_index,
+    iterate_cells,
+)
+from .utils import (
+    _compile_row_var_pattern,
+    _compile_var_pattern,
+    _find_run_spans,
+    _ordered_var_names,
+    _resolve_replacements,
+    _resolve_row_items,
+    _resolve_row_replacements,
+    _substitute_runs,
+)
 
 
 def _has_wildcard(position: Position) -> bool:
@@ -41,47 +75,42 @@ def _has_wildcard(position: Position) -> bool:
     return 0 in position
 
 
-def _fill_single_cell_text(
-    cell,
-    value: str,
-    font_name: str,
-    font_size: float,
-    color: str,
-    bold: bool,
-    italic: bool,
-    underline: bool,
-    h_align: HorizontalAlignment,
-    v_align: VerticalAlignment,
-) -> None:
+def _fill_single_cell_text(cell, value: str, style: StyleSpec, prototype=None, baseline=None):
     """填充文本到单个单元格（内部辅助函数）
 
+    指定 prototype 时复制该段落（文本、字体样式和水平对齐随之复制），
+    不再逐项设置样式属性。
+
     Args:
         cell: 单元格对象
         value: 要填充的文本
-        font_name: 字体名称
-        font_size: 字体大小
-        color: 颜色
-        bold: 是否粗体
-        italic: 是否斜体
-        underline: 是否下划线
-        h_align: 水平对齐方式
-        v_align: 垂直对齐方式
+        style: 文本样式
+        prototype: 已填充好的段落对象
+        baseline: 最小格式模式的继承格式记录
+
+    Returns:
+        Paragraph: 填充的段落对象
     """
     # 清空单元格内容
     cell.Paragraphs.Clear()
 
-    # 添加段落并设置文本
-    paragraph = cell.AddParagraph()
-    run = paragraph.AppendText(value)
+    if prototype is not None:
+        # 复制已设置好样式的段落
+        paragraph = prototype.Clone()
+        cell.Paragraphs.Add(paragraph)
+    else:
+        # 添加段落并设置文本
+        paragraph = cell.AddParagraph()
+        run = paragraph.AppendText(value)
 
-    # 应用样式
-    apply_font_style(run, font_name, font_size, color, bold, italic, underline)
+        # 应用样式
+        style.apply_to_run(run, baseline)
+        style.apply_to_paragraph(paragraph)
 
-    # 应用对齐方式
-    if h_align:
-        apply_paragraph_alignment(paragraph, h_align)
-    if v_align:
-        apply_cell_alignment(cell, v_align)
+    # 垂直对齐属于单元格，每个单元格分别设置
+    style.apply_to_cell(cell)
+
+    return paragraph
 
 
 def _fill_single_cell_image(
@@ -94,9 +123,13 @@ def _fill_single_cell_image(
     maintain_ratio: bool,
     original_width_px: int = None,
     original_height_px: int = None,
-) -> None:
+    prototype=None,
+):
     """填充图片到单个单元格（内部辅助函数）
 
+    指定 prototype 时复制该图片对象（已设置好尺寸），不再重新加载图片文件；
+    同一文档中的副本共用一份图片数据，保存时只写入一次。
+
     Args:
         cell: 单元格对象
         image_path: 图片文件路径
@@ -107,6 +140,10 @@ def _fill_single_cell_image(
         maintain_ratio: 是否保持宽高比
         original_width_px: 原始宽度（像素）
         original_height_px: 原始高度（像素）
+        prototype: 已插入文档的图片对象
+
+    Returns:
+        DocPicture: 插入的图片对象
     """
     # 清空单元格
     cell.Paragraphs.Clear()
@@ -114,13 +151,18 @@ def _fill_single_cell_image(
     # 添加段落
     paragraph = cell.AddParagraph()
 
-    # 加载图片
-    picture = paragraph.AppendPicture(image_path)
+    if prototype is not None:
+        # 复制已插入的图片（内联样式和尺寸随之复制）
+        picture = prototype.Clone()
+        paragraph.ChildObjects.Add(picture)
+    else:
+        # 加载图片
+        picture = paragraph.AppendPicture(image_path)
 
-    # 设置图片为内联样式
-    from spire.doc import TextWrappingStyle
+        # 设置图片为内联样式
+        from spire.doc import TextWrappingStyle
 
-    picture.TextWrappingStyle = TextWrappingStyle.Inline
+        picture.TextWrappingStyle = TextWrappingStyle.Inline
 
     # 应用对齐方式
     if h_align:
@@ -129,44 +171,30 @@ def _fill_single_cell_image(
         apply_cell_alignment(cell, v_align)
 
     # 调整图片大小
-    if width is not None or height is not None:
-        # 优先使用 PIL 获取的尺寸，否则使用 Spire.Doc 的尺寸
-        if original_width_px and original_height_px:
-            # 像素转换为磅（96 DPI: 1 磅 = 96/72 像素）
-            px_to_points = 96.0 / 72.0
-            original_width = original_width_px / px_to_points
-            original_height = original_height_px / px_to_points
-        else:
-            original_width = picture.Width
-            original_height = picture.Height
-
-        if width is None and height is not None:
-            # 只指定高度
-            if maintain_ratio and original_width and original_height:
-                width = original_width * (height / original_height)
-            elif original_width:
-                width = original_width
-        elif height is None and width is not None:
-            # 只指定宽度
-            if maintain_ratio and original_width and original_height:
-                height = original_height * (width / original_width)
-            elif original_height:
-                height = original_height
+    if prototype is None and (width is not None or height is not None):
+        # 优先使用从文件头解析的尺寸，否则使用 Spire.Doc 加载后的尺寸
+        if not (original_width_px and original_height_px):
+            original_width_px = picture.Width / _POINTS_PER_PIXEL
+            original_height_px = picture.Height / _POINTS_PER_PIXEL
+        width, height = _display_size(
+            width, height, maintain_ratio, original_width_px, original_height_px
+        )
 
         if width is not None:
             picture.Width = width
         if height is not None:
             picture.Height = height
 
+    return picture
+
 
 def _fill_single_cell_date(
     cell,
     numbers: list,
     separators: list,
-    font_name: str,
-    font_size: float,
-    h_align: HorizontalAlignment,
-    v_align: VerticalAlignment,
+    number_style: StyleSpec,
+    separator_style: StyleSpec,
+    baseline=None,
 ) -> None:
     """填充日期到单个单元格（内部辅助函数）
 
@@ -174,10 +202,9 @@ def _fill_single_cell_date(
         cell: 单元格对象
         numbers: 数字部分列表
         separators: 分隔符部分列表
-        font_name: 数字字体（年月日使用宋体）
-        font_size: 字体大小
-        h_align: 水平对齐方式
-        v_align: 垂直对齐方式
+        number_style: 数字样式（对齐方式也取自该样式）
+        separator_style: 年月日样式
+        baseline: 最小格式模式的继承格式记录
     """
     # 清空单元格
     cell.Paragraphs.Clear()
@@ -188,18 +215,14 @@ def _fill_single_cell_date(
     # 依次添加数字和年月日
     for num, sep in zip(numbers, separators):
         # 添加数字（使用指定字体）
-        run_num = paragraph.AppendText(num)
-        apply_font_style(run_num, font_name, font_size, DEFAULT_COLOR)
+        number_style.apply_to_run(paragraph.AppendText(num), baseline)
 
         # 添加年月日（使用宋体）
-        run_sep = paragraph.AppendText(sep)
-        apply_font_style(run_sep, "宋体", font_size, DEFAULT_COLOR)
+        separator_style.apply_to_run(paragraph.AppendText(sep), baseline)
 
     # 应用对齐方式
-    if h_align:
-        apply_paragraph_alignment(paragraph, h_align)
-    if v_align:
-        apply_cell_alignment(cell, v_align)
+    number_style.apply_to_paragraph(paragraph)
+    number_style.apply_to_cell(cell)
 
 
 def fill_text(
@@ -216,6 +239,7 @@ def fill_text(
     h_align: HorizontalAlignment = None,
     v_align: VerticalAlignment = None,
     match_mode: MatchMode = MatchMode.ALL,
+    style: Union[StyleSpec, str] = None,
 ) -> None:
     """填充文本到文档
 
@@ -245,6 +269,7 @@ def fill_text(
         match_mode: 匹配模式（仅在 match_right/match_down 模式下有效）
             - "all": 填充所有匹配位置（默认）
             - "first": 仅填充第一个匹配位置
+        style: StyleSpec 或 register_style 注册的样式名称，指定时代替 font_name 至 v_align 的样式参数
 
     Raises:
         PositionError: 位置无效
@@ -263,6 +288,10 @@ def fill_text(
         >>> # 带样式
         >>> fill_text(doc, "标题", "内容", mode="match_right", font_name="黑体", font_size=16, bold=True)
 
+        >>> # 复用预先创建的样式
+        >>> header = StyleSpec(font_name="黑体", font_size=16, bold=True, h_align="center")
+        >>> fill_text(doc, (1, 0, 1, 1), "标题", style=header)
+
         >>> # 通配符：所有表格的第2行第3列
         >>> fill_text(doc, (1, 0, 2, 3), "统一内容")
 
@@ -272,6 +301,15 @@ def fill_text(
         >>> # 匹配模式：仅填充第一个
         >>> fill_text(doc, "标签：", "值", mode="match_right", match_mode="first")
     """
+    if style is None:
+        style = StyleSpec(font_name, font_size, color, bold, italic, underline, h_align, v_align)
+    else:
+        style = _resolve_style(doc, style)
+
+    # 多个目标位置时只在第一个单元格设置样式，其余位置复制该段落
+    prototype = None
+    baseline = _new_format_baseline()
+
     try:
         # 确定目标单元格位置
         if mode == FillMode.POSITION:
@@ -286,19 +324,9 @@ def fill_text(
                     raise PositionError(f"通配符位置 {position} 未匹配到任何单元格")
 
                 # 批量填充
-                for _, _, _, _, cell in cells_list:
-                    _fill_single_cell_text(
-                        cell,
-                        value,
-                        font_name,
-                        font_size,
-                        color,
-                        bold,
-                        italic,
-                        underline,
-                        h_align,
-                        v_align,
-                    )
+                for sec, tbl, row, col, cell in cells_list:
+                    prototype = _fill_single_cell_text(cell, value, style, prototype, baseline)
+                    _update_index(doc, (sec, tbl, row, col), cell)
                 return
             else:
                 # 单个单元格填充
@@ -320,18 +348,8 @@ def fill_text(
             for pos in target_positions:
                 target_pos = (pos[0], pos[1], pos[2], pos[3] + 1)
                 cell = get_cell(doc, *target_pos)
-                _fill_single_cell_text(
-                    cell,
-                    value,
-                    font_name,
-                    font_size,
-                    color,
-                    bold,
-                    italic,
-                    underline,
-                    h_align,
-                    v_align,
-                )
+                prototype = _fill_single_cell_text(cell, value, style, prototype, baseline)
+                _update_index(doc, target_pos, cell)
             return
 
         elif mode == FillMode.MATCH_DOWN:
@@ -350,36 +368,16 @@ def fill_text(
             for pos in target_positions:
                 target_pos = (pos[0], pos[1], pos[2] + 1, pos[3])
                 cell = get_cell(doc, *target_pos)
-                _fill_single_cell_text(
-                    cell,
-                    value,
-                    font_name,
-                    font_size,
-                    color,
-                    bold,
-                    italic,
-                    underline,
-                    h_align,
-                    v_align,
-                )
+                prototype = _fill_single_cell_text(cell, value, style, prototype, baseline)
+                _update_index(doc, target_pos, cell)
             return
         else:
             raise FillError(f"不支持的填充模式: {mode}")
 
         # 单个单元格填充（position 模式且无通配符）
         cell = get_cell(doc, *target_pos)
-        _fill_single_cell_text(
-            cell,
-            value,
-            font_name,
-            font_size,
-            color,
-            bold,
-            italic,
-            underline,
-            h_align,
-            v_align,
-        )
+        _fill_single_cell_text(cell, value, style, baseline=baseline)
+        _update_index(doc, target_pos, cell)
 
     except (PositionError, FillError):
         raise
@@ -387,6 +385,114 @@ def fill_text(
         raise FillError(f"填充文本失败: {e}")
 
 
+def fill_form(
+    doc: Document,
+    fields: Dict[str, Any],
+    mode: str = FillMode.MATCH_RIGHT,
+    font_name: str = DEFAULT_FONT,
+    font_size: float = DEFAULT_FONT_SIZE,
+    color: str = DEFAULT_COLOR,
+    bold: bool = False,
+    italic: bool = False,
+    underline: bool = False,
+    h_align: HorizontalAlignment = None,
+    v_align: VerticalAlignment = None,
+    match_mode: MatchMode = MatchMode.ALL,
+    style: Union[StyleSpec, str] = None,
+) -> Dict[str, List[Position]]:
+    """按标签批量填充表单
+
+    只遍历一次文档单元格即可定位所有标签，然后依次填充各标签右侧或
+    下方的单元格。相比对每个字段调用一次 fill_text，耗时与单元格数量
+    成正比，而不是单元格数量 × 字段数量。
+
+    Args:
+        doc: Document 对象
+        fields: {标签文本: 填充值}，填充值会转换为字符串
+        mode: 填充模式
+            - "match_right": 填充到标签右侧（默认）
+            - "match_down": 填充到标签下方
+        font_name: 字体名称
+        font_size: 字体大小（磅）
+        color: 颜色（名称或十六进制）
+        bold: 是否粗体
+        italic: 是否斜体
+        underline: 是否下划线
+        h_align: 水平对齐方式
+        v_align: 垂直对齐方式
+        match_mode: 匹配模式
+            - "all": 填充所有匹配位置（默认）
+            - "first": 每个标签仅填充第一个匹配位置
+        style: StyleSpec 或 register_style 注册的样式名称，指定时代替 font_name 至 v_align 的样式参数
+
+    Returns:
+        Dict[str, List[Position]]: {标签文本: 已填充的目标位置列表}
+
+    Raises:
+        PositionError: 标签未找到或目标单元格不存在（此时文档不会被修改）
+        FillError: 填充失败
+
+    Examples:
+        >>> fill_form(doc, {"姓名": "张三", "年龄": "25", "项目": "智慧城市"})
+        >>> fill_form(doc, {"项目": "智慧城市"}, mode="match_down", h_align="center")
+    """
+    if mode == FillMode.MATCH_RIGHT:
+        offset = (0, 1)
+    elif mode == FillMode.MATCH_DOWN:
+        offset = (1, 0)
+    else:
+        raise FillError(f"fill_form 不支持的填充模式: {mode}")
+
+    if style is None:
+        style = StyleSpec(font_name, font_size, color, bold, italic, underline, h_align, v_align)
+    else:
+        style = _resolve_style(doc, style)
+    baseline = _new_format_baseline()
+
+    try:
+        # 单次遍历：记录所有单元格，并定位各标签
+        cells = {}
+        label_positions = {label: [] for label in fields}
+        for sec, tbl, row, col, cell in iterate_cells(doc):
+            position = (sec, tbl, row, col)
+            cells[position] = cell
+            cell_text = _get_cell_text(cell)
+            if cell_text in label_positions:
+                label_positions[cell_text].append(position)
+
+        missing = [label for label, positions in label_positions.items() if not positions]
+        if missing:
+            raise PositionError(f"未找到文本: {', '.join(missing)}")
+
+        # 解析全部目标单元格后再填充，出错时文档保持不变
+        targets = {}
+        for label, positions in label_positions.items():
+            if match_mode != MatchMode.ALL:
+                positions = positions[:1]
+            targets[label] = []
+            for sec, tbl, row, col in positions:
+                target_pos = (sec, tbl, row + offset[0], col + offset[1])
+                if target_pos not in cells:
+                    raise PositionError(
+                        f"标签 '{label}' 的目标单元格 {target_pos} 不存在"
+                    )
+                targets[label].append(target_pos)
+
+        for label, target_positions in targets.items():
+            value = str(fields[label])
+            for target_pos in target_positions:
+                cell = cells[target_pos]
+                _fill_single_cell_text(cell, value, style, baseline=baseline)
+                _update_index(doc, target_pos, cell)
+
+        return targets
+
+    except (PositionError, FillError):
+        raise
+    except Exception as e:
+        raise FillError(f"填充表单失败: {e}")
+
+
 def fill_image(
     doc: Document,
     position: Union[Position, str],
@@ -398,6 +504,8 @@ def fill_image(
     height: float = None,
     maintain_ratio: bool = True,
     match_mode: MatchMode = MatchMode.ALL,
+    max_dpi: float = None,
+    target_quality: int = None,
 ) -> None:
     """填充图片到文档
 
@@ -424,10 +532,15 @@ def fill_image(
         match_mode: 匹配模式（仅在 match_right/match_down 模式下有效）
             - "all": 填充所有匹配位置（默认）
             - "first": 仅填充第一个匹配位置
+        max_dpi: 按显示尺寸计算的最大分辨率，原图超过时先缩小再插入
+            （需要 Pillow），None 表示插入原图
+        target_quality: JPEG 压缩质量（1-95），指定时无透明通道的图片
+            重新压缩为 JPEG（需要 Pillow）
 
     Raises:
         FillError: 图片文件不存在或格式不支持
         ValueError: 不支持的源类型
+        ValidationError: max_dpi/target_quality 无效或未安装 Pillow
         PositionError: 位置无效
 
     Examples:
@@ -450,74 +563,81 @@ def fill_image(
 
         >>> # 匹配模式：仅填充第一个
         >>> fill_image(doc, "照片：", "photo.jpg", mode="match_right", match_mode="first")
-    """
-    import tempfile
-    import os
-
-    # 用于存储图片原始尺寸
-    original_width_px = None
-    original_height_px = None
-    temp_file_path = None
-
-    # 处理不同类型的输入（参考 load_docx 的实现模式）
-    if isinstance(source, (str, Path)):
-        # 文件路径
-        file_path = Path(source)
-
-        # 检查文件是否存在
-        if not file_path.exists():
-            raise FillError(f"图片文件不存在: {source}")
-
-        image_path = str(file_path)
 
-        # 使用 PIL 获取原始尺寸（可选）
-        try:
-            from PIL import Image as PILImage
-
-            pil_image = PILImage.open(str(file_path))
-            original_width_px, original_height_px = pil_image.size
-        except ImportError:
-            pass
+        >>> # 手机照片按 150 DPI 缩小后插入
+        >>> fill_image(doc, "照片：", "photo.jpg", mode="match_right", width=80, max_dpi=150)
+    """
+    cache = get_image_cache()
+    # 插入完成前固定本次用到的缓存条目，避免副本被并发填充或缩放结果淘汰删除
+    with cache.pinned():
+        # 同一张图片（按内容哈希）只解码一次尺寸、只写一次临时文件
+        image = cache.get(source)
+        image_path = image.path
+        original_width_px = image.width_px
+        original_height_px = image.height_px
+
+        if max_dpi is not None or target_quality is not None:
+            # 插入缩放后的图片，显示尺寸仍按原图计算并显式设置
+            width, height = _display_size(
+                width, height, maintain_ratio, original_width_px, original_height_px
+            )
+            image_path = cache.get_resampled(
+                source, width, height, max_dpi, target_quality
+            ).path
 
-    elif isinstance(source, bytes):
-        # 字节数据 - 创建临时文件
+        # 多个目标位置时只加载一次图片，其余位置复制第一张图片
+        prototype = None
 
-        # 使用 PIL 获取原始尺寸（可选）
         try:
-            from PIL import Image as PILImage
-            from io import BytesIO
-
-            pil_image = PILImage.open(BytesIO(source))
-            original_width_px, original_height_px = pil_image.size
-        except ImportError:
-            pass
-
-        # 创建临时文件
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".png") as tmp:
-            tmp.write(source)
-            temp_file_path = tmp.name
-
-        image_path = temp_file_path
-
-    else:
-        raise ValueError(f"不支持的源类型: {type(source)}")
-
-    try:
-        # 确定目标单元格位置
-        if mode == FillMode.POSITION:
-            if isinstance(position, str):
-                raise PositionError("position 模式需要位置元组")
-
-            # 检查是否包含通配符
-            if _has_wildcard(position):
-                # 使用 get_cells 获取所有匹配的单元格
-                cells_list = get_cells(doc, *position)
-                if not cells_list:
-                    raise PositionError(f"通配符位置 {position} 未匹配到任何单元格")
+            # 确定目标单元格位置
+            if mode == FillMode.POSITION:
+                if isinstance(position, str):
+                    raise PositionError("position 模式需要位置元组")
+
+                # 检查是否包含通配符
+                if _has_wildcard(position):
+                    # 使用 get_cells 获取所有匹配的单元格
+                    cells_list = get_cells(doc, *position)
+                    if not cells_list:
+                        raise PositionError(f"通配符位置 {position} 未匹配到任何单元格")
+
+                    # 批量填充
+                    for sec, tbl, row, col, cell in cells_list:
+                        prototype = _fill_single_cell_image(
+                            cell,
+                            image_path,
+                            h_align,
+                            v_align,
+                            width,
+                            height,
+                            maintain_ratio,
+                            original_width_px,
+                            original_height_px,
+                            prototype,
+                        )
+                        _update_index(doc, (sec, tbl, row, col), cell)
+                    return
+                else:
+                    # 单个单元格填充
+                    target_pos = position
+
+            elif mode == FillMode.MATCH_RIGHT:
+                if not isinstance(position, str):
+                    raise PositionError("match_right 模式需要查找文本字符串")
+                positions = find_text(doc, position)
+                if not positions:
+                    raise PositionError(f"未找到文本: {position}")
+
+                # 根据 match_mode 决定填充所有还是仅第一个
+                target_positions = (
+                    positions if match_mode == MatchMode.ALL else [positions[0]]
+                )
 
-                # 批量填充
-                for _, _, _, _, cell in cells_list:
-                    _fill_single_cell_image(
+                # 批量填充所有匹配位置
+                for pos in target_positions:
+                    target_pos = (pos[0], pos[1], pos[2], pos[3] + 1)
+                    cell = get_cell(doc, *target_pos)
+                    prototype = _fill_single_cell_image(
                         cell,
                         image_path,
                         h_align,
@@ -527,98 +647,63 @@ def fill_image(
                         maintain_ratio,
                         original_width_px,
                         original_height_px,
+                        prototype,
                     )
+                    _update_index(doc, target_pos, cell)
                 return
-            else:
-                # 单个单元格填充
-                target_pos = position
 
-        elif mode == FillMode.MATCH_RIGHT:
-            if not isinstance(position, str):
-                raise PositionError("match_right 模式需要查找文本字符串")
-            positions = find_text(doc, position)
-            if not positions:
-                raise PositionError(f"未找到文本: {position}")
+            elif mode == FillMode.MATCH_DOWN:
+                if not isinstance(position, str):
+                    raise PositionError("match_down 模式需要查找文本字符串")
+                positions = find_text(doc, position)
+                if not positions:
+                    raise PositionError(f"未找到文本: {position}")
 
-            # 根据 match_mode 决定填充所有还是仅第一个
-            target_positions = (
-                positions if match_mode == MatchMode.ALL else [positions[0]]
-            )
-
-            # 批量填充所有匹配位置
-            for pos in target_positions:
-                target_pos = (pos[0], pos[1], pos[2], pos[3] + 1)
-                cell = get_cell(doc, *target_pos)
-                _fill_single_cell_image(
-                    cell,
-                    image_path,
-                    h_align,
-                    v_align,
-                    width,
-                    height,
-                    maintain_ratio,
-                    original_width_px,
-                    original_height_px,
+                # 根据 match_mode 决定填充所有还是仅第一个
+                target_positions = (
+                    positions if match_mode == MatchMode.ALL else [positions[0]]
                 )
-            return
 
-        elif mode == FillMode.MATCH_DOWN:
-            if not isinstance(position, str):
-                raise PositionError("match_down 模式需要查找文本字符串")
-            positions = find_text(doc, position)
-            if not positions:
-                raise PositionError(f"未找到文本: {position}")
-
-            # 根据 match_mode 决定填充所有还是仅第一个
-            target_positions = (
-                positions if match_mode == MatchMode.ALL else [positions[0]]
+                # 批量填充所有匹配位置
+                for pos in target_positions:
+                    target_pos = (pos[0], pos[1], pos[2] + 1, pos[3])
+                    cell = get_cell(doc, *target_pos)
+                    prototype = _fill_single_cell_image(
+                        cell,
+                        image_path,
+                        h_align,
+                        v_align,
+                        width,
+                        height,
+                        maintain_ratio,
+                        original_width_px,
+                        original_height_px,
+                        prototype,
+                    )
+                    _update_index(doc, target_pos, cell)
+                return
+            else:
+                raise FillError(f"不支持的填充模式: {mode}")
+
+            # 单个单元格填充（position 模式且无通配符）
+            cell = get_cell(doc, *target_pos)
+            _fill_single_cell_image(
+                cell,
+                image_path,
+                h_align,
+                v_align,
+                width,
+                height,
+                maintain_ratio,
+                original_width_px,
+                original_height_px,
             )
+            _update_index(doc, target_pos, cell)
 
-            # 批量填充所有匹配位置
-            for pos in target_positions:
-                target_pos = (pos[0], pos[1], pos[2] + 1, pos[3])
-                cell = get_cell(doc, *target_pos)
-                _fill_single_cell_image(
-                    cell,
-                    image_path,
-                    h_align,
-                    v_align,
-                    width,
-                    height,
-                    maintain_ratio,
-                    original_width_px,
-                    original_height_px,
-                )
-            return
-        else:
-            raise FillError(f"不支持的填充模式: {mode}")
-
-        # 单个单元格填充（position 模式且无通配符）
-        cell = get_cell(doc, *target_pos)
-        _fill_single_cell_image(
-            cell,
-            image_path,
-            h_align,
-            v_align,
-            width,
-            height,
-            maintain_ratio,
-            original_width_px,
-            original_height_px,
-        )
-
-    except (PositionError, FillError, ValueError):
-        raise
-    except Exception as e:
-        raise FillError(f"填充图片失败: {e}")
-
-    finally:
-        # 清理临时文件
-        if temp_file_path and os.path.exists(temp_file_path):
-            try:
-                os.unlink(temp_file_path)
-            except Exception:
-                pass
+        except (PositionError, FillError, ValueError):
+            raise
+        except Exception as e:
+            raise FillError(f"填充图片失败: {e}")
 
 
 def fill_date(
@@ -630,6 +715,7 @@ def fill_date(
     h_align: HorizontalAlignment = None,
     v_align: VerticalAlignment = None,
     match_mode: MatchMode = MatchMode.ALL,
+    style: Union[StyleSpec, str] = None,
 ) -> None:
     """填充日期
 
@@ -654,6 +740,8 @@ def fill_date(
         match_mode: 匹配模式（仅在 position 为查找文本时有效）
             - "all": 填充所有匹配位置（默认）
             - "first": 仅填充第一个匹配位置
+        style: StyleSpec 或 register_style 注册的样式名称，指定时代替 font_name、font_size、
+            h_align、v_align，数字使用该样式，年月日使用同样式的宋体
 
     Raises:
         PositionError: 位置无效
@@ -683,6 +771,15 @@ def fill_date(
 
         numbers, separators = parse_date_string(date_str)
 
+        if style is None:
+            number_style = StyleSpec(
+                font_name, font_size, DEFAULT_COLOR, h_align=h_align, v_align=v_align
+            )
+        else:
+            number_style = _resolve_style(doc, style)
+        separator_style = number_style.replace(font_name="宋体")
+        baseline = _new_format_baseline()
+
         if not numbers or not separators:
             raise FillError(
                 f"无效的日期字符串: '{date_str}'，"
@@ -705,9 +802,8 @@ def fill_date(
             for pos in target_positions:
                 target_pos = (pos[0], pos[1], pos[2], pos[3] + 1)
                 cell = get_cell(doc, *target_pos)
-                _fill_single_cell_date(
-                    cell, numbers, separators, font_name, font_size, h_align, v_align
-                )
+                _fill_single_cell_date(cell, numbers, separators, number_style, separator_style, baseline)
+                _update_index(doc, target_pos, cell)
             return
         else:
             # 位置元组模式
@@ -719,16 +815,9 @@ def fill_date(
                     raise PositionError(f"通配符位置 {position} 未匹配到任何单元格")
 
                 # 批量填充
-                for _, _, _, _, cell in cells_list:
-                    _fill_single_cell_date(
-                        cell,
-                        numbers,
-                        separators,
-                        font_name,
-                        font_size,
-                        h_align,
-                        v_align,
-                    )
+                for sec, tbl, row, col, cell in cells_list:
+                    _fill_single_cell_date(cell, numbers, separators, number_style, separator_style, baseline)
+                    _update_index(doc, (sec, tbl, row, col), cell)
                 return
             else:
                 # 单个单元格填充
@@ -736,9 +825,8 @@ def fill_date(
 
         # 单个单元格填充（无通配符）
         cell = get_cell(doc, *target_pos)
-        _fill_single_cell_date(
-            cell, numbers, separators, font_name, font_size, h_align, v_align
-        )
+        _fill_single_cell_date(cell, numbers, separators, number_style, separator_style, baseline)
+        _update_index(doc, target_pos, cell)
 
     except (PositionError, FillError, ValidationError):
         raise
@@ -746,18 +834,58 @@ def fill_date(
         raise FillError(f"填充日期失败: {e}")
 
 
-def fill_grid(doc: Document, data: List[List[str]], position: Position) -> None:
+def _resolve_column_styles(doc: Document, column_styles) -> List:
+    """将列样式统一转换为样式对象
+
+    Args:
+        doc: Document 对象
+        column_styles: 每列一个 StyleSpec、样式字典或已注册的样式名称
+            （或 None 表示不设置样式）
+
+    Returns:
+        List: 每列的样式对象或 None
+
+    Raises:
+        ValidationError: 样式字典包含不支持的键，或样式名称未注册
+    """
+    return [
+        None if style is None else _resolve_style(doc, style, f"第 {col_idx + 1} 列样式")
+        for col_idx, style in enumerate(column_styles or ())
+    ]
+
+
+def fill_grid(
+    doc: Document,
+    data: Iterable[Sequence[Any]],
+    position: Position,
+    *,
+    extend: bool = False,
+    prototype_row: int = None,
+    column_styles: Sequence[Union[StyleSpec, Dict[str, Any], str, None]] = None,
+) -> int:
     """填充网格数据
 
-    从二维数组填充数据到表格。
+    从二维数据逐行填充到表格。按行顺序写入并复用行对象，data 可以是
+    任意可迭代对象（列表、生成器、csv.reader、DataFrame.itertuples(index=False) 等），
+    不会一次性读入内存。
 
     Args:
         doc: Document 对象
-        data: 二维数组，每个元素代表一个单元格的值
+        data: 可迭代的行数据，每行是单元格值的序列（值会转换为字符串）
         position: 起始位置 (section, table, row, col)
+        extend: 表格行数不足时是否复制原型行追加到表格末尾
+        prototype_row: 原型行索引（从1开始），默认为填充前表格的最后一行
+        column_styles: 每列的 StyleSpec、样式字典或 register_style 注册的样式名称，
+            字典的键与 fill_text 的样式参数相同
+            （font_name、font_size、color、bold、italic、underline、h_align、v_align），
+            未指定的键使用 fill_text 的默认值；None 或超出列表的列保持原样式
+
+    Returns:
+        int: 填充的行数
 
     Raises:
         PositionError: 数据超出表格边界
+        ValidationError: 列样式无效
 
     Examples:
         >>> data = [
@@ -766,36 +894,89 @@ def fill_grid(doc: Document, data: List[List[str]], position: Position) -> None:
         ...     ["2", "人工费", "30000"],
         ... ]
         >>> fill_grid(doc, data, position=(1, 1, 7, 1))
+
+        >>> # 逐行读取 CSV，行数不足时复制第2行，金额列右对齐
+        >>> with open("items.csv", encoding="utf-8") as f:
+        ...     fill_grid(
+        ...         doc,
+        ...         csv.reader(f),
+        ...         position=(1, 1, 2, 1),
+        ...         extend=True,
+        ...         prototype_row=2,
+        ...         column_styles=[None, None, {"h_align": "right"}],
+        ...     )
     """
-    try:
-        section_idx, table_idx, start_row, start_col = position
+    styles = _resolve_column_styles(doc, column_styles)
+    section_idx, table_idx, start_row, start_col = position
+    rows_added = 0
 
-        # 填充数据
+    try:
+        try:
+            rows, row_count = _get_table_rows(doc, section_idx, table_idx)
+        except IndexError as e:
+            raise PositionError(f"无法获取表格 ({section_idx}, {table_idx}): {e}")
+
+        prototype = None
+        baseline = _new_format_baseline()
+        if extend:
+            # 在写入前复制原型行，追加的行不会带上已填充的内容
+            proto_idx = row_count if prototype_row is None else prototype_row
+            if not 1 <= proto_idx <= row_count:
+                raise PositionError(f"原型行 {proto_idx} 超出范围 1-{row_count}")
+            prototype = rows.get_Item(proto_idx - 1).Clone()
+
+        row_idx = -1
         for row_idx, row_data in enumerate(data):
+            target_row = start_row + row_idx
+
+            # 获取行对象，行数不足时追加原型行的副本
+            if 1 <= target_row <= row_count + rows_added:
+                row_obj = rows.get_Item(target_row - 1)
+            elif prototype is not None and target_row == row_count + rows_added + 1:
+                row_obj = prototype.Clone()
+                rows.Add(row_obj)
+                rows_added += 1
+            else:
+                raise PositionError(
+                    f"数据超出表格边界: "
+                    f"无法填充到 ({section_idx}, {table_idx}, {target_row}, {start_col})"
+                )
+
+            cells = row_obj.Cells
+            col_count = cells.Count
             for col_idx, cell_value in enumerate(row_data):
-                # 计算目标位置
-                target_row = start_row + row_idx
                 target_col = start_col + col_idx
+                if not 1 <= target_col <= col_count:
+                    raise PositionError(
+                        f"数据超出表格边界: "
+                        f"无法填充到 ({section_idx}, {table_idx}, {target_row}, {target_col})"
+                    )
+                cell = cells.get_Item(target_col - 1)
 
-                # 填充单元格
-                try:
-                    cell = get_cell(doc, section_idx, table_idx, target_row, target_col)
-
+                style = styles[col_idx] if col_idx < len(styles) else None
+                if style is None:
                     # 清空并设置文本
                     cell.Paragraphs.Clear()
                     paragraph = cell.AddParagraph()
                     paragraph.AppendText(str(cell_value))
+                else:
+                    _fill_single_cell_text(cell, str(cell_value), style, baseline=baseline)
 
-                except PositionError:
-                    raise PositionError(
-                        f"数据超出表格边界: "
-                        f"无法填充到 ({section_idx}, {table_idx}, {target_row}, {target_col})"
+                if not rows_added:
+                    _update_index(
+                        doc, (section_idx, table_idx, target_row, target_col), cell
                     )
 
-    except PositionError:
+        return row_idx + 1
+
+    except (PositionError, ValidationError):
         raise
     except Exception as e:
         raise FillError(f"填充网格数据失败: {e}")
+    finally:
+        # 表格结构已变化，丢弃索引
+        if rows_added:
+            invalidate_index(doc)
 
 
 def replace_all(doc: Document, old_text: str, new_text: str) -> None:
@@ -812,6 +993,7 @@ def replace_all(doc: Document, old_text: str, new_text: str) -> None:
     """
     try:
         doc.Replace(old_text, new_text, False, False)
+        invalidate_index(doc)
     except Exception as e:
         raise FillError(f"全局替换失败: {e}")
 
@@ -832,6 +1014,7 @@ def clear_cell(doc: Document, section: int, table: int, row: int, col: int) -> N
     try:
         cell = get_cell(doc, section, table, row, col)
         cell.Paragraphs.Clear()
+        _update_index(doc, (section, table, row, col), cell)
     except Exception as e:
         raise FillError(f"清空单元格失败: {e}")
 
@@ -847,13 +1030,8 @@ def _find_variables(text: str, prefix: str, suffix: str) -> List[Tuple[str, str,
     Returns:
         List[Tuple[完整变量, 变量名, 默认值]]
     """
-    pattern = (
-        re.escape(prefix)
-        + r"([a-zA-Z_][a-zA-Z0-9_]*)(?:\|([^}]*))?"
-        + re.escape(suffix)
-    )
     matches = []
-    for match in re.finditer(pattern, text):
+    for match in _compile_var_pattern(prefix, suffix).finditer(text):
         full_var = match.group(0)
         var_name = match.group(1)
         default_val = match.group(2) if match.group(2) is not None else ""
@@ -861,6 +1039,317 @@ def _find_variables(text: str, prefix: str, suffix: str) -> List[Tuple[str, str,
     return matches
 
 
+# 页眉页脚类型（HeadersFooters 上的属性名）
+_HEADER_FOOTER_KINDS = (
+    "Header",
+    "Footer",
+    "FirstPageHeader",
+    "FirstPageFooter",
+    "EvenHeader",
+    "EvenFooter",
+)
+
+
+def _iter_body_paragraphs(body, section_idx: int, header_footer: str = None) -> Generator:
+    """遍历正文容器（节正文、页眉页脚）中的段落和表格单元格段落
+
+    Args:
+        body: 包含 Paragraphs 和 Tables 的 Spire.Doc 容器
+        section_idx: 节索引（从0开始）
+        header_footer: 页眉页脚类型，None 表示节正文
+
+    Yields:
+        tuple: (位置, 段落)，位置为
+        (节, 页眉页脚类型, 表格, 行, 列, 段落)，索引从0开始，
+        非表格段落的表格/行/列为 -1
+    """
+    for para_idx in range(body.Paragraphs.Count):
+        yield (
+            (section_idx, header_footer, -1, -1, -1, para_idx),
+            body.Paragraphs.get_Item(para_idx),
+        )
+
+    for table_idx in range(body.Tables.Count):
+        table = body.Tables.get_Item(table_idx)
+        for row_idx in range(table.Rows.Count):
+            row = table.Rows.get_Item(row_idx)
+            for cell_idx in range(row.Cells.Count):
+                cell = row.Cells.get_Item(cell_idx)
+                for para_idx in range(cell.Paragraphs.Count):
+                    yield (
+                        (section_idx, header_footer, table_idx, row_idx, cell_idx, para_idx),
+                        cell.Paragraphs.get_Item(para_idx),
+                    )
+
+
+def _iter_template_paragraphs(doc: Document) -> Generator:
+    """遍历模板中可能包含变量的所有段落
+
+    覆盖每一节的正文段落、正文表格，以及页眉页脚。
+
+    Args:
+        doc: Document 对象
+
+    Yields:
+        tuple: (位置, 段落)，位置格式见 _iter_body_paragraphs
+    """
+    for section_idx in range(doc.Sections.Count):
+        section = doc.Sections.get_Item(section_idx)
+        yield from _iter_body_paragraphs(section, section_idx)
+
+        headers_footers = section.HeadersFooters
+        for kind in _HEADER_FOOTER_KINDS:
+            header_footer = getattr(headers_footers, kind)
+            if header_footer is not None:
+                yield from _iter_body_paragraphs(header_footer, section_idx, kind)
+
+
+def _get_body_at(doc: Document, location: tuple):
+    """根据 _iter_template_paragraphs 记录的位置取回正文容器（节正文或页眉页脚）"""
+    body = doc.Sections.get_Item(location[0])
+    if location[1] is not None:
+        body = getattr(body.HeadersFooters, location[1])
+    return body
+
+
+def _get_paragraph_at(doc: Document, location: tuple):
+    """根据 _iter_template_paragraphs 记录的位置直接取回段落
+
+    Args:
+        doc: Document 对象
+        location: (节, 页眉页脚类型, 表格, 行, 列, 段落)
+
+    Returns:
+        Paragraph: 段落对象
+    """
+    _, _, table_idx, row_idx, cell_idx, para_idx = location
+    body = _get_body_at(doc, location)
+    if table_idx < 0:
+        return body.Paragraphs.get_Item(para_idx)
+    cell = (
+        body.Tables.get_Item(table_idx)
+        .Rows.get_Item(row_idx)
+        .Cells.get_Item(cell_idx)
+    )
+    return cell.Paragraphs.get_Item(para_idx)
+
+
+def _scan_template(
+    doc: Document, pattern: "re.Pattern", row_pattern: "re.Pattern" = None
+) -> List[Tuple[tuple, Any, list, list]]:
+    """单次遍历文档，记录包含变量的段落及其匹配结果
+
+    Args:
+        doc: Document 对象
+        pattern: 变量匹配正则
+        row_pattern: 循环变量匹配正则，None 表示不查找循环变量
+
+    Returns:
+        List[Tuple[位置, 段落, 匹配列表, 循环变量匹配列表]]:
+        仅包含至少有一个变量的段落
+    """
+    located = []
+    for location, paragraph in _iter_template_paragraphs(doc):
+        text = paragraph.Text
+        if not text:
+            continue
+        matches = list(pattern.finditer(text))
+        row_matches = list(row_pattern.finditer(text)) if row_pattern else []
+        if matches or row_matches:
+            located.append((location, paragraph, matches, row_matches))
+    return located
+
+
+def _find_leftover_placeholders(
+    doc: Document, pattern: "re.Pattern", scanned: list
+) -> List[Tuple[str, str, str]]:
+    """查找逐段遍历未覆盖的容器（嵌套表格、文本框、形状）中的变量
+
+    比较全文和已扫描段落中每个变量的出现次数，多出的即为剩余变量。
+
+    Args:
+        doc: Document 对象
+        pattern: 变量匹配正则
+        scanned: _scan_template 的结果
+
+    Returns:
+        List[Tuple[完整变量, 变量名, 默认值]]: 每次出现一项，通常为空
+    """
+    counts = Counter(match.group(0) for match in pattern.finditer(doc.GetText()))
+    counts.subtract(
+        match.group(0) for _, _, matches, _ in scanned for match in matches
+    )
+    leftovers = []
+    for full_var, count in counts.items():
+        if count > 0:
+            match = pattern.fullmatch(full_var)
+            leftovers.extend([(full_var, match.group(1), match.group(2) or "")] * count)
+    return leftovers
+
+
+def _replace_leftovers(doc: Document, replacements: Dict[str, str]) -> None:
+    """全文替换剩余变量（见 _find_leftover_placeholders）"""
+    for full_var, value in replacements.items():
+        doc.Replace(full_var, value, False, False)
+
+
+def _collect_row_loops(
+    located: List[Tuple[tuple, Any, list, list]],
+    pattern: "re.Pattern",
+    row_pattern: "re.Pattern",
+) -> Tuple[list, list]:
+    """将 _scan_template 的结果分为普通段落和循环行
+
+    包含循环变量（如 ${items[].name}）的表格行是循环行，行内所有含变量
+    的段落都归入该行，按相对行的位置记录文本块布局，复制出的每一行
+    共用同一份布局。
+
+    Args:
+        located: _scan_template 的结果
+        pattern: 变量匹配正则
+        row_pattern: 循环变量匹配正则
+
+    Returns:
+        Tuple[普通段落列表, 循环行列表]:
+        普通段落为 [(位置, 段落, 匹配列表), ...]；循环行为
+        [(行位置, 列表名, 布局, 普通变量, 循环变量), ...]，行位置为
+        (节, 页眉页脚类型, 表格, 行)，布局为
+        [(列, 段落, 文本块索引, 文本块文本, 变量偏移), ...]
+
+    Raises:
+        VariableSyntaxError: 循环变量不在表格中，或一行引用了多个列表
+    """
+    loops = {}
+    for location, paragraph, _, row_matches in located:
+        if not row_matches:
+            continue
+        if location[2] < 0:
+            raise VariableSyntaxError(
+                f"循环变量 {row_matches[0].group(0)} 必须位于表格行中"
+            )
+        list_names = {loop[1] for loop in loops.get(location[:4], ())}
+        list_names.update(match.group(1) for match in row_matches)
+        if len(list_names) > 1:
+            raise VariableSyntaxError(
+                f"同一表格行只能循环一个列表: {', '.join(sorted(list_names))}"
+            )
+        loops.setdefault(location[:4], []).append((location, row_matches[0].group(1)))
+
+    plain = []
+    rows = {row_key: (entries[0][1], [], [], {}) for row_key, entries in loops.items()}
+    for location, paragraph, matches, row_matches in located:
+        row = rows.get(location[:4])
+        if row is None:
+            plain.append((location, paragraph, matches))
+            continue
+
+        _, layout, scalar_placeholders, row_placeholders = row
+        scalar_placeholders.extend(
+            (match.group(0), match.group(1), match.group(2) or "") for match in matches
+        )
+        for match in row_matches:
+            row_placeholders.setdefault(
+                match.group(0),
+                (match.group(0), match.group(1), match.group(2), match.group(3) or ""),
+            )
+        run_indices, _, texts = _get_paragraph_runs(paragraph)
+        spans = sorted(
+            _find_run_spans(texts, pattern) + _find_run_spans(texts, row_pattern)
+        )
+        if spans:
+            layout.append((location[4], location[5], run_indices, texts, spans))
+
+    row_loops = [
+        (row_key, list_name, layout, scalar_placeholders, list(row_placeholders.values()))
+        for row_key, (list_name, layout, scalar_placeholders, row_placeholders) in rows.items()
+    ]
+    return plain, row_loops
+
+
+def _expand_row(table, row_idx: int, layout: list, row_replacements: List[Dict[str, str]]) -> None:
+    """将模板行复制为每个列表元素一行，并按布局替换变量
+
+    先保留一份未替换的模板行副本，每个元素复制一次并批量插入到模板行
+    之后；列表为空时删除模板行。
+
+    Args:
+        table: Spire.Doc Table 对象
+        row_idx: 模板行索引（从0开始）
+        layout: 行内文本块布局 [(列, 段落, 文本块索引, 文本块文本, 变量偏移), ...]
+        row_replacements: 每个元素的 {完整变量: 替换文本}
+    """
+    rows = table.Rows
+    template_row = rows.get_Item(row_idx)
+    if not row_replacements:
+        rows.Remove(template_row)
+        return
+
+    prototype = template_row.Clone() if len(row_replacements) > 1 else None
+    for item_idx, replacements in enumerate(row_replacements):
+        if item_idx == 0:
+            row = template_row
+        else:
+            row = prototype.Clone()
+            rows.Insert(row_idx + item_idx, row)
+
+        cells = row.Cells
+        for cell_idx, para_idx, run_indices, texts, spans in layout:
+            new_texts, replaced = _substitute_runs(texts, spans, replacements)
+            if not replaced:
+                continue
+            children = cells.get_Item(cell_idx).Paragraphs.get_Item(para_idx).ChildObjects
+            for child_idx, old_text, new_text in zip(run_indices, texts, new_texts):
+                if new_text != old_text:
+                    children.get_Item(child_idx).Text = new_text
+
+
+def _get_paragraph_runs(paragraph) -> Tuple[List[int], list, List[str]]:
+    """获取段落中的文本块（TextRange）
+
+    Args:
+        paragraph: Spire.Doc Paragraph 对象
+
+    Returns:
+        Tuple[子对象索引列表, 文本块列表, 文本列表]
+    """
+    indices = []
+    runs = []
+    texts = []
+    for child_idx in range(paragraph.ChildObjects.Count):
+        child = paragraph.ChildObjects.get_Item(child_idx)
+        if child.DocumentObjectType != DocumentObjectType.TextRange:
+            continue
+        indices.append(child_idx)
+        runs.append(child)
+        texts.append(child.Text or "")
+    return indices, runs, texts
+
+
+def _rewrite_paragraph(paragraph, pattern: "re.Pattern", replacements: Dict[str, str]) -> int:
+    """在段落内一次性替换所有变量
+
+    Args:
+        paragraph: Spire.Doc Paragraph 对象
+        pattern: 变量匹配正则
+        replacements: {完整变量: 替换文本}，不在其中的变量保持原样
+
+    Returns:
+        int: 实际替换的占位符数量
+    """
+    _, runs, texts = _get_paragraph_runs(paragraph)
+    if not runs:
+        return 0
+
+    new_texts, replaced = _substitute_runs(
+        texts, _find_run_spans(texts, pattern), replacements
+    )
+    for run, old_text, new_text in zip(runs, texts, new_texts):
+        if new_text != old_text:
+            run.Text = new_text
+
+    return replaced
+
+
 def fill_template(
     doc: Document,
     data: Dict[str, Any],
@@ -871,10 +1360,20 @@ def fill_template(
 ) -> Dict[str, Any]:
     """批量替换模板变量
 
+    单次遍历文档定位所有包含变量的段落，再用一个组合正则在这些段落内
+    一次性完成全部替换，耗时不随变量个数增长。逐段遍历覆盖正文、正文
+    表格和页眉页脚；嵌套表格、文本框、形状中的普通变量通过全文替换处理
+    （循环变量只支持正文和页眉页脚中的表格行）。
+
+    表格行中的循环变量 ${列表名[].字段名} 将该行标记为循环行：行按
+    data[列表名] 的每个元素复制一次，行内的循环变量替换为元素的字段值，
+    普通变量照常替换；列表为空时删除该行。
+
     Args:
         doc: Document 对象
-        data: 变量数据字典
-        missing_var_action: 缺失变量处理方式 ("error" | "ignore" | "empty")
+        data: 变量数据字典；循环行的数据为字典列表（或具有同名属性的对象列表）
+        missing_var_action: 缺失变量处理方式 ("error" | "ignore" | "empty")，
+            同样适用于缺失的列表和字段（"ignore" 保留模板行，"empty" 删除模板行）
         placeholder_prefix: 变量前缀
         placeholder_suffix: 变量后缀
 
@@ -883,79 +1382,86 @@ def fill_template(
 
     Raises:
         VariableNotFoundError: 变量未找到时
+        VariableSyntaxError: 循环变量不在表格行中，或一行引用了多个列表
+        ValidationError: 循环变量的数据不是列表
         FillError: 填充失败时
 
     Examples:
         >>> fill_template(doc, {"name": "张三", "age": "25"})
         >>> fill_template(doc, data, missing_var_action="ignore")
+
+        >>> # 模板行: | ${items[].name} | ${items[].amount} |
+        >>> fill_template(doc, {"items": [{"name": "设备费", "amount": 50000}]})
     """
+    modified = False
     try:
         stats = {"total": 0, "replaced": 0, "missing": []}
-        replacements = {}
+        pattern = _compile_var_pattern(placeholder_prefix, placeholder_suffix)
+        row_pattern = _compile_row_var_pattern(placeholder_prefix, placeholder_suffix)
 
-        # 遍历文档收集变量
-        for section_idx in range(doc.Sections.Count):
-            section = doc.Sections.get_Item(section_idx)
+        # 单次遍历收集变量所在段落，并分出循环行
+        scanned = _scan_template(doc, pattern, row_pattern)
+        stats["total"] = sum(
+            len(matches) + len(row_matches) for _, _, matches, row_matches in scanned
+        )
+        located, row_loops = _collect_row_loops(scanned, pattern, row_pattern)
+        placeholders = [
+            (match.group(0), match.group(1), match.group(2) or "")
+            for _, _, matches in located
+            for match in matches
+        ]
+
+        leftovers = _find_leftover_placeholders(doc, pattern, scanned)
+        stats["total"] += len(leftovers)
+
+        # 解析替换值（在修改文档前完成，缺失变量报错时文档保持不变）
+        replacements = _resolve_replacements(
+            placeholders, data, missing_var_action, stats
+        )
+        leftover_replacements = _resolve_replacements(
+            leftovers, data, missing_var_action, stats
+        )
+        expansions = []
+        for row_key, list_name, layout, scalar_placeholders, row_placeholders in row_loops:
+            items = _resolve_row_items(list_name, data, missing_var_action, stats)
+            if items is None:
+                continue
+            base = _resolve_replacements(
+                scalar_placeholders, data, missing_var_action, stats
+            )
+            row_replacements = _resolve_row_replacements(
+                row_placeholders, items, base, missing_var_action, stats
+            )
+            expansions.append((row_key, layout, row_replacements))
+            if row_replacements:
+                stats["replaced"] += len(row_replacements[0])
 
-            # 段落
-            for para_idx in range(section.Paragraphs.Count):
-                paragraph = section.Paragraphs.get_Item(para_idx)
-                matches = _find_variables(
-                    paragraph.Text, placeholder_prefix, placeholder_suffix
-                )
-                stats["total"] += len(matches)
-                for full_var, var_name, default_val in matches:
-                    if full_var in replacements:
-                        continue
-                    if var_name in data:
-                        replacements[full_var] = str(data[var_name])
-                    elif default_val:
-                        replacements[full_var] = default_val
-                    elif missing_var_action == "error":
-                        stats["missing"].append(var_name)
-                        raise VariableNotFoundError(var_name, list(data.keys()))
-                    elif missing_var_action == "empty":
-                        replacements[full_var] = ""
-
-            # 表格
-            for table_idx in range(section.Tables.Count):
-                table = section.Tables.get_Item(table_idx)
-                for row_idx in range(table.Rows.Count):
-                    row = table.Rows.get_Item(row_idx)
-                    for cell_idx in range(row.Cells.Count):
-                        cell = row.Cells.get_Item(cell_idx)
-                        for para_idx in range(cell.Paragraphs.Count):
-                            paragraph = cell.Paragraphs.get_Item(para_idx)
-                            matches = _find_variables(
-                                paragraph.Text, placeholder_prefix, placeholder_suffix
-                            )
-                            stats["total"] += len(matches)
-                            for full_var, var_name, default_val in matches:
-                                if full_var in replacements:
-                                    continue
-                                if var_name in data:
-                                    replacements[full_var] = str(data[var_name])
-                                elif default_val:
-                                    replacements[full_var] = default_val
-                                elif missing_var_action == "error":
-                                    stats["missing"].append(var_name)
-                                    raise VariableNotFoundError(
-                                        var_name, list(data.keys())
-                                    )
-                                elif missing_var_action == "empty":
-                                    replacements[full_var] = ""
-
-        # 执行替换
-        for full_var, value in replacements.items():
-            replace_all(doc, full_var, value)
-            stats["replaced"] += 1
+        modified = bool(replacements or leftover_replacements or expansions)
+
+        # 仅改写包含变量的段落
+        if replacements:
+            for _, paragraph, _ in located:
+                _rewrite_paragraph(paragraph, pattern, replacements)
+
+        # 从后往前展开循环行，前面各行的索引不受影响
+        for row_key, layout, row_replacements in reversed(expansions):
+            table = _get_body_at(doc, row_key).Tables.get_Item(row_key[2])
+            _expand_row(table, row_key[3], layout, row_replacements)
+
+        _replace_leftovers(doc, leftover_replacements)
+
+        stats["replaced"] += len(replacements.keys() | leftover_replacements.keys())
 
         return stats
 
-    except VariableNotFoundError:
+    except (VariableNotFoundError, VariableSyntaxError, ValidationError):
         raise
     except Exception as e:
         raise FillError(f"填充模板失败: {e}")
+    finally:
+        # 改写中途出错时文档可能已部分修改，同样丢弃索引
+        if modified:
+            invalidate_index(doc)
 
 
 def extract_template_vars(
@@ -967,8 +1473,11 @@ def extract_template_vars(
 ) -> List[str]:
     """提取模板中的所有变量
 
+    循环变量（如 ${items[].name}）记为其列表名（items）。
+
     Args:
-        doc: Document 对象
+        doc: Document 对象、CompiledTemplate（使用编译时的前缀/后缀，无需扫描文档）
+            或 DocxReader（直接解析 XML，无需加载 Spire.Doc）
         placeholder_prefix: 变量前缀
         placeholder_suffix: 变量后缀
         unique: 是否去重
@@ -979,34 +1488,28 @@ def extract_template_vars(
     Examples:
         >>> vars = extract_template_vars(doc)
         >>> vars = extract_template_vars(doc, unique=False)
+        >>> vars = extract_template_vars(compile_template("template.docx"))
+        >>> vars = extract_template_vars(DocxReader("template.docx"))
     """
+    from .template import CompiledTemplate
+
+    if isinstance(doc, CompiledTemplate):
+        return doc.extract_vars(unique=unique)
+    if isinstance(doc, DocxReader):
+        return doc.extract_template_vars(
+            placeholder_prefix=placeholder_prefix,
+            placeholder_suffix=placeholder_suffix,
+            unique=unique,
+        )
+
     try:
-        all_vars = []
-
-        for section_idx in range(doc.Sections.Count):
-            section = doc.Sections.get_Item(section_idx)
-
-            # 段落
-            for para_idx in range(section.Paragraphs.Count):
-                paragraph = section.Paragraphs.get_Item(para_idx)
-                for _, var_name, _ in _find_variables(
-                    paragraph.Text, placeholder_prefix, placeholder_suffix
-                ):
-                    all_vars.append(var_name)
-
-            # 表格
-            for table_idx in range(section.Tables.Count):
-                table = section.Tables.get_Item(table_idx)
-                for row_idx in range(table.Rows.Count):
-                    row = table.Rows.get_Item(row_idx)
-                    for cell_idx in range(row.Cells.Count):
-                        cell = row.Cells.get_Item(cell_idx)
-                        for para_idx in range(cell.Paragraphs.Count):
-                            paragraph = cell.Paragraphs.get_Item(para_idx)
-                            for _, var_name, _ in _find_variables(
-                                paragraph.Text, placeholder_prefix, placeholder_suffix
-                            ):
-                                all_vars.append(var_name)
+        pattern = _compile_var_pattern(placeholder_prefix, placeholder_suffix)
+        row_pattern = _compile_row_var_pattern(placeholder_prefix, placeholder_suffix)
+        all_vars = [
+            var_name
+            for _, _, matches, row_matches in _scan_template(doc, pattern, row_pattern)
+            for var_name in _ordered_var_names(matches, row_matches)
+        ]
 
         if unique:
             seen = set()
@@ -1033,7 +1536,7 @@ def validate_template_data(
     """验证模板数据是否完整
 
     Args:
-        doc: Document 对象
+        doc: Document 对象或 CompiledTemplate（使用编译时的前缀/后缀，无需扫描文档）
         data: 变量数据字典
         placeholder_prefix: 变量前缀
         placeholder_suffix: 变量后缀
@@ -1045,6 +1548,11 @@ def validate_template_data(
         >>> result = validate_template_data(doc, {"name": "张三"})
         >>> result["is_valid"]
     """
+    from .template import CompiledTemplate
+
+    if isinstance(doc, CompiledTemplate):
+        return doc.validate(data)
+
     try:
         required_vars = set(
             extract_template_vars(
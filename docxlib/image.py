@@ -0,0 +1,659 @@
+"""
+DocxLib 图片缓存模块
+
+按内容哈希缓存图片的像素尺寸和一份落盘副本，供 fill_image 等函数在
+多次填充、多个文档之间复用：同一张图片只探测一次尺寸、只写一次临时文件。
+缓存按字节数做 LRU 淘汰。像素尺寸只解析文件头获取，不依赖 PIL。
+"""
+
+import hashlib
+import io
+import math
+import os
+import shutil
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Tuple, Union
+
+from .errors import FillError, ValidationError
+
+# 图片格式：(文件头, 扩展名, 内容类型)
+_IMAGE_SIGNATURES = (
+    (b"\x89PNG\r\n\x1a\n", "png", "image/png"),
+    (b"\xff\xd8\xff", "jpeg", "image/jpeg"),
+    (b"GIF87a", "gif", "image/gif"),
+    (b"GIF89a", "gif", "image/gif"),
+    (b"BM", "bmp", "image/bmp"),
+)
+
+# 默认缓存容量（字节）
+DEFAULT_IMAGE_CACHE_BYTES = 64 * 1024 * 1024
+
+# 默认 JPEG 重新压缩质量
+DEFAULT_IMAGE_QUALITY = 85
+
+# 1 磅 = 1/72 英寸；未指定尺寸时像素按 96 DPI 换算为磅
+_POINTS_PER_INCH = 72.0
+_POINTS_PER_PIXEL = 72.0 / 96.0
+
+# 文件路径 -> 内容哈希 的映射上限（按 路径+修改时间+大小 记录，命中时无需读取文件）
+_MAX_PATH_ENTRIES = 4096
+
+
+def _sniff_format(data: bytes) -> Union[Tuple[str, str], None]:
+    """根据文件头识别图片格式
+
+    Args:
+        data: 图片字节数据
+
+    Returns:
+        Tuple[扩展名, 内容类型]，无法识别时返回 None
+    """
+    for signature, extension, content_type in _IMAGE_SIGNATURES:
+        if data.startswith(signature):
+            return extension, content_type
+    return None
+
+
+# 像素尺寸探测时读取的最大字节数（JPEG 的 SOF 段可能位于较大的 EXIF 段之后）
+_MAX_PROBE_BYTES = 4 * 1024 * 1024
+
+# 不带长度字段的 JPEG 标记（TEM、RST0-7、SOI、EOI）
+_JPEG_STANDALONE_MARKERS = frozenset([0x01, *range(0xD0, 0xDA)])
+
+# JPEG 帧起始标记（SOF0-15，不含 DHT/JPG/DAC）
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _png_size(header: bytes) -> Union[Tuple[int, int], None]:
+    """从 PNG 的 IHDR 块读取尺寸"""
+    if len(header) < 24 or header[12:16] != b"IHDR":
+        return None
+    return int.from_bytes(header[16:20], "big"), int.from_bytes(header[20:24], "big")
+
+
+def _gif_size(header: bytes) -> Union[Tuple[int, int], None]:
+    """从 GIF 的逻辑屏幕描述符读取尺寸"""
+    if len(header) < 10:
+        return None
+    return int.from_bytes(header[6:8], "little"), int.from_bytes(header[8:10], "little")
+
+
+def _bmp_size(header: bytes) -> Union[Tuple[int, int], None]:
+    """从 BMP 的 DIB 头读取尺寸（高度为负表示自上而下存储）"""
+    if len(header) < 26:
+        return None
+    dib_size = int.from_bytes(header[14:18], "little")
+    if dib_size == 12:
+        # BITMAPCOREHEADER：16 位无符号宽高
+        return int.from_bytes(header[18:20], "little"), int.from_bytes(header[20:22], "little")
+    width = int.from_bytes(header[18:22], "little", signed=True)
+    height = int.from_bytes(header[22:26], "little", signed=True)
+    return abs(width), abs(height)
+
+
+def _jpeg_size(read_at) -> Union[Tuple[int, int], None]:
+    """逐段跳过 JPEG 标记，从第一个 SOF 段读取尺寸
+
+    Args:
+        read_at: 函数 read_at(offset, size) -> bytes，只读取需要的段头
+    """
+    offset = 2
+    while offset < _MAX_PROBE_BYTES:
+        marker = read_at(offset, 2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            return None
+        code = marker[1]
+        if code == 0xFF:
+            # 填充字节
+            offset += 1
+            continue
+        if code in _JPEG_STANDALONE_MARKERS:
+            offset += 2
+            continue
+        if code in _JPEG_SOF_MARKERS:
+            segment = read_at(offset + 4, 5)
+            if len(segment) < 5:
+                return None
+            height = int.from_bytes(segment[1:3], "big")
+            width = int.from_bytes(segment[3:5], "big")
+            return (width, height) if width and height else None
+        if code == 0xDA:
+            # 扫描数据开始仍未出现 SOF
+            return None
+        length = read_at(offset + 2, 2)
+        if len(length) < 2:
+            return None
+        offset += 2 + int.from_bytes(length, "big")
+    return None
+
+
+def _probe_size(header: bytes, read_at) -> Union[Tuple[int, int], None]:
+    """根据文件头选择探测方式"""
+    if header.startswith(b"\x89PNG\r\n\x1a\n"):
+        return _png_size(header)
+    if header.startswith(b"\xff\xd8"):
+        return _jpeg_size(read_at)
+    if header.startswith((b"GIF87a", b"GIF89a")):
+        return _gif_size(header)
+    if header.startswith(b"BM"):
+        return _bmp_size(header)
+    return None
+
+
+def get_image_size(source: Union[str, bytes, Path, memoryview]) -> Union[Tuple[int, int], None]:
+    """只读取文件头获取图片像素尺寸
+
+    支持 PNG、JPEG、GIF、BMP，不依赖 PIL，也不解码图片数据。
+    JPEG 仅读取各段的段头，直到第一个帧起始（SOF）段。
+
+    Args:
+        source: 图片文件路径（str/Path）或数据（bytes/bytearray/memoryview）
+
+    Returns:
+        Tuple[宽, 高]（像素），格式无法识别或文件头不完整时返回 None
+
+    Raises:
+        FillError: 图片文件不存在或读取失败
+        ValueError: 不支持的源类型
+
+    Examples:
+        >>> get_image_size("logo.png")
+        (200, 80)
+        >>> get_image_size(open("photo.jpg", "rb").read())
+        (1920, 1080)
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        data = memoryview(source).cast("B") if isinstance(source, memoryview) else source
+
+        def read_at(offset, size):
+            return bytes(data[offset:offset + size])
+
+        return _probe_size(read_at(0, 32), read_at)
+
+    if not isinstance(source, (str, Path)):
+        raise ValueError(f"不支持的源类型: {type(source)}")
+
+    try:
+        with open(source, "rb") as f:
+
+            def read_at(offset, size):
+                f.seek(offset)
+                return f.read(size)
+
+            return _probe_size(f.read(32), read_at)
+    except OSError as e:
+        raise FillError(f"读取图片失败: {e}")
+
+
+def _image_size_px(data: bytes) -> Union[Tuple[int, int], None]:
+    """获取图片像素尺寸：优先解析文件头，其他格式再尝试 PIL（可选依赖）"""
+    size = get_image_size(data)
+    if size:
+        return size
+    try:
+        from PIL import Image as PILImage
+    except ImportError:
+        return None
+    try:
+        with PILImage.open(io.BytesIO(data)) as pil_image:
+            return pil_image.size
+    except Exception:
+        return None
+
+
+def _display_size(
+    width: float,
+    height: float,
+    maintain_ratio: bool,
+    width_px: int = None,
+    height_px: int = None,
+) -> Tuple[Union[float, None], Union[float, None]]:
+    """计算图片显示尺寸（磅），规则与 fill_image 相同
+
+    Args:
+        width: 指定宽度（磅），None 表示按原图或比例计算
+        height: 指定高度（磅），None 表示按原图或比例计算
+        maintain_ratio: 只指定一边时是否保持宽高比
+        width_px: 原图像素宽度
+        height_px: 原图像素高度
+
+    Returns:
+        Tuple[宽, 高]（磅），原图尺寸未知且未指定时对应项为 None
+    """
+    if width_px and height_px:
+        original_width = width_px * _POINTS_PER_PIXEL
+        original_height = height_px * _POINTS_PER_PIXEL
+    else:
+        original_width = original_height = None
+
+    if width is None and height is None:
+        return original_width, original_height
+    if width is None:
+        if maintain_ratio and original_width and original_height:
+            return original_width * (height / original_height), height
+        return original_width, height
+    if height is None:
+        if maintain_ratio and original_width and original_height:
+            return width, original_height * (width / original_width)
+        return width, original_height
+    return width, height
+
+
+def _validate_resample_options(max_dpi: float, target_quality: int) -> None:
+    """检查缩放参数并确认已安装 Pillow
+
+    Raises:
+        ValidationError: 参数无效或未安装 Pillow
+    """
+    if max_dpi is not None and max_dpi <= 0:
+        raise ValidationError(f"max_dpi 必须大于 0: {max_dpi}")
+    if target_quality is not None and not 1 <= target_quality <= 95:
+        raise ValidationError(f"target_quality 必须在 1-95 之间: {target_quality}")
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        raise ValidationError("缩放或重新压缩图片需要安装 Pillow")
+
+
+def _resample(data: bytes, size: Tuple[int, int], quality: int, recompress: bool) -> bytes:
+    """使用 PIL 缩放并重新编码图片
+
+    JPEG 原图输出 JPEG；其他格式在 recompress 为 True 且不含透明通道时
+    输出 JPEG，否则输出 PNG（保留印章等图片的透明背景）。
+
+    Args:
+        data: 原图字节数据
+        size: 目标像素尺寸
+        quality: JPEG 压缩质量
+        recompress: 是否允许将无透明通道的图片转为 JPEG
+
+    Returns:
+        bytes: 编码后的图片数据
+    """
+    from PIL import Image as PILImage
+
+    with PILImage.open(io.BytesIO(data)) as pil_image:
+        pil_image.load()
+        has_alpha = pil_image.mode in ("RGBA", "LA", "PA") or "transparency" in pil_image.info
+        use_jpeg = pil_image.format == "JPEG" or (recompress and not has_alpha)
+        if pil_image.size != size:
+            pil_image = pil_image.resize(size, PILImage.LANCZOS)
+        output = io.BytesIO()
+        if use_jpeg:
+            if pil_image.mode != "RGB":
+                pil_image = pil_image.convert("RGB")
+            pil_image.save(output, "JPEG", quality=quality, optimize=True)
+        else:
+            pil_image.save(output, "PNG", optimize=True)
+        return output.getvalue()
+
+
+class CachedImage:
+    """缓存中的一张图片
+
+    Attributes:
+        digest: 缓存键（原图为内容的 SHA-256 十六进制，缩放结果附加目标尺寸和质量）
+        nbytes: 图片字节数
+        width_px: 像素宽度，无法获取时为 None
+        height_px: 像素高度，无法获取时为 None
+        extension: 扩展名（png / jpeg / gif / bmp），无法识别时为 None
+        content_type: 内容类型（如 image/png），无法识别时为 None
+        path: 缓存目录中的图片副本路径
+    """
+
+    __slots__ = (
+        "digest",
+        "nbytes",
+        "width_px",
+        "height_px",
+        "extension",
+        "content_type",
+        "path",
+    )
+
+    def __init__(self, digest: str, data: bytes, path: str):
+        self.digest = digest
+        self.nbytes = len(data)
+        size = _image_size_px(data)
+        self.width_px, self.height_px = size if size else (None, None)
+        image_format = _sniff_format(data)
+        self.extension, self.content_type = image_format if image_format else (None, None)
+        self.path = path
+
+    def read_bytes(self) -> bytes:
+        """读取图片字节数据"""
+        return Path(self.path).read_bytes()
+
+    def __repr__(self) -> str:
+        return (
+            f"<CachedImage {self.digest[:12]} {self.width_px}x{self.height_px} "
+            f"{self.nbytes} bytes>"
+        )
+
+
+class ImageCache:
+    """按内容哈希缓存图片的 LRU 缓存
+
+    每张图片（按内容去重）只解码一次尺寸，并在缓存目录中保存一份副本，
+    供 Spire.Doc 按路径插入。缓存总字节数超过 max_bytes 时淘汰最久未使用
+    的图片并删除其副本。缓存目录在缓存对象释放或进程退出时删除。
+
+    在 pinned() 块内获取的条目不会被淘汰，块结束后才按容量补做淘汰，
+    需要在获取后继续使用副本路径时应在该块内完成。
+
+    Examples:
+        >>> cache = ImageCache(max_bytes=16 * 1024 * 1024)
+        >>> image = cache.get("seal.png")
+        >>> image.width_px, image.height_px
+        (300, 300)
+        >>> cache.stats()["hits"]
+        0
+
+        >>> with cache.pinned():
+        ...     paragraph.AppendPicture(cache.get("seal.png").path)
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_IMAGE_CACHE_BYTES):
+        """
+        Args:
+            max_bytes: 缓存容量（字节），0 表示不保留任何图片
+        """
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, CachedImage]" = OrderedDict()
+        self._path_digests: "OrderedDict[tuple, str]" = OrderedDict()
+        self._total_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._pins: Dict[str, int] = {}
+        self._local = threading.local()
+        self._lock = threading.RLock()
+        self._directory = None
+        self._finalizer = None
+
+    def _get_directory(self) -> str:
+        """首次写入时创建缓存目录"""
+        if self._directory is None:
+            self._directory = tempfile.mkdtemp(prefix="docxlib-images-")
+            self._finalizer = weakref.finalize(
+                self, shutil.rmtree, self._directory, True
+            )
+        return self._directory
+
+    @contextmanager
+    def pinned(self) -> Iterator["ImageCache"]:
+        """在块内固定当前线程获取的条目，保证其副本路径在块结束前可用
+
+        Yields:
+            ImageCache: 缓存本身
+
+        Examples:
+            >>> cache = get_image_cache()
+            >>> with cache.pinned():
+            ...     image = cache.get("photo.jpg")
+            ...     photo = cache.get_resampled("photo.jpg", 80, 100, max_dpi=150)
+            ...     paragraph.AppendPicture(image.path)
+        """
+        frames = self._local.__dict__.setdefault("frames", [])
+        frame = set()
+        frames.append(frame)
+        try:
+            yield self
+        finally:
+            frames.pop()
+            with self._lock:
+                for key in frame:
+                    count = self._pins[key] - 1
+                    if count:
+                        self._pins[key] = count
+                    else:
+                        del self._pins[key]
+                self._evict()
+
+    def _pin(self, key: str) -> None:
+        """在当前线程最内层的 pinned() 块中固定条目（调用方持有锁）"""
+        frames = getattr(self._local, "frames", None)
+        if frames and key not in frames[-1]:
+            frames[-1].add(key)
+            self._pins[key] = self._pins.get(key, 0) + 1
+
+    def get(self, source: Union[str, bytes, Path]) -> CachedImage:
+        """获取图片的缓存条目，未命中时读取并缓存
+
+        Args:
+            source: 图片文件路径（str/Path）或字节数据（bytes）
+
+        Returns:
+            CachedImage: 缓存条目
+
+        Raises:
+            FillError: 图片文件不存在或读取失败
+            ValueError: 不支持的源类型
+        """
+        if isinstance(source, (str, Path)):
+            return self._get_path(Path(source))
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            data = bytes(source)
+            return self._get_data(hashlib.sha256(data).hexdigest(), data)
+        raise ValueError(f"不支持的源类型: {type(source)}")
+
+    def _get_path(self, file_path: Path) -> CachedImage:
+        """按文件路径获取缓存条目（路径、修改时间和大小不变时无需读取文件）"""
+        try:
+            stat = file_path.stat()
+        except OSError:
+            raise FillError(f"图片文件不存在: {file_path}")
+        if not file_path.is_file():
+            raise FillError(f"图片文件不存在: {file_path}")
+
+        key = (str(file_path.resolve()), stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            digest = self._path_digests.get(key)
+            if digest is not None and digest in self._entries:
+                self._path_digests.move_to_end(key)
+                return self._hit(digest)
+
+        try:
+            data = file_path.read_bytes()
+        except OSError as e:
+            raise FillError(f"读取图片失败: {e}")
+
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            self._path_digests[key] = digest
+            self._path_digests.move_to_end(key)
+            while len(self._path_digests) > _MAX_PATH_ENTRIES:
+                self._path_digests.popitem(last=False)
+        return self._get_data(digest, data)
+
+    def get_resampled(
+        self,
+        source: Union[str, bytes, Path],
+        width: float,
+        height: float,
+        max_dpi: float = None,
+        target_quality: int = None,
+    ) -> CachedImage:
+        """获取按显示尺寸缩放（并可重新压缩）后的图片，结果按 (内容哈希, 目标尺寸) 缓存
+
+        Args:
+            source: 图片文件路径（str/Path）或字节数据（bytes）
+            width: 显示宽度（磅）
+            height: 显示高度（磅）
+            max_dpi: 显示尺寸下的最大分辨率，超过时缩小图片；None 表示不缩放
+            target_quality: JPEG 压缩质量（1-95），指定时无透明通道的
+                PNG/BMP/GIF 也转为 JPEG；None 表示使用默认质量且保持格式
+
+        Returns:
+            CachedImage: 处理后的图片；无需处理（或处理后反而更大）时返回原图条目
+
+        Raises:
+            FillError: 图片文件不存在或读取失败
+            ValidationError: 参数无效或未安装 Pillow
+
+        Examples:
+            >>> cache = get_image_cache()
+            >>> photo = cache.get_resampled("photo.jpg", 80, 100, max_dpi=200)
+            >>> photo.width_px, photo.height_px
+            (223, 278)
+        """
+        _validate_resample_options(max_dpi, target_quality)
+        with self.pinned():
+            return self._get_resampled(source, width, height, max_dpi, target_quality)
+
+    def _get_resampled(self, source, width, height, max_dpi, target_quality) -> CachedImage:
+        """get_resampled 的实现，原图条目在读取期间保持固定"""
+        original = self.get(source)
+        if not (original.width_px and original.height_px and original.extension):
+            return original
+
+        size = (original.width_px, original.height_px)
+        if max_dpi is not None and width and height:
+            # 只缩小不放大
+            size = (
+                min(size[0], max(1, math.ceil(width / _POINTS_PER_INCH * max_dpi))),
+                min(size[1], max(1, math.ceil(height / _POINTS_PER_INCH * max_dpi))),
+            )
+        if size == (original.width_px, original.height_px) and target_quality is None:
+            return original
+
+        quality = target_quality if target_quality is not None else DEFAULT_IMAGE_QUALITY
+        key = f"{original.digest}-{size[0]}x{size[1]}-q{quality}"
+        with self._lock:
+            if key in self._entries:
+                return self._hit(key)
+
+        source_data = original.read_bytes()
+        try:
+            data = _resample(source_data, size, quality, target_quality is not None)
+        except Exception as e:
+            raise FillError(f"缩放图片失败: {e}")
+        if len(data) >= len(source_data):
+            data = source_data
+        return self._get_data(key, data)
+
+    def _hit(self, key: str) -> CachedImage:
+        """记录命中并返回条目（调用方持有锁）"""
+        self._entries.move_to_end(key)
+        self._hits += 1
+        self._pin(key)
+        return self._entries[key]
+
+    def _get_data(self, key: str, data: bytes) -> CachedImage:
+        """按缓存键获取条目，未命中时探测尺寸并写入副本"""
+        with self._lock:
+            if key in self._entries:
+                return self._hit(key)
+
+            self._misses += 1
+            image_format = _sniff_format(data)
+            suffix = f".{image_format[0]}" if image_format else ".img"
+            path = os.path.join(self._get_directory(), key + suffix)
+            try:
+                with open(path, "wb") as f:
+                    f.write(data)
+            except OSError as e:
+                raise FillError(f"写入图片缓存失败: {e}")
+
+            entry = CachedImage(key, data, path)
+            self._entries[key] = entry
+            self._total_bytes += entry.nbytes
+            self._pin(key)
+            self._evict(keep=key)
+            return entry
+
+    def _evict(self, keep: str = None) -> None:
+        """淘汰最久未使用的条目，直到总字节数不超过容量（调用方持有锁）
+
+        Args:
+            keep: 本次刚加入的条目，即使超过容量也保留到下次淘汰，
+                以保证返回的副本路径可用
+        """
+        for digest in list(self._entries):
+            if self._total_bytes <= self.max_bytes:
+                break
+            # 固定中的条目副本仍在使用，留到 pinned() 块结束后再淘汰
+            if digest == keep or digest in self._pins:
+                continue
+            entry = self._entries.pop(digest)
+            self._total_bytes -= entry.nbytes
+            self._evictions += 1
+            try:
+                os.unlink(entry.path)
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        """清空缓存并删除所有副本（固定中的条目保留到 pinned() 块结束）"""
+        with self._lock:
+            for digest in list(self._entries):
+                if digest in self._pins:
+                    continue
+                entry = self._entries.pop(digest)
+                self._total_bytes -= entry.nbytes
+                try:
+                    os.unlink(entry.path)
+                except OSError:
+                    pass
+            self._path_digests.clear()
+
+    def resize(self, max_bytes: int) -> None:
+        """调整缓存容量，超出部分立即淘汰
+
+        Args:
+            max_bytes: 新的缓存容量（字节）
+        """
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def stats(self) -> Dict[str, Any]:
+        """获取缓存统计
+
+        Returns:
+            Dict: {"hits", "misses", "evictions", "entries", "bytes", "max_bytes"}
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return (
+            f"<ImageCache entries={len(self._entries)} "
+            f"bytes={self._total_bytes}/{self.max_bytes}>"
+        )
+
+
+_default_cache = ImageCache()
+
+
+def get_image_cache() -> ImageCache:
+    """获取 fill_image 等函数共用的全局图片缓存
+
+    Returns:
+        ImageCache: 全局图片缓存
+
+    Examples:
+        >>> get_image_cache().resize(256 * 1024 * 1024)
+        >>> get_image_cache().stats()
+    """
+    return _default_cache
+
+
+def clear_image_cache() -> None:
+    """清空全局图片缓存"""
+    _default_cache.clear()
@@ -4,20 +4,40 @@ DocxLib 样式管理模块
 提供颜色解析、字体样式应用等功能。
 """
 
-import re
-from typing import Union
+import weakref
+from functools import lru_cache
+from typing import Any, Dict, Union
 
 from spire.doc import Color
 from spire.doc.common import *
 
-from .constants import COLOR_MAP
-from .errors import FillError
+from .constants import DEFAULT_COLOR, DEFAULT_FONT, DEFAULT_FONT_SIZE
+from .errors import FillError, PositionError, ValidationError
+from .table import _get_item
+from .utils import _color_to_hex
 
 
+@lru_cache(maxsize=None)
+def _color_from_hex(hex_str: str) -> Color:
+    """按规范化的十六进制字符串创建并缓存 Color 对象"""
+    # 使用 FromArgb 创建颜色 (alpha, red, green, blue)
+    r, g, b = (int(hex_str[i : i + 2], 16) for i in (0, 2, 4))
+    return Color.FromArgb(255, r, g, b)
+
+
+@lru_cache(maxsize=1024)
+def _color_argb(color_str: str) -> int:
+    """颜色字符串对应的 ARGB 整数（用于与已有格式比较）"""
+    return parse_color(color_str).ToArgb()
+
+
+@lru_cache(maxsize=1024)
 def parse_color(color_str: str) -> Color:
     """解析颜色字符串为 Color 对象
 
     支持颜色名称和十六进制格式。解析失败时返回黑色。
+    结果按输入字符串和规范化的十六进制值缓存，同一颜色返回同一个对象，
+    赋值给 TextColor 等属性时由 Spire.Doc 复制，可以放心共用。
 
     Args:
         color_str: 颜色字符串
@@ -35,34 +55,398 @@ def parse_color(color_str: str) -> Color:
         >>> parse_color('FF0000')
         <Color object>
     """
-    # 预处理：去除空格，转小写
-    color_str = color_str.strip().lower()
+    hex_str = _color_to_hex(color_str)
+    if hex_str is None:
+        # 解析失败，返回黑色
+        return Color.get_Black()
+    return _color_from_hex(hex_str)
 
-    # 检查颜色名称映射
-    if color_str in COLOR_MAP:
-        hex_str = COLOR_MAP[color_str]
-    else:
-        hex_str = color_str
 
-    # 去除 # 前缀
-    if hex_str.startswith("#"):
-        hex_str = hex_str[1:]
+@lru_cache(maxsize=None)
+def _horizontal_alignment(alignment: str):
+    """将水平对齐名称转换为 Spire.Doc 枚举值，不支持时返回 None"""
+    from spire.doc import HorizontalAlignment
 
-    # 验证十六进制格式
-    if not re.match(r"^[0-9a-f]{6}$", hex_str):
-        # 解析失败，返回黑色
-        return Color.get_Black()
+    alignment_map = {
+        "left": HorizontalAlignment.Left,
+        "center": HorizontalAlignment.Center,
+        "right": HorizontalAlignment.Right,
+        "justify": HorizontalAlignment.Justify,
+    }
+    return alignment_map.get(alignment)
+
+
+@lru_cache(maxsize=None)
+def _vertical_alignment(alignment: str):
+    """将垂直对齐名称转换为 Spire.Doc 枚举值，不支持时返回 None"""
+    from spire.doc import VerticalAlignment
+
+    alignment_map = {
+        "top": VerticalAlignment.Top,
+        "center": VerticalAlignment.Middle,
+        "bottom": VerticalAlignment.Bottom,
+    }
+    return alignment_map.get(alignment)
+
+
+# ==================== 格式写入统计 ====================
+
+# 是否只写入与继承格式不同的字符格式属性（见 set_minimal_formatting）
+_minimal_formatting = False
+
+# 字符格式属性的写入/跳过次数
+_format_stats = {"written": 0, "skipped": 0}
+
+
+def set_minimal_formatting(enabled: bool = True) -> None:
+    """开启或关闭最小格式模式
+
+    开启后，fill_text、fill_form、fill_date、fill_grid 和 apply_font_style
+    先读取文本范围继承的有效字符格式（来自段落样式和文档默认格式），
+    只写入与之不同的属性（字体、字号、颜色、粗体、斜体、下划线）。
+    填充函数每次调用只读取一次继承格式，之后的单元格直接比较，既减少
+    对 Spire.Doc 的属性写入，也减少 document.xml 中的直接格式。
+    同一次填充的目标单元格应继承相同的格式（例如位于同一表格中）。
+
+    Args:
+        enabled: 是否开启，默认关闭
+
+    Examples:
+        >>> set_minimal_formatting(True)
+        >>> fill_grid(doc, rows, (1, 1, 2, 1), column_styles=[StyleSpec(bold=True)] * 3)
+        >>> get_format_stats()
+        {'written': 1200, 'skipped': 1800}
+    """
+    global _minimal_formatting
+    _minimal_formatting = bool(enabled)
+
+
+def get_format_stats() -> Dict[str, int]:
+    """获取字符格式属性的写入统计
+
+    Returns:
+        Dict: {"written": 写入次数, "skipped": 因与继承格式相同而跳过的次数}
+    """
+    return dict(_format_stats)
+
+
+def reset_format_stats() -> None:
+    """清零字符格式属性的写入统计"""
+    _format_stats["written"] = 0
+    _format_stats["skipped"] = 0
 
-    # 解析 RGB
+
+class _FormatBaseline:
+    """最小格式模式下记录的继承字符格式（内部类）
+
+    首次比较某个属性时从当前文本范围读取并记录，之后同一次填充中的
+    其他文本范围直接使用记录值，不再读取。
+    """
+
+    __slots__ = ("values",)
+
+    def __init__(self):
+        self.values = {}
+
+    def get(self, character_format, name: str):
+        if name not in self.values:
+            value = getattr(character_format, name)
+            self.values[name] = value.ToArgb() if name == "TextColor" else value
+        return self.values[name]
+
+
+def _new_format_baseline(minimal: bool = None) -> Union[_FormatBaseline, None]:
+    """按最小格式模式创建继承格式记录，未开启时返回 None"""
+    if minimal is None:
+        minimal = _minimal_formatting
+    return _FormatBaseline() if minimal else None
+
+
+class StyleSpec:
+    """不可变的文本样式
+
+    汇总 fill_text 等函数的样式参数（字体、字号、颜色、粗体、斜体、下划线、
+    水平/垂直对齐）。创建时即解析颜色和对齐方式，之后每次应用都直接
+    设置已解析好的 Spire.Doc 值。可哈希、可比较，适合预先创建后在多次
+    填充中复用，或作为字典键。
+
+    Attributes:
+        font_name: 字体名称
+        font_size: 字体大小（磅），0 表示不设置
+        color: 颜色（名称或十六进制），空值表示不设置
+        bold: 是否粗体
+        italic: 是否斜体
+        underline: 是否下划线
+        h_align: 水平对齐方式（left / center / right / justify）
+        v_align: 垂直对齐方式（top / center / bottom）
+
+    Examples:
+        >>> header = StyleSpec(font_name="黑体", font_size=14, bold=True, h_align="center")
+        >>> fill_text(doc, (1, 0, 1, 1), "项目名称", style=header)
+        >>> fill_grid(doc, rows, (1, 1, 2, 1), column_styles=[header, None, header.replace(bold=False)])
+    """
+
+    __slots__ = (
+        "font_name",
+        "font_size",
+        "color",
+        "bold",
+        "italic",
+        "underline",
+        "h_align",
+        "v_align",
+        "_text_color",
+        "_h_alignment",
+        "_v_alignment",
+        "_writes",
+    )
+
+    # 可通过构造参数设置的字段（按顺序）
+    FIELDS = (
+        "font_name",
+        "font_size",
+        "color",
+        "bold",
+        "italic",
+        "underline",
+        "h_align",
+        "v_align",
+    )
+
+    def __init__(
+        self,
+        font_name: str = DEFAULT_FONT,
+        font_size: float = DEFAULT_FONT_SIZE,
+        color: str = DEFAULT_COLOR,
+        bold: bool = False,
+        italic: bool = False,
+        underline: bool = False,
+        h_align: str = None,
+        v_align: str = None,
+    ):
+        values = (font_name, font_size, color, bold, italic, underline, h_align, v_align)
+        for name, value in zip(self.FIELDS, values):
+            object.__setattr__(self, name, value)
+        object.__setattr__(self, "_text_color", parse_color(color) if color else None)
+        object.__setattr__(self, "_h_alignment", _horizontal_alignment(h_align))
+        object.__setattr__(self, "_v_alignment", _vertical_alignment(v_align))
+
+        # 需要写入的字符格式属性：(属性名, 比较值, 写入值)
+        writes = []
+        if font_name:
+            writes.append(("FontName", font_name, font_name))
+        if font_size > 0:
+            writes.append(("FontSize", font_size, font_size))
+        if color:
+            writes.append(("TextColor", _color_argb(color), self._text_color))
+        writes.append(("Bold", bool(bold), bold))
+        writes.append(("Italic", bool(italic), italic))
+        if underline:
+            from spire.doc import UnderlineStyle
+
+            writes.append(("UnderlineStyle", UnderlineStyle.Single, UnderlineStyle.Single))
+        object.__setattr__(self, "_writes", tuple(writes))
+
+    @classmethod
+    def from_dict(cls, style: Any, name: str = "样式") -> "StyleSpec":
+        """从样式字典创建（已是 StyleSpec 时原样返回）
+
+        Args:
+            style: StyleSpec 或样式字典，键为 FIELDS 中的字段，未指定的字段使用默认值
+            name: 出错时用于提示的名称
+
+        Returns:
+            StyleSpec: 样式对象
+
+        Raises:
+            ValidationError: 样式字典包含不支持的键，或类型不支持
+        """
+        if isinstance(style, cls):
+            return style
+        if not isinstance(style, dict):
+            raise ValidationError(f"{name}必须是 StyleSpec 或字典: {type(style)}")
+        unknown = set(style) - set(cls.FIELDS)
+        if unknown:
+            raise ValidationError(f"{name}包含不支持的键: {', '.join(sorted(unknown))}")
+        return cls(**style)
+
+    def replace(self, **changes) -> "StyleSpec":
+        """返回修改了部分字段的新样式
+
+        Raises:
+            ValidationError: 包含不支持的字段
+        """
+        return self.from_dict({**self.as_dict(), **changes})
+
+    def as_dict(self) -> dict:
+        """转换为 {字段: 值} 字典"""
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+    def apply_to_run(self, run, baseline: _FormatBaseline = None) -> None:
+        """将字体样式应用到文本范围（规则与 apply_font_style 相同）
+
+        Args:
+            run: Spire.Doc TextRange 对象
+            baseline: 最小格式模式的继承格式记录，None 表示写入全部属性
+        """
+        self._apply_character_format(run.CharacterFormat, baseline)
+
+    def _apply_character_format(self, character_format, baseline: _FormatBaseline = None) -> None:
+        """设置字符格式（文本范围或样式的 CharacterFormat）"""
+        for name, expected, value in self._writes:
+            if baseline is not None and baseline.get(character_format, name) == expected:
+                _format_stats["skipped"] += 1
+            else:
+                setattr(character_format, name, value)
+                _format_stats["written"] += 1
+
+    def apply_to_paragraph(self, paragraph) -> None:
+        """应用水平对齐方式（未指定时不修改）"""
+        if self._h_alignment is not None:
+            paragraph.Format.HorizontalAlignment = self._h_alignment
+
+    def apply_to_cell(self, cell) -> None:
+        """应用垂直对齐方式（未指定时不修改）"""
+        if self._v_alignment is not None:
+            cell.CellFormat.VerticalAlignment = self._v_alignment
+
+    def _key(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.FIELDS)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("StyleSpec 不可修改，请使用 replace() 创建新样式")
+
+    def __delattr__(self, name):
+        raise AttributeError("StyleSpec 不可修改")
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, StyleSpec):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={value!r}" for name, value in zip(self.FIELDS, self._key()))
+        return f"StyleSpec({fields})"
+
+
+# ==================== 命名样式 ====================
+
+# 每个文档通过 register_style 注册的样式 {名称: StyleSpec}
+_document_styles = weakref.WeakKeyDictionary()
+
+
+def _has_style(doc, name: str) -> bool:
+    """检查文档中是否存在指定名称的样式"""
     try:
-        r = int(hex_str[0:2], 16)
-        g = int(hex_str[2:4], 16)
-        b = int(hex_str[4:6], 16)
-        # 使用 FromArgb 创建颜色 (alpha, red, green, blue)
-        return Color.FromArgb(255, r, g, b)
-    except (ValueError, IndexError):
-        # 解析失败，返回黑色
-        return Color.get_Black()
+        return doc.Styles.FindByName(name) is not None
+    except TypeError:
+        # 未找到时 Spire.Doc 的 Python 封装无法转换空指针
+        return False
+
+
+class _NamedStyle:
+    """引用文档段落样式的样式（内部类）
+
+    与 StyleSpec 提供相同的 apply_to_* 接口：文本范围不设置直接格式，
+    段落只引用样式名称；垂直对齐属于单元格，无法放入段落样式，仍逐个
+    单元格设置。
+    """
+
+    __slots__ = ("name", "font_name", "_v_alignment")
+
+    def __init__(self, name: str, v_align: str = None, font_name: str = None):
+        self.name = name
+        self.font_name = font_name
+        self._v_alignment = _vertical_alignment(v_align)
+
+    def replace(self, font_name: str) -> "_NamedStyle":
+        """返回在样式之上直接设置字体的副本（fill_date 的年月日使用）"""
+        style = _NamedStyle(self.name, font_name=font_name)
+        style._v_alignment = self._v_alignment
+        return style
+
+    def apply_to_run(self, run, baseline: _FormatBaseline = None) -> None:
+        if self.font_name:
+            run.CharacterFormat.FontName = self.font_name
+            _format_stats["written"] += 1
+
+    def apply_to_paragraph(self, paragraph) -> None:
+        paragraph.ApplyStyle(self.name)
+
+    def apply_to_cell(self, cell) -> None:
+        if self._v_alignment is not None:
+            cell.CellFormat.VerticalAlignment = self._v_alignment
+
+
+def register_style(doc, name: str, style: Union[StyleSpec, Dict[str, Any]] = None) -> str:
+    """在文档中创建命名段落样式
+
+    样式只在 styles.xml 中定义一次，之后 fill_text 等函数传入 style=名称
+    即可让段落引用该样式，不再为每个文本范围写入直接格式，文档更小、
+    保存和转换更快。垂直对齐（v_align）属于单元格，填充时仍逐个设置。
+
+    同一文档重复注册相同定义时直接返回；名称已被其他样式占用时报错。
+
+    Args:
+        doc: Document 对象
+        name: 样式名称
+        style: StyleSpec 或样式字典，默认为 StyleSpec()
+
+    Returns:
+        str: 样式名称
+
+    Raises:
+        ValidationError: 样式定义无效，或文档中已存在同名样式
+
+    Examples:
+        >>> register_style(doc, "FieldValue", StyleSpec(font_name="仿宋", font_size=12, h_align="center"))
+        >>> fill_text(doc, (1, 0, 2, 2), "张三", style="FieldValue")
+        >>> fill_grid(doc, rows, (1, 1, 2, 1), column_styles=["FieldValue"] * 3)
+    """
+    spec = StyleSpec() if style is None else StyleSpec.from_dict(style)
+    registered = _document_styles.setdefault(doc, {})
+    if name in registered:
+        if registered[name] == spec:
+            return name
+        raise ValidationError(f"样式已注册且定义不同: {name}")
+    if _has_style(doc, name):
+        raise ValidationError(f"文档中已存在同名样式: {name}")
+
+    from spire.doc import ParagraphStyle
+
+    paragraph_style = ParagraphStyle(doc)
+    paragraph_style.Name = name
+    # 样式定义不是文本范围的直接格式，不计入 get_format_stats 的写入次数
+    for attr, _, value in spec._writes:
+        setattr(paragraph_style.CharacterFormat, attr, value)
+    if spec._h_alignment is not None:
+        paragraph_style.ParagraphFormat.HorizontalAlignment = spec._h_alignment
+    doc.Styles.Add(paragraph_style)
+
+    registered[name] = spec
+    return name
+
+
+def _resolve_style(doc, style: Any, name: str = "样式"):
+    """将 style 参数统一转换为带 apply_to_* 接口的样式对象
+
+    Args:
+        doc: Document 对象
+        style: StyleSpec、样式字典，或已注册（或模板中已有）的样式名称
+        name: 出错时用于提示的名称
+
+    Raises:
+        ValidationError: 样式无效或样式名称不存在
+    """
+    if isinstance(style, str):
+        spec = _document_styles.get(doc, {}).get(style)
+        if spec is None and not _has_style(doc, style):
+            raise ValidationError(f"{name}未注册: {style}")
+        return _NamedStyle(style, spec.v_align if spec is not None else None)
+    return StyleSpec.from_dict(style, name)
 
 
 def apply_font_style(
@@ -73,6 +457,7 @@ def apply_font_style(
     bold: bool = False,
     italic: bool = False,
     underline: bool = False,
+    minimal: bool = None,
 ) -> None:
     """应用字体样式到文本范围
 
@@ -84,6 +469,8 @@ def apply_font_style(
         bold: 是否粗体
         italic: 是否斜体
         underline: 是否下划线
+        minimal: 是否只写入与继承格式不同的属性，None 表示使用
+            set_minimal_formatting 的设置
 
     Examples:
         >>> apply_font_style(
@@ -94,29 +481,8 @@ def apply_font_style(
         ...     bold=True
         ... )
     """
-    # 设置字体名称
-    if font_name:
-        run.CharacterFormat.FontName = font_name
-
-    # 设置字体大小
-    if font_size > 0:
-        run.CharacterFormat.FontSize = font_size
-
-    # 设置颜色
-    if color:
-        run.CharacterFormat.TextColor = parse_color(color)
-
-    # 设置粗体
-    run.CharacterFormat.Bold = bold
-
-    # 设置斜体
-    run.CharacterFormat.Italic = italic
-
-    # 设置下划线
-    if underline:
-        from spire.doc import UnderlineStyle
-
-        run.CharacterFormat.UnderlineStyle = UnderlineStyle.Single
+    style = StyleSpec(font_name, font_size, color, bold, italic, underline)
+    style.apply_to_run(run, _new_format_baseline(minimal))
 
 
 def get_cell_format(cell):
@@ -180,17 +546,9 @@ def apply_paragraph_alignment(paragraph, alignment: str) -> None:
         >>> apply_paragraph_alignment(paragraph, "center")
         >>> apply_paragraph_alignment(paragraph, Alignment.RIGHT)
     """
-    from spire.doc import HorizontalAlignment
-
-    alignment_map = {
-        "left": HorizontalAlignment.Left,
-        "center": HorizontalAlignment.Center,
-        "right": HorizontalAlignment.Right,
-        "justify": HorizontalAlignment.Justify,
-    }
-
-    if alignment in alignment_map:
-        paragraph.Format.HorizontalAlignment = alignment_map[alignment]
+    value = _horizontal_alignment(alignment)
+    if value is not None:
+        paragraph.Format.HorizontalAlignment = value
 
 
 def apply_cell_alignment(cell, alignment: str) -> None:
@@ -207,16 +565,9 @@ def apply_cell_alignment(cell, alignment: str) -> None:
     Examples:
         >>> apply_cell_alignment(cell, "center")
     """
-    from spire.doc import VerticalAlignment
-
-    alignment_map = {
-        "top": VerticalAlignment.Top,
-        "center": VerticalAlignment.Middle,
-        "bottom": VerticalAlignment.Bottom,
-    }
-
-    if alignment in alignment_map:
-        cell.CellFormat.VerticalAlignment = alignment_map[alignment]
+    value = _vertical_alignment(alignment)
+    if value is not None:
+        cell.CellFormat.VerticalAlignment = value
 
 
 def get_cell_style(cell) -> dict:
@@ -412,3 +763,226 @@ def get_paragraph_style(paragraph) -> dict:
 
     except Exception as e:
         raise FillError(f"获取段落样式失败: {e}")
+
+
+# ==================== 批量样式快照 ====================
+
+# 单元格样式快照的列（位置列之外）
+_CELL_STYLE_COLUMNS = (
+    "h_align",
+    "v_align",
+    "background_color",
+    "font_name",
+    "font_size",
+    "bold",
+    "italic",
+    "underline",
+    "color",
+)
+
+# 段落样式快照的列（位置列之外）
+_PARAGRAPH_STYLE_COLUMNS = (
+    "style_name",
+    "h_align",
+    "font_name",
+    "font_size",
+    "bold",
+    "italic",
+    "underline",
+    "color",
+)
+
+
+@lru_cache(maxsize=None)
+def _alignment_names() -> tuple:
+    """Spire.Doc 对齐枚举到名称的映射：(水平对齐, 垂直对齐)"""
+    from spire.doc import HorizontalAlignment, VerticalAlignment
+
+    horizontal = {
+        HorizontalAlignment.Left: "left",
+        HorizontalAlignment.Center: "center",
+        HorizontalAlignment.Right: "right",
+        HorizontalAlignment.Justify: "justify",
+    }
+    vertical = {
+        VerticalAlignment.Top: "top",
+        VerticalAlignment.Middle: "middle",
+        VerticalAlignment.Bottom: "bottom",
+    }
+    return horizontal, vertical
+
+
+def _argb_to_hex(argb: int) -> str:
+    """ARGB 整数转为 '#RRGGBB'，0（未设置/自动）返回空字符串"""
+    return f"#{argb & 0xFFFFFF:06X}" if argb else ""
+
+
+def _first_character_format(paragraph):
+    """段落第一个文本范围的字符格式，没有文本时使用段落标记的格式"""
+    from spire.doc import TextRange
+
+    # 多数段落以文本范围开头，FirstChild 比经 ChildObjects 取元素少一次跨界调用
+    child = paragraph.FirstChild
+    if isinstance(child, TextRange):
+        return child.CharacterFormat
+
+    children = paragraph.ChildObjects
+    for i in range(children.Count):
+        child = children.get_Item(i)
+        if isinstance(child, TextRange):
+            return child.CharacterFormat
+    return paragraph.BreakCharacterFormat
+
+
+def _append_font_columns(columns: Dict[str, list], character_format) -> None:
+    """追加一行字体列（读取的是继承后的有效值）"""
+    from spire.doc import UnderlineStyle
+
+    columns["font_name"].append(character_format.FontName)
+    columns["font_size"].append(character_format.FontSize)
+    columns["bold"].append(character_format.Bold)
+    columns["italic"].append(character_format.Italic)
+    columns["underline"].append(character_format.UnderlineStyle != UnderlineStyle.none)
+    columns["color"].append(_argb_to_hex(character_format.TextColor.ToArgb()))
+
+
+def _append_cell_columns(columns: Dict[str, list], cell) -> None:
+    """追加一个单元格的样式列（字体取自第一个段落的第一个文本范围）"""
+    horizontal, vertical = _alignment_names()
+    cell_format = cell.CellFormat
+    columns["v_align"].append(vertical.get(cell_format.VerticalAlignment, ""))
+    columns["background_color"].append(_argb_to_hex(cell_format.BackColor.ToArgb()))
+
+    paragraph = cell.FirstParagraph
+    if paragraph is None:
+        columns["h_align"].append("")
+        for name in ("font_name", "font_size", "bold", "italic", "underline", "color"):
+            columns[name].append(None)
+        return
+
+    columns["h_align"].append(horizontal.get(paragraph.Format.HorizontalAlignment, ""))
+    _append_font_columns(columns, _first_character_format(paragraph))
+
+
+def _append_table_columns(columns: Dict[str, list], table_obj, position: tuple = ()) -> None:
+    """遍历表格一次，逐个单元格追加位置列和样式列"""
+    rows = table_obj.Rows
+    for row_idx in range(rows.Count):
+        cells = rows.get_Item(row_idx).Cells
+        for col_idx in range(cells.Count):
+            for name, value in zip(("section", "table"), position):
+                columns[name].append(value)
+            columns["row"].append(row_idx + 1)
+            columns["col"].append(col_idx + 1)
+            _append_cell_columns(columns, cells.get_Item(col_idx))
+
+
+def get_table_styles(doc, section: int, table: int) -> Dict[str, list]:
+    """批量获取整个表格的单元格样式（列式结果）
+
+    只遍历一次表格，每个单元格读取一次所需属性，结果按列存放：
+    各列是等长的列表，第 i 个元素对应第 i 个单元格（按行、列顺序）。
+    字体属性取自单元格第一个段落的第一个文本范围（没有文本时取段落标记），
+    是继承段落样式和文档默认格式后的有效值。
+
+    Args:
+        doc: Document 对象
+        section: 节索引（从1开始）
+        table: 表格索引（从1开始）
+
+    Returns:
+        Dict[str, list]: 列名到列表的映射
+        {
+            "row": [1, 1, ...],
+            "col": [1, 2, ...],
+            "h_align": ["left", "center", ...],      # 段落水平对齐
+            "v_align": ["top", "middle", ...],       # 单元格垂直对齐
+            "background_color": ["", "#D9D9D9", ...],  # 未设置时为空字符串
+            "font_name": ["宋体", ...],
+            "font_size": [10.5, ...],
+            "bold": [False, ...],
+            "italic": [False, ...],
+            "underline": [False, ...],
+            "color": ["", "#FF0000", ...],           # 自动颜色为空字符串
+        }
+        单元格没有段落时，该行的字体列为 None。
+
+    Raises:
+        PositionError: 表格不存在
+
+    Examples:
+        >>> styles = get_table_styles(doc, 1, 1)
+        >>> for row, col, bold in zip(styles["row"], styles["col"], styles["bold"]):
+        ...     if row == 1 and not bold:
+        ...         print(f"表头第 {col} 列不是粗体")
+    """
+    try:
+        section_obj = _get_item(doc.Sections, section, "节")
+        table_obj = _get_item(section_obj.Tables, table, "表格")
+    except IndexError as e:
+        raise PositionError(f"无法获取表格 ({section}, {table}): {e}")
+
+    columns = {name: [] for name in ("row", "col") + _CELL_STYLE_COLUMNS}
+    try:
+        _append_table_columns(columns, table_obj)
+    except Exception as e:
+        raise FillError(f"获取表格样式失败: {e}")
+    return columns
+
+
+def get_document_styles(doc) -> Dict[str, Dict[str, list]]:
+    """批量获取整个文档的表格单元格和正文段落样式（列式结果）
+
+    一次遍历所有节的表格和正文段落（不含页眉页脚），结果格式与
+    get_table_styles 相同，单元格增加 section、table 列，段落增加
+    section、index 列。
+
+    Args:
+        doc: Document 对象
+
+    Returns:
+        Dict: 两个列式结果
+        {
+            "cells": {"section": [...], "table": [...], "row": [...], "col": [...],
+                      "h_align": [...], "v_align": [...], "background_color": [...],
+                      "font_name": [...], "font_size": [...], "bold": [...],
+                      "italic": [...], "underline": [...], "color": [...]},
+            "paragraphs": {"section": [...], "index": [...], "style_name": [...],
+                           "h_align": [...], "font_name": [...], "font_size": [...],
+                           "bold": [...], "italic": [...], "underline": [...],
+                           "color": [...]},
+        }
+        段落的 index 是节内正文段落的序号（从1开始），style_name 是样式 ID。
+
+    Examples:
+        >>> styles = get_document_styles(doc)
+        >>> cells = styles["cells"]
+        >>> fonts = set(cells["font_name"]) - {None}
+        >>> if len(fonts) > 2:
+        ...     print(f"表格使用了过多字体: {fonts}")
+    """
+    cells = {name: [] for name in ("section", "table", "row", "col") + _CELL_STYLE_COLUMNS}
+    paragraphs = {name: [] for name in ("section", "index") + _PARAGRAPH_STYLE_COLUMNS}
+    horizontal, _ = _alignment_names()
+
+    try:
+        sections = doc.Sections
+        for sec_idx in range(sections.Count):
+            section_obj = sections.get_Item(sec_idx)
+
+            tables = section_obj.Tables
+            for tbl_idx in range(tables.Count):
+                _append_table_columns(cells, tables.get_Item(tbl_idx), (sec_idx + 1, tbl_idx + 1))
+
+            section_paragraphs = section_obj.Paragraphs
+            for para_idx in range(section_paragraphs.Count):
+                paragraph = section_paragraphs.get_Item(para_idx)
+                paragraphs["section"].append(sec_idx + 1)
+                paragraphs["index"].append(para_idx + 1)
+                paragraphs["style_name"].append(paragraph.StyleName)
+                paragraphs["h_align"].append(horizontal.get(paragraph.Format.HorizontalAlignment, ""))
+                _append_font_columns(paragraphs, _first_character_format(paragraph))
+    except Exception as e:
+        raise FillError(f"获取文档样式失败: {e}")
+
+    return {"cells": cells, "paragraphs": paragraphs}
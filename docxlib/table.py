@@ -4,7 +4,9 @@ DocxLib 表格操作模块
 提供表格遍历、单元格定位、文本查找等功能。
 """
 
-from typing import Generator, List, Tuple, Union
+import weakref
+from bisect import insort
+from typing import Dict, Generator, List, Tuple, Union
 
 from spire.doc import *
 from spire.doc.common import *
@@ -13,6 +15,75 @@ from .errors import PositionError
 from .constants import Position
 
 
+class _HandleCache:
+    """单次调用内的节、表格和行对象缓存
+
+    每次经 Spire.Doc 获取子对象都要跨越 Python/原生边界，逐层定位单元格
+    开销较大。读取整行、整列或整个表格时，在同一次调用内按位置复用表格
+    的行集合和行的单元格集合。缓存不跨调用保存，直接通过 Spire.Doc
+    增删行、表格后不会读到过期的对象。
+    """
+
+    __slots__ = ("rows", "cells")
+
+    def __init__(self):
+        # (节, 表格) -> (TableRowCollection, 行数)
+        self.rows = {}
+        # (节, 表格, 行) -> (CellCollection, 列数)
+        self.cells = {}
+
+
+def _get_item(collection, index: int, name: str):
+    """按从 1 开始的索引获取集合元素
+
+    先核对数量再取元素：Spire.Doc 对越界索引并不总是抛出异常。
+    """
+    count = collection.Count
+    if not 1 <= index <= count:
+        raise IndexError(f"{name}索引 {index} 超出范围 1-{count}")
+    return collection.get_Item(index - 1)
+
+
+def _get_table_rows(doc: Document, section: int, table: int, handles: _HandleCache = None):
+    """获取表格的行集合和行数（指定 handles 时复用其中的对象，越界时抛出 IndexError）"""
+    key = (section, table)
+    entry = handles.rows.get(key) if handles is not None else None
+    if entry is None:
+        section_obj = _get_item(doc.Sections, section, "节")
+        rows = _get_item(section_obj.Tables, table, "表格").Rows
+        entry = (rows, rows.Count)
+        if handles is not None:
+            handles.rows[key] = entry
+    return entry
+
+
+def _get_row_cells(
+    doc: Document, section: int, table: int, row: int, handles: _HandleCache = None
+):
+    """获取行的单元格集合和列数（指定 handles 时复用其中的对象，越界时抛出 IndexError）"""
+    key = (section, table, row)
+    entry = handles.cells.get(key) if handles is not None else None
+    if entry is None:
+        rows, row_count = _get_table_rows(doc, section, table, handles)
+        if not 1 <= row <= row_count:
+            raise IndexError(f"行索引 {row} 超出范围 1-{row_count}")
+        cells = rows.get_Item(row - 1).Cells
+        entry = (cells, cells.Count)
+        if handles is not None:
+            handles.cells[key] = entry
+    return entry
+
+
+def _locate_cell(
+    doc: Document, section: int, table: int, row: int, col: int, handles: _HandleCache = None
+):
+    """定位单元格（指定 handles 时复用其中的对象，越界时抛出 IndexError）"""
+    cells, col_count = _get_row_cells(doc, section, table, row, handles)
+    if not 1 <= col <= col_count:
+        raise IndexError(f"列索引 {col} 超出范围 1-{col_count}")
+    return cells.get_Item(col - 1)
+
+
 def get_cell(doc: Document, section: int, table: int, row: int, col: int):
     """获取指定位置的单元格
 
@@ -38,19 +109,7 @@ def get_cell(doc: Document, section: int, table: int, row: int, col: int):
         '单元格内容'
     """
     try:
-        # 获取节（索引从0开始）
-        section_obj = doc.Sections.get_Item(section - 1)
-
-        # 获取表格（索引从0开始）
-        table_obj = section_obj.Tables.get_Item(table - 1)
-
-        # 获取行（索引从0开始）
-        row_obj = table_obj.Rows.get_Item(row - 1)
-
-        # 获取单元格（索引从0开始）
-        cell = row_obj.Cells.get_Item(col - 1)
-
-        return cell
+        return _locate_cell(doc, section, table, row, col)
 
     except Exception as e:
         raise PositionError(
@@ -134,9 +193,165 @@ def get_cells(
     return result
 
 
+def _get_cell_text(cell) -> str:
+    """获取单元格的规范化文本（各段落去除首尾空白后拼接）
+
+    Args:
+        cell: Spire.Doc Cell 对象
+
+    Returns:
+        str: 单元格文本
+    """
+    cell_text = ""
+    for m in range(cell.Paragraphs.Count):
+        cell_text += cell.Paragraphs.get_Item(m).Text.strip()
+    return cell_text
+
+
+class DocumentIndex:
+    """单元格文本索引
+
+    遍历一次文档，建立 规范化单元格文本 -> 位置列表 的映射，
+    之后按文本查找单元格无需再扫描整个文档。
+
+    通过 docxlib 填充函数修改单元格时会自动更新对应条目；直接使用
+    Spire.Doc API 修改文档后，请调用 invalidate_index(doc)。
+
+    Examples:
+        >>> index = get_document_index(doc)
+        >>> index.find("姓名")
+        [(1, 1, 2, 1)]
+    """
+
+    def __init__(self, doc: Document):
+        """
+        Args:
+            doc: Document 对象
+        """
+        self._positions: Dict[str, List[Position]] = {}
+        self._texts: Dict[Position, str] = {}
+        # 建立索引后确认过不存在的文本（索引重建后自然清空）
+        self._misses: set = set()
+
+        for section_idx, table_idx, row_idx, col_idx, cell in iterate_cells(doc):
+            position = (section_idx, table_idx, row_idx, col_idx)
+            cell_text = _get_cell_text(cell)
+            self._texts[position] = cell_text
+            # iterate_cells 按文档顺序遍历，列表天然有序
+            self._positions.setdefault(cell_text, []).append(position)
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def find(self, text: str) -> List[Position]:
+        """查找文本等于 text 的所有单元格位置
+
+        Args:
+            text: 要查找的文本
+
+        Returns:
+            List[Position]: 按文档顺序排列的位置列表
+        """
+        return list(self._positions.get(text, ()))
+
+    def get_text(self, position: Position) -> str:
+        """获取索引中记录的单元格文本
+
+        Args:
+            position: 位置元组 (section, table, row, col)
+
+        Returns:
+            str: 单元格文本，位置不在索引中时返回 None
+        """
+        return self._texts.get(tuple(position))
+
+    def update(self, position: Position, text: str) -> None:
+        """更新单个单元格的索引条目
+
+        Args:
+            position: 位置元组 (section, table, row, col)
+            text: 单元格的新文本
+        """
+        position = tuple(position)
+        old_text = self._texts.get(position)
+        if old_text == text:
+            return
+
+        if old_text is not None:
+            old_positions = self._positions[old_text]
+            old_positions.remove(position)
+            if not old_positions:
+                del self._positions[old_text]
+
+        self._texts[position] = text
+        insort(self._positions.setdefault(text, []), position)
+
+
+# 每个文档对应的单元格文本索引（文档释放后自动移除）
+_document_indexes = weakref.WeakKeyDictionary()
+
+
+def get_document_index(doc: Document, rebuild: bool = False) -> DocumentIndex:
+    """获取文档的单元格文本索引
+
+    首次调用时遍历文档建立索引并缓存，之后直接复用。
+
+    Args:
+        doc: Document 对象
+        rebuild: 是否丢弃缓存并重新建立索引
+
+    Returns:
+        DocumentIndex: 单元格文本索引
+
+    Examples:
+        >>> index = get_document_index(doc)
+        >>> positions = index.find("姓名")
+    """
+    index = None if rebuild else _document_indexes.get(doc)
+    if index is None:
+        index = DocumentIndex(doc)
+        _document_indexes[doc] = index
+    return index
+
+
+def invalidate_index(doc: Document) -> None:
+    """丢弃文档的单元格文本索引
+
+    直接使用 Spire.Doc API 修改文档内容或结构后调用，
+    下次查找时会重新建立索引。
+
+    Args:
+        doc: Document 对象
+
+    Examples:
+        >>> doc.Sections.get_Item(0).Tables.get_Item(0).Rows.RemoveAt(0)
+        >>> invalidate_index(doc)
+    """
+    _document_indexes.pop(doc, None)
+
+
+def _update_index(doc: Document, position: Position, cell) -> None:
+    """单元格内容被修改后更新索引条目（仅在索引已存在时）
+
+    Args:
+        doc: Document 对象
+        position: 位置元组 (section, table, row, col)
+        cell: 被修改的单元格对象
+    """
+    index = _document_indexes.get(doc)
+    if index is not None:
+        index.update(position, _get_cell_text(cell))
+
+
 def find_text(doc: Document, text: str) -> List[Position]:
     """查找文档中包含指定文本的所有单元格位置
 
+    使用文档的单元格文本索引（见 get_document_index）。命中的位置会
+    重新核对单元格文本，发现索引过期时重建一次。未命中时重建一次索引
+    再查（直接通过 Spire.Doc 修改的文本也能找到）；重建后仍未命中的
+    文本会被记录，之后再查找同一文本直接返回空列表，不再扫描文档。
+    如果之后又直接通过 Spire.Doc 写入了该文本，需调用 invalidate_index(doc)。
+
     Args:
         doc: Document 对象
         text: 要查找的文本
@@ -149,18 +364,22 @@ def find_text(doc: Document, text: str) -> List[Position]:
         >>> print(positions)
         [(1, 1, 2, 1)]
     """
-    positions = []
-
-    for section_idx, table_idx, row_idx, col_idx, cell in iterate_cells(doc):
-        # 获取单元格文本
-        cell_text = ""
-        for m in range(cell.Paragraphs.Count):
-            paragraph = cell.Paragraphs.get_Item(m)
-            paragraph_text = paragraph.Text.strip()
-            cell_text += paragraph_text
-        if text == cell_text:
-            positions.append((section_idx, table_idx, row_idx, col_idx))
-
+    index = get_document_index(doc)
+    positions = index.find(text)
+    if positions:
+        try:
+            if all(_get_cell_text(get_cell(doc, *pos)) == text for pos in positions):
+                return positions
+        except PositionError:
+            pass
+    elif text in index._misses:
+        return positions
+
+    # 索引未命中或命中的位置已过期，重建后再查一次
+    index = get_document_index(doc, rebuild=True)
+    positions = index.find(text)
+    if not positions:
+        index._misses.add(text)
     return positions
 
 
@@ -219,12 +438,7 @@ def get_cell_text(doc: Document, section: int, table: int, row: int, col: int) -
         '单元格内容'
     """
     cell = get_cell(doc, section, table, row, col)
-    # 从段落中获取文本
-    cell_text = ""
-    for m in range(cell.Paragraphs.Count):
-        paragraph = cell.Paragraphs.get_Item(m)
-        cell_text += paragraph.Text.strip()
-    return cell_text
+    return _get_cell_text(cell)
 
 
 def get_table_dimensions(doc: Document, section: int, table: int) -> Tuple[int, int]:
@@ -247,13 +461,10 @@ def get_table_dimensions(doc: Document, section: int, table: int) -> Tuple[int,
         表格大小: 10行 x 5列
     """
     try:
-        section_obj = doc.Sections.get_Item(section - 1)
-        table_obj = section_obj.Tables.get_Item(table - 1)
-
-        rows = table_obj.Rows.Count
+        _, rows = _get_table_rows(doc, section, table)
         # 获取第一行的列数（假设所有行列数相同）
         if rows > 0:
-            cols = table_obj.Rows.get_Item(0).Cells.Count
+            _, cols = _get_row_cells(doc, section, table, 1)
         else:
             cols = 0
 
@@ -322,24 +533,16 @@ def get_table_text(doc: Document, section: int, table: int) -> List[List[str]]:
         # 获取表格尺寸
         rows, cols = get_table_dimensions(doc, section, table)
 
-        # 获取表格对象
-        section_obj = doc.Sections.get_Item(section - 1)
-        table_obj = section_obj.Tables.get_Item(table - 1)
-
-        # 构建二维数组
+        # 构建二维数组（同一行的单元格复用行对象）
+        handles = _HandleCache()
         result = []
-        for row_idx in range(rows):
-            row_data = []
-            row = table_obj.Rows.get_Item(row_idx)
-            for col_idx in range(cols):
-                cell = row.Cells.get_Item(col_idx)
-                # 从段落中获取文本
-                cell_text = ""
-                for m in range(cell.Paragraphs.Count):
-                    paragraph = cell.Paragraphs.get_Item(m)
-                    cell_text += paragraph.Text.strip()
-                row_data.append(cell_text)
-            result.append(row_data)
+        for row_idx in range(1, rows + 1):
+            result.append(
+                [
+                    _get_cell_text(_locate_cell(doc, section, table, row_idx, col_idx, handles))
+                    for col_idx in range(1, cols + 1)
+                ]
+            )
 
         return result
 
@@ -365,21 +568,8 @@ def get_table_row_text(doc: Document, section: int, table: int, row: int) -> Lis
         ['张三', '30', '工程师']
     """
     try:
-        section_obj = doc.Sections.get_Item(section - 1)
-        table_obj = section_obj.Tables.get_Item(table - 1)
-        row_obj = table_obj.Rows.get_Item(row - 1)
-
-        result = []
-        for cell_idx in range(row_obj.Cells.Count):
-            cell = row_obj.Cells.get_Item(cell_idx)
-            # 从段落中获取文本
-            cell_text = ""
-            for m in range(cell.Paragraphs.Count):
-                paragraph = cell.Paragraphs.get_Item(m)
-                cell_text += paragraph.Text.strip()
-            result.append(cell_text)
-
-        return result
+        cells, col_count = _get_row_cells(doc, section, table, row)
+        return [_get_cell_text(cells.get_Item(idx)) for idx in range(col_count)]
 
     except Exception as e:
         raise PositionError(f"读取表格行失败: {e}")
@@ -403,19 +593,13 @@ def get_table_column_text(doc: Document, section: int, table: int, col: int) ->
         ['姓名', '张三', '李四', '王五']
     """
     try:
-        section_obj = doc.Sections.get_Item(section - 1)
-        table_obj = section_obj.Tables.get_Item(table - 1)
+        handles = _HandleCache()
+        _, row_count = _get_table_rows(doc, section, table, handles)
 
         result = []
-        for row_idx in range(table_obj.Rows.Count):
-            row = table_obj.Rows.get_Item(row_idx)
-            cell = row.Cells.get_Item(col - 1)
-            # 从段落中获取文本
-            cell_text = ""
-            for m in range(cell.Paragraphs.Count):
-                paragraph = cell.Paragraphs.get_Item(m)
-                cell_text += paragraph.Text.strip()
-            result.append(cell_text)
+        for row_idx in range(1, row_count + 1):
+            cell = _locate_cell(doc, section, table, row_idx, col, handles)
+            result.append(_get_cell_text(cell))
 
         return result
 
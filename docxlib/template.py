@@ -0,0 +1,360 @@
+"""
+DocxLib 模板编译模块
+
+将模板解析一次并缓存变量位置，之后可反复渲染大量数据记录。
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Tuple, Union
+
+from spire.doc import *
+from spire.doc.common import *
+
+from .constants import (
+    DEFAULT_MISSING_VAR_ACTION,
+    DEFAULT_VAR_PREFIX,
+    DEFAULT_VAR_SUFFIX,
+)
+from .document import TemplatePool, to_docx_bytes
+from .errors import TemplateError, VariableSyntaxError
+from .fill import (
+    _collect_row_loops,
+    _compile_row_var_pattern,
+    _compile_var_pattern,
+    _expand_row,
+    _find_leftover_placeholders,
+    _find_run_spans,
+    _get_body_at,
+    _get_paragraph_at,
+    _get_paragraph_runs,
+    _ordered_var_names,
+    _replace_leftovers,
+    _resolve_replacements,
+    _resolve_row_items,
+    _resolve_row_replacements,
+    _scan_template,
+    _substitute_runs,
+)
+
+
+class CompiledTemplate:
+    """已编译的模板
+
+    由 compile_template 创建。通过 TemplatePool 在内存中保存模板，并记录
+    每个变量所在段落的位置及文本块布局，渲染时直接定位到这些段落进行
+    替换，不再扫描文档。循环行（含 ${items[].name} 的表格行）按元素复制，
+    复制出的各行共用编译时记录的行内布局。
+
+    Attributes:
+        placeholder_prefix: 变量前缀
+        placeholder_suffix: 变量后缀
+
+    Examples:
+        >>> template = compile_template("contract_template.docx")
+        >>> template.variables
+        ['contract_no', 'party_a', 'party_b', 'amount', 'date', 'signature']
+        >>> for i, record in enumerate(records):
+        ...     doc = template.render(record)
+        ...     save_docx(doc, f"output/contract_{i}.docx")
+    """
+
+    def __init__(
+        self,
+        pool: TemplatePool,
+        layout: List[Tuple[tuple, List[int], List[str], List[Tuple[int, int, str]]]],
+        placeholders: List[Tuple[str, str, str]],
+        placeholder_prefix: str = DEFAULT_VAR_PREFIX,
+        placeholder_suffix: str = DEFAULT_VAR_SUFFIX,
+        *,
+        row_loops: list = (),
+        var_names: List[str] = None,
+        leftovers: List[Tuple[str, str, str]] = (),
+    ):
+        """
+        Args:
+            pool: 模板池，每次渲染从中获取一个新的文档副本
+            layout: [(段落位置, 文本块索引, 文本块文本, 变量偏移), ...]
+            placeholders: 按出现顺序排列的 [(完整变量, 变量名, 默认值), ...]
+            placeholder_prefix: 变量前缀
+            placeholder_suffix: 变量后缀
+            row_loops: 循环行 [(行位置, 列表名, 行内布局, 普通变量, 循环变量), ...]，
+                格式见 _collect_row_loops
+            var_names: 按出现顺序排列的变量名（含循环行的列表名），
+                默认取 placeholders 中的变量名
+            leftovers: 嵌套表格、文本框等容器中的变量 [(完整变量, 变量名, 默认值), ...]，
+                渲染时全文替换
+        """
+        self.placeholder_prefix = placeholder_prefix
+        self.placeholder_suffix = placeholder_suffix
+        self._pool = pool
+        self._layout = layout
+        self._placeholders = placeholders
+        self._row_loops = list(row_loops)
+        self._leftovers = list(leftovers)
+
+        # 预先计算变量信息，供 extract_vars / validate 直接返回
+        if var_names is None:
+            var_names = [var_name for _, var_name, _ in placeholders]
+        self._all_vars = tuple(var_names) + tuple(var_name for _, var_name, _ in self._leftovers)
+        self._total = len(self._all_vars)
+        self._variables = tuple(dict.fromkeys(self._all_vars))
+        self._var_set = frozenset(self._variables)
+        self._defaults = {}
+        row_scalars = [ph for loop in self._row_loops for ph in loop[3]]
+        for _, var_name, default_val in placeholders + row_scalars + self._leftovers:
+            if default_val and var_name not in self._defaults:
+                self._defaults[var_name] = default_val
+        self._required_vars = tuple(
+            var_name for var_name in self._variables if var_name not in self._defaults
+        )
+
+    @property
+    def source(self) -> bytes:
+        """模板 DOCX 字节数据"""
+        return self._pool.source
+
+    @property
+    def variables(self) -> List[str]:
+        """变量名列表（去重，按首次出现顺序）"""
+        return list(self._variables)
+
+    @property
+    def defaults(self) -> Dict[str, str]:
+        """带默认值的变量 {变量名: 默认值}"""
+        return dict(self._defaults)
+
+    @property
+    def required_vars(self) -> List[str]:
+        """没有默认值、必须由数据提供的变量名列表"""
+        return list(self._required_vars)
+
+    @property
+    def placeholder_count(self) -> int:
+        """模板中占位符的总数（含重复）"""
+        return self._total
+
+    @property
+    def row_loops(self) -> Dict[str, List[str]]:
+        """循环行引用的列表及字段 {列表名: [字段名, ...]}"""
+        loops = {}
+        for _, list_name, _, _, row_placeholders in self._row_loops:
+            fields = loops.setdefault(list_name, [])
+            for _, _, field, _ in row_placeholders:
+                if field not in fields:
+                    fields.append(field)
+        return loops
+
+    def extract_vars(self, unique: bool = True) -> List[str]:
+        """获取模板变量（与 extract_template_vars 返回值相同）
+
+        Args:
+            unique: 是否去重
+
+        Returns:
+            List[str]: 变量名列表
+        """
+        return list(self._variables if unique else self._all_vars)
+
+    def validate(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """验证数据是否完整（与 validate_template_data 返回值相同）
+
+        Args:
+            data: 变量数据字典
+
+        Returns:
+            Dict: {"is_valid": bool, "missing_vars": list, "required_vars": list, "extra_vars": list}
+        """
+        provided_vars = set(data.keys()) - {"__styles__"}
+
+        return {
+            "is_valid": self._var_set.issubset(provided_vars),
+            "required_vars": list(self._var_set),
+            "missing_vars": list(self._var_set - provided_vars),
+            "extra_vars": list(provided_vars - self._var_set),
+        }
+
+    def render(
+        self,
+        data: Dict[str, Any],
+        *,
+        missing_var_action: str = DEFAULT_MISSING_VAR_ACTION,
+    ) -> Document:
+        """用数据渲染模板，返回新的文档
+
+        每次渲染都从模板池获取一个独立的文档副本，然后按编译时记录的
+        位置直接改写变量所在的文本块。
+
+        Args:
+            data: 变量数据字典
+            missing_var_action: 缺失变量处理方式 ("error" | "ignore" | "empty")
+
+        Returns:
+            Document: 渲染后的 Document 对象
+
+        Raises:
+            VariableNotFoundError: 变量未找到时
+            ValidationError: 循环行的数据不是列表
+            TemplateError: 渲染失败时
+
+        Examples:
+            >>> doc = template.render({"name": "张三", "age": "25"})
+            >>> doc = template.render({"items": [{"name": "设备费", "amount": 50000}]})
+        """
+        # 先解析替换值，缺失变量时无需加载文档
+        stats = {"total": self._total, "replaced": 0, "missing": []}
+        replacements = _resolve_replacements(
+            self._placeholders, data, missing_var_action, stats
+        )
+        leftover_replacements = _resolve_replacements(
+            self._leftovers, data, missing_var_action, stats
+        )
+        expansions = []
+        for row_key, list_name, layout, scalar_placeholders, row_placeholders in self._row_loops:
+            items = _resolve_row_items(list_name, data, missing_var_action, stats)
+            if items is None:
+                continue
+            base = _resolve_replacements(
+                scalar_placeholders, data, missing_var_action, stats
+            )
+            expansions.append(
+                (
+                    row_key,
+                    layout,
+                    _resolve_row_replacements(
+                        row_placeholders, items, base, missing_var_action, stats
+                    ),
+                )
+            )
+
+        try:
+            doc = self._pool.acquire()
+
+            if replacements:
+                for location, run_indices, texts, spans in self._layout:
+                    new_texts, replaced = _substitute_runs(texts, spans, replacements)
+                    if not replaced:
+                        continue
+                    children = _get_paragraph_at(doc, location).ChildObjects
+                    for child_idx, old_text, new_text in zip(
+                        run_indices, texts, new_texts
+                    ):
+                        if new_text != old_text:
+                            children.get_Item(child_idx).Text = new_text
+
+            # 从后往前展开循环行，前面段落和行的位置不受影响
+            for row_key, layout, row_replacements in reversed(expansions):
+                table = _get_body_at(doc, row_key).Tables.get_Item(row_key[2])
+                _expand_row(table, row_key[3], layout, row_replacements)
+
+            _replace_leftovers(doc, leftover_replacements)
+
+            return doc
+
+        except Exception as e:
+            raise TemplateError(f"渲染模板失败: {e}")
+
+    def render_bytes(
+        self,
+        data: Dict[str, Any],
+        *,
+        missing_var_action: str = DEFAULT_MISSING_VAR_ACTION,
+    ) -> bytes:
+        """用数据渲染模板，返回 DOCX 字节数据
+
+        Args:
+            data: 变量数据字典
+            missing_var_action: 缺失变量处理方式 ("error" | "ignore" | "empty")
+
+        Returns:
+            bytes: DOCX 文件字节数据
+
+        Raises:
+            VariableNotFoundError: 变量未找到时
+            TemplateError: 渲染失败时
+            DocumentError: 序列化失败时
+        """
+        doc = self.render(data, missing_var_action=missing_var_action)
+        return to_docx_bytes(doc)
+
+    def __repr__(self) -> str:
+        return (
+            f"<CompiledTemplate variables={len(self._variables)} "
+            f"placeholders={len(self._placeholders)}>"
+        )
+
+
+def compile_template(
+    source: Union[str, bytes, Path, Document, TemplatePool],
+    *,
+    placeholder_prefix: str = DEFAULT_VAR_PREFIX,
+    placeholder_suffix: str = DEFAULT_VAR_SUFFIX,
+) -> CompiledTemplate:
+    """编译模板
+
+    解析模板一次，记录所有变量的位置、默认值和必需变量。返回的
+    CompiledTemplate 可以反复渲染而无需重新扫描文档，适合批量生成。
+
+    Args:
+        source: 模板文件路径（str/Path）、字节数据（bytes）、Document 对象
+            或 TemplatePool
+        placeholder_prefix: 变量前缀
+        placeholder_suffix: 变量后缀
+
+    Returns:
+        CompiledTemplate: 已编译的模板
+
+    Raises:
+        DocumentError: 文件不存在或加载失败
+        ValidationError: 文件格式不是 .docx
+        VariableSyntaxError: 循环变量不在表格行中，或一行引用了多个列表
+        TemplateError: 模板解析失败
+
+    Examples:
+        >>> template = compile_template("contract_template.docx")
+        >>> template.validate({"party_a": "某某公司"})["is_valid"]
+        False
+        >>> doc = template.render(data)
+        >>> docx_bytes = template.render_bytes(data)
+    """
+    pool = source if isinstance(source, TemplatePool) else TemplatePool(source)
+
+    try:
+        # 在模板副本上扫描，渲染时的副本与之结构一致
+        doc = pool.acquire()
+        pattern = _compile_var_pattern(placeholder_prefix, placeholder_suffix)
+        row_pattern = _compile_row_var_pattern(placeholder_prefix, placeholder_suffix)
+
+        scanned = _scan_template(doc, pattern, row_pattern)
+        located, row_loops = _collect_row_loops(scanned, pattern, row_pattern)
+
+        layout = []
+        placeholders = []
+        for location, paragraph, matches in located:
+            placeholders.extend(
+                (match.group(0), match.group(1), match.group(2) or "")
+                for match in matches
+            )
+            run_indices, _, texts = _get_paragraph_runs(paragraph)
+            spans = _find_run_spans(texts, pattern)
+            if spans:
+                layout.append((location, run_indices, texts, spans))
+
+        return CompiledTemplate(
+            pool,
+            layout,
+            placeholders,
+            placeholder_prefix=placeholder_prefix,
+            placeholder_suffix=placeholder_suffix,
+            row_loops=row_loops,
+            var_names=[
+                var_name
+                for _, _, matches, row_matches in scanned
+                for var_name in _ordered_var_names(matches, row_matches)
+            ],
+            leftovers=_find_leftover_placeholders(doc, pattern, scanned),
+        )
+
+    except VariableSyntaxError:
+        raise
+    except Exception as e:
+        raise TemplateError(f"编译模板失败: {e}")
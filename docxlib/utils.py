@@ -4,11 +4,15 @@ DocxLib 工具函数
 提供通用的辅助函数，如文件格式验证、数据解析等。
 """
 
+import re
 import zipfile
+from bisect import bisect_right
+from functools import lru_cache
 from pathlib import Path
-from typing import Union, List, Dict, Any
+from typing import Any, Dict, Iterable, List, Mapping, Tuple, Union
 
-from .errors import ValidationError
+from .constants import COLOR_MAP
+from .errors import DocumentError, ValidationError, VariableNotFoundError
 
 
 def is_valid_docx(source: Union[str, bytes, Path]) -> bool:
@@ -77,6 +81,57 @@ def validate_docx(source: Union[str, bytes, Path]) -> None:
         raise ValidationError(f"'{file_desc}' 不是有效的 DOCX 文件格式")
 
 
+def _check_docx_path(source: Union[str, Path]) -> Path:
+    """检查 DOCX 文件路径（存在且扩展名为 .docx/.dotx）
+
+    Args:
+        source: 文件路径
+
+    Returns:
+        Path: 文件路径
+
+    Raises:
+        DocumentError: 文件不存在
+        ValidationError: 文件格式不是 .docx 或源类型不支持
+    """
+    if not isinstance(source, (str, Path)):
+        raise ValidationError(f"不支持的源类型: {type(source)}")
+
+    file_path = Path(source)
+    if not file_path.exists():
+        raise DocumentError(f"文件不存在: {source}")
+    if file_path.suffix.lower() not in [".docx", ".dotx"]:
+        raise ValidationError(f"文件格式不是 .docx: {source}")
+    return file_path
+
+
+def _read_docx_source(source: Union[str, bytes, Path]) -> bytes:
+    """读取 DOCX 源为字节数据（不解析文档）
+
+    文件只打开并读取一次；bytearray / memoryview 会转换为 bytes。
+
+    Args:
+        source: 文件路径（str/Path）或字节数据（bytes/bytearray/memoryview）
+
+    Returns:
+        bytes: DOCX 字节数据
+
+    Raises:
+        DocumentError: 文件不存在或读取失败
+        ValidationError: 文件格式不是 .docx 或源类型不支持
+    """
+    if isinstance(source, bytes):
+        return source
+    if isinstance(source, (bytearray, memoryview)):
+        return bytes(source)
+
+    file_path = _check_docx_path(source)
+    try:
+        return file_path.read_bytes()
+    except OSError as e:
+        raise DocumentError(f"读取文件失败: {e}")
+
+
 def parse_csv(file_path: Union[str, Path]) -> List[List[str]]:
     """解析 CSV 文件
 
@@ -231,3 +286,264 @@ def validate_date_string(date_str: str) -> None:
         raise ValidationError(
             f"日期不存在: '{date_str}' - {str(e)}"
         )
+
+
+@lru_cache(maxsize=32)
+def _compile_var_pattern(prefix: str, suffix: str) -> "re.Pattern":
+    """编译变量匹配正则（按前缀/后缀缓存）
+
+    所有占位符共用同一个组合正则，整篇文档只需编译一次。
+
+    Args:
+        prefix: 变量前缀
+        suffix: 变量后缀
+
+    Returns:
+        re.Pattern: 变量匹配正则，分组 1 为变量名，分组 2 为默认值
+    """
+    return re.compile(
+        re.escape(prefix)
+        + r"([a-zA-Z_][a-zA-Z0-9_]*)(?:\|([^}]*))?"
+        + re.escape(suffix)
+    )
+
+
+@lru_cache(maxsize=32)
+def _compile_row_var_pattern(prefix: str, suffix: str) -> "re.Pattern":
+    """编译表格行循环变量匹配正则（如 ${items[].name}，按前缀/后缀缓存）
+
+    Args:
+        prefix: 变量前缀
+        suffix: 变量后缀
+
+    Returns:
+        re.Pattern: 分组 1 为列表名，分组 2 为字段名，分组 3 为默认值
+    """
+    return re.compile(
+        re.escape(prefix)
+        + r"([a-zA-Z_][a-zA-Z0-9_]*)\[\]\.([a-zA-Z_][a-zA-Z0-9_]*)(?:\|([^}]*))?"
+        + re.escape(suffix)
+    )
+
+
+def _ordered_var_names(matches: Iterable["re.Match"], row_matches: Iterable["re.Match"]) -> List[str]:
+    """按出现顺序合并同一文本中的变量和循环变量，返回变量名（循环变量返回列表名）
+
+    Args:
+        matches: 变量匹配结果
+        row_matches: 循环变量匹配结果
+
+    Returns:
+        List[str]: 变量名列表（含重复）
+    """
+    found = [(match.start(), match.group(1)) for match in matches]
+    found.extend((match.start(), match.group(1)) for match in row_matches)
+    found.sort()
+    return [name for _, name in found]
+
+
+def _find_run_spans(texts: List[str], pattern: "re.Pattern") -> List[Tuple[int, int, str]]:
+    """在拼接后的文本块文本中查找变量
+
+    Args:
+        texts: 各文本块的文本
+        pattern: 变量匹配正则
+
+    Returns:
+        List[Tuple[起始偏移, 结束偏移, 完整变量]]
+    """
+    return [
+        (match.start(), match.end(), match.group(0))
+        for match in pattern.finditer("".join(texts))
+    ]
+
+
+def _substitute_runs(
+    texts: List[str], spans: List[Tuple[int, int, str]], replacements: Dict[str, str]
+) -> Tuple[List[str], int]:
+    """计算替换后各文本块的新文本
+
+    文本块拼接后统一定位变量，因此被拆分到多个文本块中的占位符也能
+    被替换。替换文本写入占位符起始的文本块，其余被占位符覆盖的文本块
+    相应截断，文本块的格式保持不变。
+
+    Args:
+        texts: 各文本块的原文本
+        spans: _find_run_spans 的结果
+        replacements: {完整变量: 替换文本}，不在其中的变量保持原样
+
+    Returns:
+        Tuple[新文本列表, 实际替换的占位符数量]
+    """
+    starts = []
+    offset = 0
+    for run_text in texts:
+        starts.append(offset)
+        offset += len(run_text)
+
+    new_texts = list(texts)
+    replaced = 0
+    # 从后往前替换，保证前面匹配的偏移量不受影响
+    for start, end, full_var in reversed(spans):
+        if full_var not in replacements:
+            continue
+        first = bisect_right(starts, start) - 1
+        last = bisect_right(starts, end - 1) - 1
+        head = new_texts[first][: start - starts[first]]
+        tail = new_texts[last][end - starts[last] :]
+        value = replacements[full_var]
+        if first == last:
+            new_texts[first] = head + value + tail
+        else:
+            new_texts[first] = head + value
+            for run_idx in range(first + 1, last):
+                new_texts[run_idx] = ""
+            new_texts[last] = tail
+        replaced += 1
+
+    return new_texts, replaced
+
+
+def _resolve_replacements(
+    placeholders: List[Tuple[str, str, str]],
+    data: Dict[str, Any],
+    missing_var_action: str,
+    stats: Dict[str, Any],
+) -> Dict[str, str]:
+    """根据数据字典解析每个占位符的替换文本
+
+    Args:
+        placeholders: [(完整变量, 变量名, 默认值), ...]，可包含重复
+        data: 变量数据字典
+        missing_var_action: 缺失变量处理方式 ("error" | "ignore" | "empty")
+        stats: 统计字典，缺失变量会记录到 stats["missing"]
+
+    Returns:
+        Dict[str, str]: {完整变量: 替换文本}
+
+    Raises:
+        VariableNotFoundError: 变量缺失且 missing_var_action 为 "error"
+    """
+    replacements = {}
+    for full_var, var_name, default_val in placeholders:
+        if full_var in replacements:
+            continue
+        if var_name in data:
+            replacements[full_var] = str(data[var_name])
+        elif default_val:
+            replacements[full_var] = default_val
+        elif missing_var_action == "error":
+            stats["missing"].append(var_name)
+            raise VariableNotFoundError(var_name, list(data.keys()))
+        elif missing_var_action == "empty":
+            replacements[full_var] = ""
+    return replacements
+
+
+def _resolve_row_items(
+    list_name: str,
+    data: Dict[str, Any],
+    missing_var_action: str,
+    stats: Dict[str, Any],
+) -> Union[list, None]:
+    """获取循环行对应的列表数据
+
+    Args:
+        list_name: 列表名
+        data: 变量数据字典
+        missing_var_action: 缺失变量处理方式 ("error" | "ignore" | "empty")
+        stats: 统计字典，缺失变量会记录到 stats["missing"]
+
+    Returns:
+        list: 列表元素；列表缺失且 missing_var_action 为 "ignore" 时返回 None
+        （保留模板行），为 "empty" 时返回空列表（删除模板行）
+
+    Raises:
+        VariableNotFoundError: 列表缺失且 missing_var_action 为 "error"
+        ValidationError: 数据不是列表等可迭代对象
+    """
+    if list_name not in data:
+        if missing_var_action == "error":
+            stats["missing"].append(list_name)
+            raise VariableNotFoundError(list_name, list(data.keys()))
+        return None if missing_var_action == "ignore" else []
+
+    items = data[list_name]
+    if isinstance(items, (str, bytes, Mapping)) or not isinstance(items, Iterable):
+        raise ValidationError(f"循环变量 '{list_name}' 的数据必须是列表: {type(items)}")
+    return list(items)
+
+
+def _resolve_row_replacements(
+    placeholders: List[Tuple[str, str, str, str]],
+    items: list,
+    base: Dict[str, str],
+    missing_var_action: str,
+    stats: Dict[str, Any],
+) -> List[Dict[str, str]]:
+    """为循环行的每个元素解析替换文本
+
+    Args:
+        placeholders: 行内循环变量 [(完整变量, 列表名, 字段名, 默认值), ...]
+        items: 列表元素（字典，或具有同名属性的对象）
+        base: 行内普通变量的替换 {完整变量: 替换文本}
+        missing_var_action: 缺失变量处理方式 ("error" | "ignore" | "empty")
+        stats: 统计字典，缺失字段会以 "列表名[].字段名" 记录到 stats["missing"]
+
+    Returns:
+        List[Dict[str, str]]: 每个元素一份 {完整变量: 替换文本}
+
+    Raises:
+        VariableNotFoundError: 字段缺失且 missing_var_action 为 "error"
+    """
+    rows = []
+    for item in items:
+        replacements = dict(base)
+        for full_var, list_name, field, default_val in placeholders:
+            if full_var in replacements:
+                continue
+            if isinstance(item, Mapping):
+                found = field in item
+                value = item.get(field)
+            else:
+                found = hasattr(item, field)
+                value = getattr(item, field, None)
+
+            if found:
+                replacements[full_var] = str(value)
+            elif default_val:
+                replacements[full_var] = default_val
+            elif missing_var_action == "error":
+                var_name = f"{list_name}[].{field}"
+                stats["missing"].append(var_name)
+                available = list(item.keys()) if isinstance(item, Mapping) else None
+                raise VariableNotFoundError(var_name, available)
+            elif missing_var_action == "empty":
+                replacements[full_var] = ""
+        rows.append(replacements)
+    return rows
+
+
+def _color_to_hex(color_str: str) -> Union[str, None]:
+    """将颜色名称或十六进制字符串规范化为 6 位大写十六进制（不含 #）
+
+    Args:
+        color_str: 颜色名称（'red'）或十六进制（'#FF0000' / 'FF0000'）
+
+    Returns:
+        str: 如 'FF0000'；无法解析时返回 None
+    """
+    # 预处理：去除空格，转小写
+    color_str = color_str.strip().lower()
+
+    # 检查颜色名称映射
+    hex_str = COLOR_MAP.get(color_str, color_str)
+
+    # 去除 # 前缀
+    if hex_str.startswith("#"):
+        hex_str = hex_str[1:]
+
+    # 验证十六进制格式
+    if not re.fullmatch(r"[0-9a-fA-F]{6}", hex_str):
+        return None
+    return hex_str.upper()
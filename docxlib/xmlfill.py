@@ -0,0 +1,455 @@
+"""
+DocxLib XML 模板填充模块
+
+纯文本变量替换的快速路径：直接改写 DOCX 压缩包中的 word/document.xml
+以及页眉页脚部件，其余部件原样复制，不加载 Spire.Doc 引擎。
+模板使用了无法直接处理的特性时自动回退到 Spire.Doc 的 fill_template。
+"""
+
+import io
+import re
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, List, Tuple, Union
+from xml.sax.saxutils import escape
+
+from .constants import (
+    DEFAULT_MISSING_VAR_ACTION,
+    DEFAULT_VAR_PREFIX,
+    DEFAULT_VAR_SUFFIX,
+)
+from .errors import FillError, ValidationError, VariableNotFoundError
+from .utils import (
+    _compile_row_var_pattern,
+    _compile_var_pattern,
+    _read_docx_source,
+    _resolve_replacements,
+    _substitute_runs,
+)
+
+_MAIN_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+_DOCUMENT_PART = "word/document.xml"
+_DOCUMENT_RELS = "word/_rels/document.xml.rels"
+_DOCUMENT_CONTENT_TYPE = (
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"
+)
+_HEADER_FOOTER_REL_TYPES = {
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/header": "hdr",
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/footer": "ftr",
+}
+
+# 标签：(结束标签斜杠, 名称, 自闭合斜杠)；名称以 ? / ! 开头的是处理指令和注释等
+_TAG_RE = re.compile(r"<(/?)([^\s/>]+)[^>]*?(/?)>")
+_MAIN_PREFIX_RE = re.compile(r'xmlns(?::([\w.-]+))?\s*=\s*"' + re.escape(_MAIN_NS) + '"')
+_RELATIONSHIP_RE = re.compile(r"<Relationship\b[^>]*>")
+_ATTR_RE = re.compile(r'([\w:]+)\s*=\s*"([^"]*)"')
+_ENTITY_RE = re.compile(r"&(#x[0-9a-fA-F]+|#[0-9]+|amp|lt|gt|quot|apos);")
+_ENTITIES = {"amp": "&", "lt": "<", "gt": ">", "quot": '"', "apos": "'"}
+_PRESERVE_RE = re.compile(r"\bxml:space\s*=")
+# 部件中所有 w:t 元素的文本（用于发现扫描范围之外的变量）
+_TEXT_RE = re.compile(r"<(?:[\w.-]+:)?t(?:\s[^>]*)?>([^<]*)</(?:[\w.-]+:)?t>")
+# 替换值中不能直接写入 w:t 的字符（换行、制表符等需要 Spire.Doc 处理）
+_UNSAFE_VALUE_RE = re.compile("[\x00-\x1f\ufffe\uffff]")
+
+# 段落文本中由元素表示的字符（与 Spire.Doc 的 Paragraph.Text 保持一致）
+_CHAR_ELEMENTS = {
+    "tab": "\t",
+    "br": "\x0b",
+    "cr": "\x0b",
+    "noBreakHyphen": "\x1e",
+    "softHyphen": "\x1f",
+}
+# 不计入段落文本的子树：文本框内容及其兼容性回退副本
+_SKIP_ELEMENTS = {"txbxContent", "Fallback"}
+
+
+class _Unsupported(Exception):
+    """模板使用了 XML 快速路径无法处理的特性，需要回退到 Spire.Doc"""
+
+
+def _unescape(text: str) -> str:
+    """解码 XML 字符引用"""
+
+    def decode(match):
+        entity = match.group(1)
+        if entity.startswith("#x"):
+            return chr(int(entity[2:], 16))
+        if entity.startswith("#"):
+            return chr(int(entity[1:]))
+        return _ENTITIES[entity]
+
+    return _ENTITY_RE.sub(decode, text)
+
+
+def _local_name(name: str) -> str:
+    return name.rpartition(":")[2]
+
+
+class _Segment:
+    """段落中的一段文本：可改写的 w:t，或只读的 w:delText / 制表符 / 换行等"""
+
+    __slots__ = ("text", "start", "end", "tag_start", "tag_end")
+
+    def __init__(self, text, start=None, end=None, tag_start=None, tag_end=None):
+        self.text = text
+        # w:t 文本内容与开始标签在 XML 中的偏移；只读片段为 None
+        self.start = start
+        self.end = end
+        self.tag_start = tag_start
+        self.tag_end = tag_end
+
+
+def _scan_part(
+    xml: str, container: str, pattern: "re.Pattern", row_pattern: "re.Pattern"
+) -> List[Tuple[List[_Segment], list]]:
+    """扫描 XML 部件，返回包含变量的段落
+
+    覆盖容器的直接子段落和顶层表格单元格的直接子段落；嵌套表格、文本框
+    和内容控件中含有变量时抛出 _Unsupported，回退到 fill_template。
+
+    Args:
+        xml: 部件 XML 文本
+        container: 容器元素的本地名（body / hdr / ftr）
+        pattern: 变量匹配正则
+        row_pattern: 循环变量匹配正则
+
+    Returns:
+        List[Tuple[文本片段列表, 匹配列表]]
+
+    Raises:
+        _Unsupported: XML 中包含注释、CDATA 等无法可靠处理的结构，包含
+            需要复制表格行的循环变量，或扫描范围之外的段落中含有变量
+    """
+    prefix_match = _MAIN_PREFIX_RE.search(xml)
+    if prefix_match is None:
+        raise _Unsupported("未找到 WordprocessingML 命名空间")
+    prefix = prefix_match.group(1)
+    qualify = (lambda name: f"{prefix}:{name}") if prefix else (lambda name: name)
+
+    p_tag = qualify("p")
+    r_tag = qualify("r")
+    t_tag = qualify("t")
+    del_tag = qualify("delText")
+    char_tags = {qualify(name): char for name, char in _CHAR_ELEMENTS.items()}
+    top_paths = (
+        [qualify(container)],
+        [qualify(name) for name in (container, "tbl", "tr", "tc")],
+    )
+
+    located = []
+    path = []
+    segments = None  # 当前段落的文本片段
+    paragraph_depth = 0
+    skip_depth = 0  # 处于文本框等子树中时，记录子树根的深度
+    text_open = None  # 当前 w:t / w:delText 开始标签的 (起始, 结束, 是否可改写)
+
+    for match in _TAG_RE.finditer(xml):
+        closing, name, self_closing = match.groups()
+        if name[0] in "?!":
+            if name[0] == "?":
+                continue
+            raise _Unsupported("XML 中包含注释、CDATA 或 DOCTYPE")
+
+        if closing:
+            if text_open is not None and name in (t_tag, del_tag):
+                tag_start, tag_end, editable = text_open
+                text = _unescape(xml[tag_end : match.start()])
+                if editable:
+                    segments.append(
+                        _Segment(text, tag_end, match.start(), tag_start, tag_end)
+                    )
+                else:
+                    segments.append(_Segment(text))
+                text_open = None
+
+            depth = len(path)
+            path.pop()
+            if skip_depth and depth == skip_depth:
+                skip_depth = 0
+            elif segments is not None and depth == paragraph_depth:
+                if segments:
+                    text = "".join(s.text for s in segments)
+                    if row_pattern.search(text):
+                        raise _Unsupported("包含表格行循环变量")
+                    matches = list(pattern.finditer(text))
+                    if matches:
+                        located.append((segments, matches))
+                segments = None
+            continue
+
+        if segments is not None and not skip_depth:
+            parent = path[-1] if path else None
+            if _local_name(name) in _SKIP_ELEMENTS:
+                if not self_closing:
+                    skip_depth = len(path) + 1
+            elif parent == r_tag:
+                if name in (t_tag, del_tag) and not self_closing:
+                    text_open = (match.start(), match.end(), name == t_tag)
+                elif name in char_tags:
+                    segments.append(_Segment(char_tags[name]))
+        elif name == p_tag and not self_closing and not skip_depth:
+            if path[-1:] == top_paths[0] or path[-4:] == top_paths[1]:
+                segments = []
+                paragraph_depth = len(path) + 1
+
+        if not self_closing:
+            path.append(name)
+
+    # 嵌套表格、文本框等容器中的变量需要 Spire.Doc 全文替换
+    all_text = "".join(_unescape(text) for text in _TEXT_RE.findall(xml))
+    if len(pattern.findall(all_text)) > sum(len(matches) for _, matches in located):
+        raise _Unsupported("嵌套表格、文本框等容器中包含变量")
+
+    return located
+
+
+def _patch_part(
+    xml: str,
+    located: List[Tuple[List[_Segment], list]],
+    replacements: Dict[str, str],
+) -> str:
+    """按替换表改写部件中的 w:t 文本
+
+    Args:
+        xml: 部件 XML 文本
+        located: _scan_part 的结果
+        replacements: {完整变量: 替换文本}
+
+    Returns:
+        str: 改写后的 XML 文本
+
+    Raises:
+        _Unsupported: 变量跨越了制表符、换行或修订删除的文本
+    """
+    edits = []
+    for segments, matches in located:
+        texts = [segment.text for segment in segments]
+        spans = [(m.start(), m.end(), m.group(0)) for m in matches]
+        new_texts, replaced = _substitute_runs(texts, spans, replacements)
+        if not replaced:
+            continue
+        for segment, old_text, new_text in zip(segments, texts, new_texts):
+            if new_text == old_text:
+                continue
+            if segment.start is None:
+                raise _Unsupported("变量跨越了制表符、换行或修订内容")
+            open_tag = xml[segment.tag_start : segment.tag_end]
+            if new_text != new_text.strip() and not _PRESERVE_RE.search(open_tag):
+                # 首尾空白需要 xml:space="preserve"，否则会被 Word 忽略
+                preserved = open_tag[:-1].rstrip("/").rstrip() + ' xml:space="preserve">'
+                edits.append((segment.tag_start, segment.tag_end, preserved))
+            edits.append((segment.start, segment.end, escape(new_text)))
+
+    return _apply_edits(xml, edits)
+
+
+def _apply_edits(xml: str, edits: List[Tuple[int, int, str]]) -> str:
+    """将 [(起始偏移, 结束偏移, 新文本), ...] 应用到文本（各区间互不重叠）"""
+    if not edits:
+        return xml
+
+    edits.sort()
+    parts = []
+    position = 0
+    for start, end, text in edits:
+        parts.append(xml[position:start])
+        parts.append(text)
+        position = end
+    parts.append(xml[position:])
+    return "".join(parts)
+
+
+def _header_footer_parts(package: zipfile.ZipFile) -> List[Tuple[str, str]]:
+    """读取正文引用的页眉页脚部件，返回 [(压缩包内路径, 容器本地名), ...]"""
+    try:
+        rels = package.read(_DOCUMENT_RELS).decode("utf-8")
+    except KeyError:
+        return []
+
+    parts = []
+    for match in _RELATIONSHIP_RE.finditer(rels):
+        attrs = dict(_ATTR_RE.findall(match.group(0)))
+        container = _HEADER_FOOTER_REL_TYPES.get(attrs.get("Type"))
+        if container is None:
+            continue
+        if attrs.get("TargetMode") == "External":
+            continue
+        target = attrs.get("Target", "").lstrip("/")
+        if not target.startswith("word/"):
+            target = "word/" + target
+        parts.append((target, container))
+    return parts
+
+
+def _check_content_type(package: zipfile.ZipFile) -> None:
+    """确认正文部件为普通 .docx 文档（.dotx / .docm 由 Spire.Doc 转换保存）"""
+    try:
+        content_types = package.read("[Content_Types].xml").decode("utf-8")
+    except KeyError:
+        raise _Unsupported("缺少 [Content_Types].xml")
+
+    for match in re.finditer(r"<Override\b[^>]*>", content_types):
+        attrs = dict(_ATTR_RE.findall(match.group(0)))
+        if attrs.get("PartName") == "/" + _DOCUMENT_PART:
+            if attrs.get("ContentType") != _DOCUMENT_CONTENT_TYPE:
+                raise _Unsupported("正文部件不是 .docx 文档类型")
+            return
+    raise _Unsupported("未声明正文部件的内容类型")
+
+
+def _fill_xml(
+    data_bytes: bytes,
+    data: Dict[str, Any],
+    missing_var_action: str,
+    pattern: "re.Pattern",
+    row_pattern: "re.Pattern",
+) -> Tuple[bytes, Dict[str, Any]]:
+    """XML 快速路径
+
+    Raises:
+        _Unsupported: 需要回退到 Spire.Doc
+        VariableNotFoundError: 变量缺失且 missing_var_action 为 "error"
+    """
+    try:
+        package = zipfile.ZipFile(io.BytesIO(data_bytes))
+    except zipfile.BadZipFile:
+        raise ValidationError("文件不是有效的 DOCX 格式")
+
+    with package:
+        _check_content_type(package)
+
+        # 正文在前，页眉页脚在后，与 fill_template 的扫描顺序一致
+        part_names = [(_DOCUMENT_PART, "body")] + _header_footer_parts(package)
+        parts = {}
+        for part_name, container in part_names:
+            try:
+                xml = package.read(part_name).decode("utf-8")
+            except KeyError:
+                if part_name == _DOCUMENT_PART:
+                    raise _Unsupported("缺少 word/document.xml")
+                continue
+            except UnicodeDecodeError:
+                raise _Unsupported(f"{part_name} 不是 UTF-8 编码")
+            parts[part_name] = (xml, _scan_part(xml, container, pattern, row_pattern))
+
+        placeholders = [
+            (match.group(0), match.group(1), match.group(2) or "")
+            for _, located in parts.values()
+            for _, matches in located
+            for match in matches
+        ]
+        stats = {"total": len(placeholders), "replaced": 0, "missing": []}
+        replacements = _resolve_replacements(
+            placeholders, data, missing_var_action, stats
+        )
+        stats["replaced"] = len(replacements)
+
+        if any(_UNSAFE_VALUE_RE.search(value) for value in replacements.values()):
+            raise _Unsupported("替换值中包含换行、制表符等控制字符")
+
+        patched = {}
+        for part_name, (xml, located) in parts.items():
+            new_xml = _patch_part(xml, located, replacements)
+            if new_xml is not xml:
+                patched[part_name] = new_xml.encode("utf-8")
+
+        if not patched:
+            return data_bytes, stats
+
+        output = io.BytesIO()
+        with zipfile.ZipFile(output, "w") as target:
+            for info in package.infolist():
+                content = patched.get(info.filename)
+                if content is None:
+                    content = package.read(info)
+                target.writestr(info, content)
+
+    return output.getvalue(), stats
+
+
+def _fill_spire(
+    data_bytes: bytes,
+    data: Dict[str, Any],
+    missing_var_action: str,
+    placeholder_prefix: str,
+    placeholder_suffix: str,
+) -> Tuple[bytes, Dict[str, Any]]:
+    """回退路径：使用 Spire.Doc 的 fill_template"""
+    from .document import load_docx, to_docx_bytes
+    from .fill import fill_template
+
+    doc = load_docx(data_bytes)
+    stats = fill_template(
+        doc,
+        data,
+        missing_var_action=missing_var_action,
+        placeholder_prefix=placeholder_prefix,
+        placeholder_suffix=placeholder_suffix,
+    )
+    return to_docx_bytes(doc), stats
+
+
+def fill_template_bytes(
+    source: Union[str, bytes, Path],
+    data: Dict[str, Any],
+    *,
+    missing_var_action: str = DEFAULT_MISSING_VAR_ACTION,
+    placeholder_prefix: str = DEFAULT_VAR_PREFIX,
+    placeholder_suffix: str = DEFAULT_VAR_SUFFIX,
+) -> Tuple[bytes, Dict[str, Any]]:
+    """替换模板变量，直接返回 DOCX 字节数据
+
+    纯文本替换时直接改写压缩包中的 word/document.xml 和页眉页脚部件，
+    其余部件原样复制，不加载 Spire.Doc。被拆分到多个文本块中的占位符
+    同样可以匹配；替换范围与 fill_template 相同。
+
+    以下情况自动回退到 Spire.Doc（load_docx + fill_template）：
+    变量跨越制表符/换行/修订内容、替换值包含换行等控制字符、模板包含
+    表格行循环变量（${items[].name}）、模板不是普通 .docx（如 .dotx）、
+    XML 中含注释或 CDATA 等。
+
+    Args:
+        source: 模板文件路径（str/Path）或字节数据（bytes）
+        data: 变量数据字典
+        missing_var_action: 缺失变量处理方式 ("error" | "ignore" | "empty")
+        placeholder_prefix: 变量前缀
+        placeholder_suffix: 变量后缀
+
+    Returns:
+        Tuple[bytes, Dict]: (DOCX 字节数据, 统计信息)，统计信息为
+        {"total": int, "replaced": int, "missing": list, "backend": "xml" | "spire"}
+
+    Raises:
+        DocumentError: 文件不存在或读取失败
+        ValidationError: 文件格式无效
+        VariableNotFoundError: 变量未找到时
+        FillError: 填充失败时
+
+    Examples:
+        >>> docx_bytes, stats = fill_template_bytes("contract_template.docx", data)
+        >>> Path("contract.docx").write_bytes(docx_bytes)
+        >>> stats["backend"]
+        'xml'
+    """
+    data_bytes = _read_docx_source(source)
+    pattern = _compile_var_pattern(placeholder_prefix, placeholder_suffix)
+    row_pattern = _compile_row_var_pattern(placeholder_prefix, placeholder_suffix)
+
+    try:
+        result, stats = _fill_xml(
+            data_bytes, data, missing_var_action, pattern, row_pattern
+        )
+        stats["backend"] = "xml"
+        return result, stats
+    except _Unsupported:
+        pass
+    except (ValidationError, VariableNotFoundError):
+        raise
+    except Exception as e:
+        raise FillError(f"填充模板失败: {e}")
+
+    result, stats = _fill_spire(
+        data_bytes, data, missing_var_action, placeholder_prefix, placeholder_suffix
+    )
+    stats["backend"] = "spire"
+    return result, stats
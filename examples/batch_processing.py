@@ -4,7 +4,7 @@ DocxLib 批量处理示例
 演示如何批量生成多个文档。
 """
 
-from docxlib import load_docx, fill_text, fill_date, save_docx
+from docxlib import TemplatePool, fill_form, fill_date, save_docx
 
 
 def main():
@@ -35,19 +35,24 @@ def main():
         },
     ]
 
+    # 模板只加载一次，之后从内存中获取副本
+    pool = TemplatePool(template_path)
+
     # 批量生成文档
     print(f"开始批量生成 {len(data)} 个文档...")
 
     for i, item in enumerate(data):
         print(f"正在处理第 {i+1} 个文档...")
 
-        # 每次重新加载模板（避免复制文档对象的问题）
-        doc = load_docx(template_path)
+        # 获取独立的模板副本
+        doc = pool.acquire()
 
-        # 填充数据
-        fill_text(doc, "姓名", item["name"], mode="match_right")
-        fill_text(doc, "年龄", item["age"], mode="match_right")
-        fill_text(doc, "项目", item["project"], mode="match_right")
+        # 填充数据（一次遍历定位所有标签）
+        fill_form(
+            doc,
+            {"姓名": item["name"], "年龄": item["age"], "项目": item["project"]},
+            mode="match_right",
+        )
 
         # 填充日期
         fill_date(doc, "日期", item["date"])
@@ -0,0 +1,225 @@
+"""
+DocxLib 文档后端测试
+"""
+
+import subprocess
+import sys
+import zipfile
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from docxlib import (
+    BackendType,
+    DocumentBackend,
+    DocxReader,
+    XmlBackend,
+    get_backend,
+    load_docx,
+    open_docx,
+    register_backend,
+    set_default_backend,
+)
+from docxlib.errors import FillError, PositionError, ValidationError
+
+SAMPLE = "fixtures/templates/sample.docx"
+CONTRACT = "fixtures/templates/contract_template.docx"
+LOGO = "fixtures/images/logo.png"
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def count_pictures(cell):
+    """统计 Spire.Doc 单元格中的图片数量"""
+    from spire.doc import DocumentObjectType
+
+    count = 0
+    for p_idx in range(cell.Paragraphs.Count):
+        paragraph = cell.Paragraphs.get_Item(p_idx)
+        for o_idx in range(paragraph.ChildObjects.Count):
+            child = paragraph.ChildObjects.get_Item(o_idx)
+            if child.DocumentObjectType == DocumentObjectType.Picture:
+                count += 1
+    return count
+
+
+@pytest.fixture
+def default_backend():
+    """测试结束后恢复默认后端"""
+    yield
+    set_default_backend(BackendType.SPIRE)
+
+
+class TestBackendsMatch:
+    """测试不同后端的行为一致"""
+
+    @pytest.mark.parametrize("path", [SAMPLE, CONTRACT])
+    def test_read_cells(self, path):
+        """测试两个后端读取的单元格文本一致"""
+        spire_doc = open_docx(path, backend="spire")
+        xml_doc = open_docx(path, backend="xml")
+        assert list(xml_doc.iterate_cells()) == list(spire_doc.iterate_cells())
+
+    def test_set_cell_text(self):
+        """测试两个后端写入文本后的结果一致"""
+        results = {}
+        for name in ("spire", "xml"):
+            doc = open_docx(SAMPLE, backend=name)
+            doc.set_cell_text((1, 1, 1, 1), "A & <B>", bold=True, color="red")
+            doc.set_cell_text((1, 1, 2, 0), "第一行\n第二行")
+            # 读取未保存的修改
+            assert doc.get_cell_text(1, 1, 1, 1) == "A & <B>"
+            results[name] = list(DocxReader(doc.to_bytes()).iterate_cells())
+            assert list(doc.iterate_cells()) == results[name]
+        assert results["xml"] == results["spire"]
+
+
+class TestXmlBackend:
+    """测试 ZIP/XML 后端"""
+
+    def test_set_cell_text_loads_in_spire(self):
+        """测试写入结果可以被 Spire.Doc 正常加载，且保留格式"""
+        doc = open_docx(SAMPLE, backend="xml")
+        doc.set_cell_text((1, 1, 1, 1), "值\t值", font_name="宋体", font_size=14, bold=True, color="#FF0000")
+        result = load_docx(doc.to_bytes())
+
+        cell = result.Sections.get_Item(0).Tables.get_Item(0).Rows.get_Item(0).Cells.get_Item(0)
+        assert cell.Paragraphs.Count == 1
+        text_range = cell.Paragraphs.get_Item(0).ChildObjects.get_Item(0)
+        assert text_range.CharacterFormat.Bold
+        assert text_range.CharacterFormat.FontSize == 14
+        assert text_range.CharacterFormat.FontName == "宋体"
+        assert cell.Paragraphs.get_Item(0).Text == "值\t值"
+
+    def test_insert_image(self):
+        """测试插入图片（单张图片部件被所有单元格共用）"""
+        doc = open_docx(SAMPLE, backend="xml")
+        doc.insert_image((1, 1, 1, 0), LOGO, width=60, height=30)
+        data = doc.to_bytes()
+
+        with zipfile.ZipFile(BytesIO(data)) as package:
+            media = [name for name in package.namelist() if name.startswith("word/media/")]
+            content_types = package.read("[Content_Types].xml").decode("utf-8")
+            xml = package.read("word/document.xml").decode("utf-8")
+        assert len(media) == 1
+        assert 'Extension="png"' in content_types
+        assert xml.count('cx="762000" cy="381000"') == 2 * xml.count("<wp:inline")
+
+        result = load_docx(data)
+        row = result.Sections.get_Item(0).Tables.get_Item(0).Rows.get_Item(0)
+        for c_idx in range(row.Cells.Count):
+            assert count_pictures(row.Cells.get_Item(c_idx)) == 1
+
+    def test_insert_image_twice(self):
+        """测试多次插入同一图片时复用同一个图片部件和关系"""
+        doc = open_docx(SAMPLE, backend="xml")
+        doc.insert_image((1, 1, 1, 1), LOGO, width=20, height=20)
+        doc.insert_image((1, 1, 2, 1), Path(LOGO).read_bytes(), width=20, height=20)
+
+        with zipfile.ZipFile(BytesIO(doc.to_bytes())) as package:
+            media = [name for name in package.namelist() if name.startswith("word/media/")]
+            rels = package.read("word/_rels/document.xml.rels").decode("utf-8")
+        assert len(media) == 1
+        assert rels.count(media[0].split("/", 1)[1]) == 1
+
+    def test_insert_image_errors(self):
+        """测试图片错误"""
+        doc = open_docx(SAMPLE, backend="xml")
+        with pytest.raises(FillError):
+            doc.insert_image((1, 1, 1, 1), "nonexistent.png", width=10, height=10)
+        with pytest.raises(FillError):
+            doc.insert_image((1, 1, 1, 1), b"not an image", width=10, height=10)
+
+    def test_invalid_position(self):
+        """测试位置越界"""
+        doc = open_docx(SAMPLE, backend="xml")
+        with pytest.raises(PositionError):
+            doc.set_cell_text((1, 1, 999, 1), "x")
+        with pytest.raises(PositionError):
+            doc.set_cell_text((1, 99, 0, 0), "x")
+        with pytest.raises(PositionError):
+            doc.get_cell_text(1, 1, 999, 1)
+
+    def test_unmodified_returns_source(self):
+        """测试未修改时返回原始数据"""
+        data = Path(SAMPLE).read_bytes()
+        assert open_docx(data, backend="xml").to_bytes() == data
+
+    def test_save(self, tmp_path):
+        """测试保存到路径和文件对象"""
+        doc = open_docx(SAMPLE, backend="xml")
+        doc.set_cell_text((1, 1, 1, 1), "保存")
+        path = tmp_path / "out" / "result.docx"
+        doc.save(path)
+        buffer = BytesIO()
+        doc.save(buffer)
+        assert path.read_bytes() == buffer.getvalue()
+        assert DocxReader(path).get_cell_text(1, 1, 1, 1) == "保存"
+
+    def test_does_not_load_spire(self):
+        """测试 XML 后端不会加载 Spire.Doc"""
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys\n"
+                "from docxlib import open_docx\n"
+                f"doc = open_docx({SAMPLE!r}, backend='xml')\n"
+                "doc.set_cell_text((1, 1, 1, 1), 'x')\n"
+                "doc.to_bytes()\n"
+                "print('spire.doc' in sys.modules)",
+            ],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "False"
+
+
+class TestBackendRegistry:
+    """测试后端注册与选择"""
+
+    def test_get_backend(self):
+        """测试按名称获取后端"""
+        assert get_backend("xml").name == BackendType.XML
+        assert get_backend().name == BackendType.SPIRE
+        backend = XmlBackend()
+        assert get_backend(backend) is backend
+        with pytest.raises(ValidationError):
+            get_backend("unknown")
+
+    def test_set_default_backend(self, default_backend):
+        """测试设置全局默认后端"""
+        set_default_backend("xml")
+        assert open_docx(SAMPLE).backend.name == BackendType.XML
+        with pytest.raises(ValidationError):
+            set_default_backend("unknown")
+        assert get_backend().name == BackendType.XML
+
+    def test_register_backend(self):
+        """测试注册自定义后端"""
+
+        class UpperBackend(XmlBackend):
+            name = "upper"
+
+            def get_cell_text(self, doc, position):
+                return super().get_cell_text(doc, position).upper()
+
+        register_backend("upper", UpperBackend())
+        doc = open_docx(SAMPLE, backend="upper")
+        assert doc.get_cell_text(1, 1, 1, 1) == DocxReader(SAMPLE).get_cell_text(1, 1, 1, 1).upper()
+
+        with pytest.raises(ValidationError):
+            register_backend("bad", object())
+        assert isinstance(get_backend("upper"), DocumentBackend)
+
+    def test_incomplete_backend(self):
+        """测试未实现全部方法的后端无法实例化"""
+
+        class ReadOnlyBackend(DocumentBackend):
+            def load(self, source):
+                return source
+
+        with pytest.raises(TypeError):
+            ReadOnlyBackend()
@@ -0,0 +1,102 @@
+"""
+DocxLib 批量渲染功能测试
+"""
+
+import pytest
+from docxlib import load_docx, extract_template_vars, render_batch
+from docxlib.errors import DocumentError, ValidationError
+
+TEMPLATE = "fixtures/templates/contract_template.docx"
+
+
+def make_records(count):
+    """生成测试数据"""
+    return (
+        {
+            "contract_no": f"HT-{i:03d}",
+            "party_a": "甲方公司",
+            "party_b": "乙方公司",
+            "amount": str(1000 * i),
+            "date": "2024年1月15日",
+        }
+        for i in range(count)
+    )
+
+
+class TestRenderBatch:
+    """测试批量渲染"""
+
+    def test_render_batch_in_process(self, tmp_path):
+        """测试单进程批量渲染"""
+        results = list(
+            render_batch(
+                TEMPLATE,
+                make_records(3),
+                tmp_path,
+                workers=1,
+                filename="{index}_{contract_no}.docx",
+            )
+        )
+        assert [r["index"] for r in results] == [0, 1, 2]
+        assert all(r["ok"] for r in results)
+        assert results[0]["path"].endswith("0_HT-000.docx")
+        assert extract_template_vars(load_docx(results[0]["path"])) == []
+
+    def test_render_batch_worker_processes(self, tmp_path):
+        """测试多进程批量渲染"""
+        results = list(render_batch(TEMPLATE, make_records(6), tmp_path, workers=2))
+        assert sorted(r["index"] for r in results) == list(range(6))
+        assert all(r["ok"] for r in results)
+        assert len(list(tmp_path.glob("*.docx"))) == 6
+
+    def test_render_batch_reports_failed_records(self, tmp_path):
+        """测试单条记录失败不会中断批次"""
+        records = [{"contract_no": "HT-001"}, next(make_records(1))]
+        results = list(render_batch(TEMPLATE, records, tmp_path, workers=1))
+        assert results[0]["ok"] is False
+        assert "party_a" in results[0]["error"]
+        assert results[1]["ok"] is True
+
+    def test_render_batch_missing_filename_field(self, tmp_path):
+        """测试文件名字段缺失或文件名函数出错时只标记该条记录失败"""
+        records = list(make_records(3))
+        del records[1]["contract_no"]
+        results = list(
+            render_batch(TEMPLATE, records, tmp_path, workers=1, filename="{contract_no}.docx")
+        )
+        assert [r["ok"] for r in results] == [True, False, True]
+        assert results[1]["path"] is None
+        assert "contract_no" in results[1]["error"]
+
+        def bad_name(index, record):
+            raise RuntimeError("无法命名")
+
+        results = list(render_batch(TEMPLATE, make_records(2), tmp_path, workers=2, filename=bad_name))
+        assert sorted(r["index"] for r in results) == [0, 1]
+        assert all(not r["ok"] and r["error"] == "无法命名" for r in results)
+
+    def test_render_batch_reads_records_lazily(self, tmp_path):
+        """测试多进程渲染按窗口读取记录，不会一次性读完生成器"""
+        pulled = []
+
+        def records():
+            for record in make_records(20):
+                pulled.append(record)
+                yield record
+
+        results = render_batch(TEMPLATE, records(), tmp_path, workers=2, chunksize=1)
+        first = next(results)
+        assert first["ok"]
+        # 最多 workers * chunksize * 2 条在途，取到第一条结果时再补充一组
+        assert len(pulled) <= 2 * 1 * 2 + 1
+        assert len(list(results)) == 19
+        assert len(pulled) == 20
+
+    def test_render_batch_invalid_arguments(self, tmp_path):
+        """测试无效参数立即报错"""
+        with pytest.raises(DocumentError):
+            render_batch("nonexistent.docx", [], tmp_path)
+        with pytest.raises(ValidationError):
+            render_batch(TEMPLATE, [], tmp_path, workers=0)
+        with pytest.raises(ValidationError):
+            render_batch(TEMPLATE, [], tmp_path, chunksize=0)
@@ -3,7 +3,7 @@ DocxLib 文档操作模块测试
 """
 
 import pytest
-from docxlib import load_docx, save_docx, merge_docs, to_pdf, copy_doc
+from docxlib import load_docx, save_docx, merge_docs, to_pdf, copy_doc, TemplatePool
 from docxlib.errors import DocumentError, ValidationError
 
 
@@ -39,6 +39,20 @@ class TestLoadDocx:
         finally:
             Path(temp_file).unlink()
 
+    def test_load_dotx_template(self, tmp_path):
+        """测试加载 .dotx 模板时保留模板格式"""
+        from spire.doc import Document, FileFormat
+
+        source = Document()
+        source.AddSection().AddParagraph().AppendText("模板内容")
+        template_path = tmp_path / "template.dotx"
+        source.SaveToFile(str(template_path), FileFormat.Dotx)
+        source.Close()
+
+        doc = load_docx(template_path)
+        assert doc.DetectedFormatType == FileFormat.Dotx
+        assert "模板内容" in doc.GetText()
+
 
 class TestSaveDocx:
     """测试文档保存功能"""
@@ -79,4 +93,163 @@ class TestCopyDoc:
 
     def test_copy_doc_success(self):
         """测试成功复制文档"""
-        pass
+        import gc
+
+        template = load_docx("fixtures/templates/sample.docx")
+        doc = copy_doc(template)
+        doc.Sections.get_Item(0).AddParagraph().AppendText("副本")
+        assert doc.Sections.get_Item(0).Paragraphs.Count == (
+            template.Sections.get_Item(0).Paragraphs.Count + 1
+        )
+
+        # 副本被回收后模板仍然可用
+        del doc
+        gc.collect()
+        assert template.Sections.Count > 0
+
+
+class TestLoadDocxBytes:
+    """测试从字节数据加载文档"""
+
+    def test_load_docx_from_bytes(self):
+        """测试从字节数据加载"""
+        with open("fixtures/templates/sample.docx", "rb") as f:
+            doc = load_docx(f.read())
+        assert doc.Sections.Count > 0
+
+    def test_load_docx_without_validation(self):
+        """测试跳过结构校验加载"""
+        doc = load_docx("fixtures/templates/sample.docx", validate=False)
+        assert doc.Sections.Count > 0
+
+    def test_load_docx_invalid_bytes(self):
+        """测试无效字节数据"""
+        with pytest.raises(ValidationError):
+            load_docx(b"not a zip file")
+
+    def test_load_docx_corrupted_file(self, tmp_path):
+        """测试扩展名正确但内容无效的文件"""
+        bad_file = tmp_path / "bad.docx"
+        bad_file.write_bytes(b"not a zip file")
+        with pytest.raises(ValidationError):
+            load_docx(bad_file)
+
+
+class TestTemplatePool:
+    """测试内存模板池"""
+
+    @pytest.mark.parametrize("strategy", [TemplatePool.CLONE, TemplatePool.STREAM])
+    def test_acquire_independent_copies(self, strategy):
+        """测试获取的副本互不影响"""
+        from docxlib import fill_text, get_cell_text
+
+        pool = TemplatePool("fixtures/templates/sample.docx", strategy=strategy)
+        doc1 = pool.acquire()
+        doc2 = pool.acquire()
+        fill_text(doc1, (1, 1, 1, 2), "张三")
+
+        assert get_cell_text(doc1, 1, 1, 1, 2) == "张三"
+        assert get_cell_text(doc2, 1, 1, 1, 2) == ""
+        assert get_cell_text(pool.acquire(), 1, 1, 1, 2) == ""
+
+    def test_pool_from_bytes(self):
+        """测试从字节数据创建模板池"""
+        with open("fixtures/templates/sample.docx", "rb") as f:
+            data = f.read()
+        pool = TemplatePool(data)
+        assert pool.source == data
+        assert pool.acquire().Sections.Count > 0
+
+    def test_pool_invalid_source(self):
+        """测试无效模板"""
+        with pytest.raises(DocumentError):
+            TemplatePool("nonexistent.docx")
+        with pytest.raises(ValidationError):
+            TemplatePool("fixtures/templates/sample.docx", strategy="deepcopy")
+
+
+def _make_paged_doc(page_count):
+    """创建指定页数的测试文档"""
+    from spire.doc import BreakType, Document
+
+    doc = Document()
+    section = doc.AddSection()
+    for i in range(page_count):
+        paragraph = section.AddParagraph()
+        paragraph.AppendText(f"第 {i + 1} 页")
+        if i < page_count - 1:
+            paragraph.AppendBreak(BreakType.PageBreak)
+    return doc
+
+
+class TestIterImages:
+    """测试逐页转换图片"""
+
+    def test_to_images_all_pages(self):
+        """测试转换所有页"""
+        from docxlib import to_images
+
+        images = to_images(_make_paged_doc(3))
+        assert len(images) == 3
+        assert all(img.startswith(b"\x89PNG") for img in images)
+
+    def test_iter_images_is_lazy(self):
+        """测试只渲染需要的页"""
+        import types
+        from docxlib import iter_images
+
+        images = iter_images(_make_paged_doc(3), pages=1)
+        assert isinstance(images, types.GeneratorType)
+        assert next(images).startswith(b"\x89PNG")
+        assert next(images, None) is None
+
+    def test_iter_images_page_range_out_of_bounds(self):
+        """测试页码越界"""
+        from docxlib import iter_images
+
+        with pytest.raises(ValidationError):
+            next(iter_images(_make_paged_doc(2), pages=range(1, 4)))
+
+    def test_iter_images_invalid_format(self):
+        """测试不支持的图片格式"""
+        from docxlib import iter_images
+
+        with pytest.raises(ValidationError):
+            next(iter_images(_make_paged_doc(1), image_format="gif"))
+
+    def test_iter_images_jpeg(self):
+        """测试输出 JPEG"""
+        pytest.importorskip("PIL")
+        from docxlib import iter_images
+
+        image = next(iter_images(_make_paged_doc(1), image_format="jpeg"))
+        assert image.startswith(b"\xff\xd8")
+
+    def test_iter_images_workers(self):
+        """测试多进程渲染保持页码顺序"""
+        from docxlib import iter_images
+
+        doc = _make_paged_doc(3)
+        expected = list(iter_images(doc, pages=[3, 1]))
+        assert list(iter_images(doc, pages=[3, 1], workers=2)) == expected
+
+
+class TestSaveToMemory:
+    """测试不经过磁盘的保存"""
+
+    def test_to_docx_bytes(self):
+        """测试保存为字节数据"""
+        from docxlib import to_docx_bytes, is_valid_docx
+
+        data = to_docx_bytes(load_docx("fixtures/templates/sample.docx"))
+        assert is_valid_docx(data)
+        assert load_docx(data).Sections.Count > 0
+
+    def test_save_docx_to_file_object(self):
+        """测试写入文件对象"""
+        import io
+        from docxlib import is_valid_docx
+
+        buffer = io.BytesIO()
+        save_docx(load_docx("fixtures/templates/sample.docx"), buffer)
+        assert is_valid_docx(buffer.getvalue())
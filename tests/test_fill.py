@@ -92,15 +92,70 @@ class TestFillGrid:
 
     def test_fill_grid_success(self):
         """测试成功填充网格数据"""
-        pass
+        from docxlib import get_table_text
+
+        doc = load_docx("fixtures/templates/sample.docx")
+        data = [["a", "b"], ["c", 1]]
+        assert fill_grid(doc, data, position=(1, 1, 2, 2)) == 2
+
+        table = get_table_text(doc, 1, 1)
+        assert [row[1:] for row in table[1:3]] == [["a", "b"], ["c", "1"]]
 
     def test_fill_grid_out_of_bounds(self):
         """测试数据超出边界时抛出异常"""
-        # doc = load_docx("fixtures/templates/sample.docx")
-        # data = [["测试"] * 100]
-        # with pytest.raises(PositionError):
-        #     fill_grid(doc, data, position=(1, 1, 1, 1))
-        pass
+        doc = load_docx("fixtures/templates/sample.docx")
+        with pytest.raises(PositionError):
+            fill_grid(doc, [["测试"] * 100], position=(1, 1, 1, 1))
+        with pytest.raises(PositionError):
+            fill_grid(doc, [["测试"]] * 100, position=(1, 1, 1, 1))
+        with pytest.raises(PositionError):
+            fill_grid(doc, [["测试"]], position=(1, 99, 1, 1))
+
+    def test_fill_grid_iterator_and_extend(self):
+        """测试生成器输入和复制原型行扩展表格"""
+        from docxlib import find_text, get_table_dimensions, get_table_text
+
+        doc = load_docx("fixtures/templates/sample.docx")
+        rows, cols = get_table_dimensions(doc, 1, 1)
+        prototype = get_table_text(doc, 1, 1)[1]
+        find_text(doc, "姓名")  # 建立索引，扩展后应自动失效
+
+        count = fill_grid(
+            doc,
+            ([f"r{i}"] for i in range(rows + 5)),
+            position=(1, 1, 1, 1),
+            extend=True,
+            prototype_row=2,
+        )
+
+        assert count == rows + 5
+        assert get_table_dimensions(doc, 1, 1) == (rows + 5, cols)
+        table = get_table_text(doc, 1, 1)
+        assert [row[0] for row in table] == [f"r{i}" for i in range(rows + 5)]
+        # 追加的行复制自填充前的原型行
+        assert table[-1][1:] == prototype[1:]
+        assert find_text(doc, f"r{rows + 4}") == [(1, 1, rows + 5, 1)]
+
+    def test_fill_grid_column_styles(self):
+        """测试按列设置样式"""
+        doc = load_docx("fixtures/templates/sample.docx")
+        fill_grid(
+            doc,
+            [["x", "y"]],
+            position=(1, 1, 1, 1),
+            column_styles=[None, {"bold": True, "font_size": 20, "h_align": "right"}],
+        )
+        from docxlib import get_cell
+
+        cell = get_cell(doc, 1, 1, 1, 2)
+        paragraph = cell.Paragraphs.get_Item(0)
+        run = paragraph.ChildObjects.get_Item(0)
+        assert run.CharacterFormat.Bold
+        assert run.CharacterFormat.FontSize == 20
+        assert get_cell_text(doc, 1, 1, 1, 1) == "x"
+
+        with pytest.raises(ValidationError):
+            fill_grid(doc, [["x"]], position=(1, 1, 1, 1), column_styles=[{"size": 1}])
 
 
 class TestReplaceAll:
@@ -151,6 +206,30 @@ class TestFillTextWildcard:
         with pytest.raises(PositionError, match="通配符位置"):
             fill_text(doc, (99, 0, 1, 1), "测试")
 
+    def test_fill_text_wildcard_copies_style(self):
+        """测试复制的段落保留样式，垂直对齐逐个单元格设置"""
+        from spire.doc import HorizontalAlignment, VerticalAlignment
+
+        doc = load_docx("fixtures/templates/sample.docx")
+        fill_text(
+            doc, (1, 1, 0, 2), "样式", font_name="黑体", font_size=15,
+            bold=True, underline=True, h_align="right", v_align="bottom",
+        )
+
+        rows = doc.Sections.get_Item(0).Tables.get_Item(0).Rows
+        for r_idx in range(rows.Count):
+            cell = rows.get_Item(r_idx).Cells.get_Item(1)
+            assert cell.Paragraphs.Count == 1
+            paragraph = cell.Paragraphs.get_Item(0)
+            run = paragraph.ChildObjects.get_Item(0)
+            assert paragraph.Text == "样式"
+            assert run.CharacterFormat.FontName == "黑体"
+            assert run.CharacterFormat.FontSize == 15
+            assert run.CharacterFormat.Bold
+            assert paragraph.Format.HorizontalAlignment == HorizontalAlignment.Right
+            assert cell.CellFormat.VerticalAlignment == VerticalAlignment.Bottom
+        assert get_cell_text(doc, 1, 1, rows.Count, 2) == "样式"
+
 
 class TestMatchModeControl:
     """测试匹配模式控制功能"""
@@ -257,3 +336,36 @@ class TestBackwardCompatibility:
         for sec, tbl, row, col in name_positions:
             cell_text = get_cell_text(doc, sec, tbl, row, col + 1)
             assert cell_text == "王五", f"All matched positions should contain '王五'"
+
+
+class TestFillForm:
+    """测试按标签批量填充表单"""
+
+    def test_fill_form_match_right(self):
+        """测试一次填充多个标签右侧单元格"""
+        from docxlib import fill_form
+
+        doc = load_docx("fixtures/templates/sample.docx")
+        filled = fill_form(doc, {"姓名": "张三", "年龄": 25, "项目": "智慧城市"})
+
+        assert filled["姓名"] == [(1, 1, 1, 2)]
+        assert get_cell_text(doc, 1, 1, 1, 2) == "张三"
+        assert get_cell_text(doc, 1, 1, 2, 2) == "25"
+        assert get_cell_text(doc, 1, 1, 4, 2) == "智慧城市"
+
+    def test_fill_form_match_down(self):
+        """测试填充标签下方单元格"""
+        from docxlib import fill_form
+
+        doc = load_docx("fixtures/templates/sample.docx")
+        fill_form(doc, {"项目": "智慧城市"}, mode="match_down")
+        assert get_cell_text(doc, 1, 1, 5, 1) == "智慧城市"
+
+    def test_fill_form_missing_label(self):
+        """测试标签缺失时不修改文档"""
+        from docxlib import fill_form
+
+        doc = load_docx("fixtures/templates/sample.docx")
+        with pytest.raises(PositionError, match="不存在的标签"):
+            fill_form(doc, {"姓名": "张三", "不存在的标签": "值"})
+        assert get_cell_text(doc, 1, 1, 1, 2) == ""
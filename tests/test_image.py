@@ -0,0 +1,318 @@
+"""
+DocxLib 图片缓存测试
+"""
+
+import os
+import sys
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from docxlib import (
+    DocxReader,
+    ImageCache,
+    fill_image,
+    fill_text,
+    get_image_cache,
+    get_image_size,
+    get_table_dimensions,
+    load_docx,
+    to_docx_bytes,
+)
+from docxlib.errors import FillError, ValidationError
+
+SAMPLE = "fixtures/templates/sample.docx"
+LOGO = "fixtures/images/logo.png"
+
+
+def make_image(index: int, size: int = 1000) -> bytes:
+    """生成内容不同的伪 PNG 数据（仅文件头有效，用于测试缓存）"""
+    return b"\x89PNG\r\n\x1a\n" + bytes([index % 256]) * size
+
+
+class TestImageCache:
+    """测试图片缓存"""
+
+    def test_bytes_hit(self):
+        """测试相同内容只缓存一次"""
+        cache = ImageCache()
+        first = cache.get(make_image(1))
+        second = cache.get(bytearray(make_image(1)))
+        assert first is second
+        assert first.extension == "png"
+        assert Path(first.path).read_bytes() == make_image(1)
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+    def test_path_and_bytes_share_entry(self):
+        """测试同一图片的路径和字节数据共用条目，路径命中时不重新读取"""
+        cache = ImageCache()
+        by_path = cache.get(LOGO)
+        assert cache.get(Path(LOGO)) is by_path
+        assert cache.get(Path(LOGO).read_bytes()) is by_path
+        assert cache.stats()["misses"] == 1
+
+    def test_modified_file(self, tmp_path):
+        """测试文件内容变化后重新读取"""
+        cache = ImageCache()
+        image_path = tmp_path / "seal.png"
+        image_path.write_bytes(make_image(1))
+        first = cache.get(image_path)
+        image_path.write_bytes(make_image(2, size=2000))
+        second = cache.get(image_path)
+        assert first is not second
+        assert second.read_bytes() == make_image(2, size=2000)
+
+    def test_lru_eviction(self):
+        """测试按字节数淘汰最久未使用的图片并删除副本"""
+        cache = ImageCache(max_bytes=2500)
+        first = cache.get(make_image(1))
+        second = cache.get(make_image(2))
+        cache.get(make_image(1))  # 1 变为最近使用
+        third = cache.get(make_image(3))
+
+        assert cache.stats()["evictions"] == 1
+        assert not os.path.exists(second.path)
+        assert os.path.exists(first.path) and os.path.exists(third.path)
+        assert cache.stats()["bytes"] == first.nbytes + third.nbytes
+
+    def test_oversized_entry_kept(self):
+        """测试超过容量的图片仍可使用，直到下次淘汰"""
+        cache = ImageCache(max_bytes=100)
+        entry = cache.get(make_image(1))
+        assert os.path.exists(entry.path)
+        cache.resize(0)
+        assert len(cache) == 0
+        assert not os.path.exists(entry.path)
+
+    def test_pinned_entries_not_evicted(self):
+        """测试 pinned() 块内获取的条目在块结束前不会被淘汰"""
+        cache = ImageCache(max_bytes=1500)
+        with cache.pinned():
+            first = cache.get(make_image(1))
+            with cache.pinned():
+                second = cache.get(make_image(2))
+                third = cache.get(make_image(3))
+            # 内层块结束后 first 仍被外层块固定
+            assert os.path.exists(first.path)
+            assert not os.path.exists(second.path)
+            cache.clear()
+            assert os.path.exists(first.path)
+        assert len(cache) == 1 and cache.get(make_image(1)) is first
+        cache.get(make_image(4))
+        assert not os.path.exists(first.path) and not os.path.exists(third.path)
+
+    def test_fill_image_small_cache(self, monkeypatch):
+        """测试缓存容量很小时 fill_image 仍能插入多张图片"""
+        monkeypatch.setattr("docxlib.image._default_cache", ImageCache(max_bytes=1))
+        doc = load_docx(SAMPLE)
+        fill_image(doc, (1, 1, 2, 2), LOGO, width=50, height=50)
+        fill_image(doc, (1, 1, 2, 3), Path(LOGO).read_bytes() + b"\x00", width=50, height=50)
+        row = doc.Sections.get_Item(0).Tables.get_Item(0).Rows.get_Item(1)
+        for col in (1, 2):
+            assert row.Cells.get_Item(col).Paragraphs.get_Item(0).ChildObjects.Count > 0
+
+    def test_clear(self):
+        """测试清空缓存"""
+        cache = ImageCache()
+        entry = cache.get(make_image(1))
+        cache.clear()
+        assert len(cache) == 0
+        assert not os.path.exists(entry.path)
+
+    def test_errors(self):
+        """测试无效输入"""
+        cache = ImageCache()
+        with pytest.raises(FillError):
+            cache.get("nonexistent.png")
+        with pytest.raises(ValueError):
+            cache.get(123)
+
+
+class TestFillImageCache:
+    """测试 fill_image 使用图片缓存"""
+
+    def test_shared_across_documents(self):
+        """测试多个文档填充同一图片时只写一次副本"""
+        data = Path(LOGO).read_bytes()
+        cache = get_image_cache()
+        before = cache.stats()
+        for _ in range(3):
+            doc = load_docx(SAMPLE)
+            fill_image(doc, (1, 1, 2, 2), data, width=50, height=50)
+            cell = doc.Sections.get_Item(0).Tables.get_Item(0).Rows.get_Item(1).Cells.get_Item(1)
+            assert cell.Paragraphs.get_Item(0).ChildObjects.Count > 0
+        after = cache.stats()
+        assert after["misses"] - before["misses"] <= 1
+        assert after["hits"] - before["hits"] >= 2
+        assert os.path.exists(cache.get(data).path)
+
+
+def make_jpeg(width: int, height: int) -> bytes:
+    """生成只含 APP0、DQT、SOF0 段头的 JPEG 数据"""
+    app0 = b"\xff\xe0" + (16).to_bytes(2, "big") + b"JFIF\x00" + b"\x00" * 9
+    dqt = b"\xff\xdb" + (67).to_bytes(2, "big") + b"\x00" * 65
+    sof = (
+        b"\xff\xc0" + (17).to_bytes(2, "big") + b"\x08"
+        + height.to_bytes(2, "big") + width.to_bytes(2, "big") + b"\x03" + b"\x00" * 9
+    )
+    return b"\xff\xd8" + app0 + b"\xff" + dqt + sof + b"\xff\xda" + b"\x00" * 20 + b"\xff\xd9"
+
+
+def make_bmp(width: int, height: int) -> bytes:
+    """生成 BITMAPINFOHEADER 格式的 BMP 文件头"""
+    return (
+        b"BM" + b"\x00" * 12 + (40).to_bytes(4, "little")
+        + width.to_bytes(4, "little", signed=True)
+        + height.to_bytes(4, "little", signed=True) + b"\x00" * 28
+    )
+
+
+class TestGetImageSize:
+    """测试只解析文件头获取图片尺寸"""
+
+    def test_png(self):
+        """测试 PNG（路径、字节和 memoryview）"""
+        data = Path(LOGO).read_bytes()
+        assert get_image_size(LOGO) == (200, 200)
+        assert get_image_size(data) == (200, 200)
+        assert get_image_size(memoryview(data)) == (200, 200)
+
+    def test_jpeg(self, tmp_path):
+        """测试 JPEG 跳过前置段和填充字节"""
+        data = make_jpeg(640, 480)
+        assert get_image_size(data) == (640, 480)
+        path = tmp_path / "photo.jpg"
+        path.write_bytes(data)
+        assert get_image_size(path) == (640, 480)
+
+    def test_bmp_and_gif(self):
+        """测试 BMP（含自上而下存储）和 GIF"""
+        assert get_image_size(make_bmp(30, 20)) == (30, 20)
+        assert get_image_size(make_bmp(30, -20)) == (30, 20)
+        core = b"BM" + b"\x00" * 12 + (12).to_bytes(4, "little") + (7).to_bytes(2, "little") + (9).to_bytes(2, "little")
+        assert get_image_size(core + b"\x00" * 4) == (7, 9)
+        assert get_image_size(b"GIF89a" + (5).to_bytes(2, "little") + (6).to_bytes(2, "little")) == (5, 6)
+
+    def test_unknown_or_truncated(self):
+        """测试无法识别或文件头不完整时返回 None"""
+        assert get_image_size(b"not an image") is None
+        assert get_image_size(b"\x89PNG\r\n\x1a\n") is None
+        assert get_image_size(make_jpeg(10, 10)[:40]) is None
+
+    def test_errors(self):
+        """测试无效输入"""
+        with pytest.raises(FillError):
+            get_image_size("nonexistent.png")
+        with pytest.raises(ValueError):
+            get_image_size(123)
+
+    def test_cached_size(self):
+        """测试缓存条目使用文件头尺寸"""
+        entry = ImageCache().get(make_jpeg(320, 240))
+        assert (entry.width_px, entry.height_px) == (320, 240)
+        assert entry.extension == "jpeg"
+
+
+def make_photo(width: int, height: int, image_format: str = "JPEG", mode: str = "RGB") -> bytes:
+    """使用 PIL 生成带噪点的测试图片"""
+    from PIL import Image as PILImage
+
+    image = PILImage.effect_noise((width, height), 64).convert(mode)
+    output = BytesIO()
+    image.save(output, image_format)
+    return output.getvalue()
+
+
+class TestResample:
+    """测试按显示尺寸缩放图片"""
+
+    def test_invalid_options(self):
+        """测试无效参数"""
+        cache = ImageCache()
+        with pytest.raises(ValidationError):
+            cache.get_resampled(LOGO, 50, 50, max_dpi=0)
+        with pytest.raises(ValidationError):
+            cache.get_resampled(LOGO, 50, 50, target_quality=100)
+        doc = load_docx(SAMPLE)
+        with pytest.raises(ValidationError):
+            fill_image(doc, (1, 1, 2, 2), LOGO, width=50, max_dpi=-1)
+
+    def test_requires_pillow(self, monkeypatch):
+        """测试未安装 Pillow 时报错"""
+        monkeypatch.setitem(sys.modules, "PIL", None)
+        with pytest.raises(ValidationError, match="Pillow"):
+            ImageCache().get_resampled(LOGO, 50, 50, max_dpi=96)
+
+    def test_downscale_cached(self):
+        """测试缩小到目标分辨率，并按 (内容, 目标尺寸) 缓存"""
+        pytest.importorskip("PIL")
+        cache = ImageCache()
+        data = make_photo(1200, 900)
+        small = cache.get_resampled(data, 72, 54, max_dpi=200)
+        assert (small.width_px, small.height_px) == (200, 150)
+        assert small.extension == "jpeg"
+        assert small.nbytes < len(data)
+        assert cache.get_resampled(data, 72, 54, max_dpi=200) is small
+        assert cache.get_resampled(data, 36, 27, max_dpi=200) is not small
+
+    def test_no_upscale(self):
+        """测试原图分辨率不超过目标时直接使用原图"""
+        pytest.importorskip("PIL")
+        cache = ImageCache()
+        data = make_photo(100, 100)
+        assert cache.get_resampled(data, 72, 72, max_dpi=300) is cache.get(data)
+
+    def test_keeps_transparency(self):
+        """测试带透明通道的 PNG 重新压缩时保持 PNG"""
+        pytest.importorskip("PIL")
+        cache = ImageCache()
+        data = make_photo(400, 400, "PNG", "RGBA")
+        result = cache.get_resampled(data, 72, 72, max_dpi=100, target_quality=70)
+        assert result.extension == "png"
+        assert (result.width_px, result.height_px) == (100, 100)
+        opaque = cache.get_resampled(make_photo(400, 400, "PNG"), 72, 72, max_dpi=100, target_quality=70)
+        assert opaque.extension == "jpeg"
+
+    def test_fill_image_display_size(self):
+        """测试缩放后显示尺寸仍按原图计算"""
+        pytest.importorskip("PIL")
+        data = make_photo(1200, 900)
+        doc = load_docx(SAMPLE)
+        fill_image(doc, (1, 1, 2, 2), data, width=60, max_dpi=96)
+        cell = doc.Sections.get_Item(0).Tables.get_Item(0).Rows.get_Item(1).Cells.get_Item(1)
+        picture = cell.Paragraphs.get_Item(0).ChildObjects.get_Item(0)
+        assert picture.Width == pytest.approx(60, abs=0.1)
+        assert picture.Height == pytest.approx(45, abs=0.1)
+
+
+class TestSharedPicture:
+    """测试多个位置共用一份图片数据"""
+
+    def test_wildcard_embeds_once(self):
+        """测试通配符填充只写入一个媒体部件，所有位置都引用它"""
+        doc = load_docx(SAMPLE)
+        fill_image(doc, (1, 1, 0, 0), LOGO, width=20, height=20, h_align="center")
+        rows, cols = get_table_dimensions(doc, 1, 1)
+        media = DocxReader(to_docx_bytes(doc)).get_media_info()
+        assert len(media) == 1
+        assert media[0]["references"] == rows * cols
+        assert media[0]["size"] == Path(LOGO).stat().st_size
+
+        # 复制的图片保留尺寸
+        cell = doc.Sections.get_Item(0).Tables.get_Item(0).Rows.get_Item(rows - 1).Cells.get_Item(cols - 1)
+        picture = cell.Paragraphs.get_Item(0).ChildObjects.get_Item(0)
+        assert (picture.Width, picture.Height) == (20, 20)
+
+    def test_match_all_embeds_once(self):
+        """测试匹配所有位置时只写入一个媒体部件"""
+        doc = load_docx(SAMPLE)
+        fill_text(doc, (1, 1, 5, 1), "印章")
+        fill_text(doc, (1, 1, 7, 1), "印章")
+        fill_image(doc, "印章", LOGO, mode="match_right", width=10, height=10)
+        media = DocxReader(to_docx_bytes(doc)).get_media_info()
+        assert [item["references"] for item in media] == [2]
+
+    def test_media_info_without_images(self):
+        """测试没有图片的文档"""
+        assert DocxReader(SAMPLE).get_media_info() == []
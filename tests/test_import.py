@@ -0,0 +1,137 @@
+"""
+DocxLib 包导入测试
+
+每个用例在独立的子进程中运行，确保 sys.modules 未被其他测试污染。
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# 导入 docxlib 允许的最长耗时（秒）；加载 Spire.Doc 运行时通常需要更久
+IMPORT_TIME_LIMIT = 0.3
+
+
+def run_python(code, *args):
+    """在子进程中执行代码，返回标准输出"""
+    result = subprocess.run(
+        [sys.executable, "-c", code, *args],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stdout.strip()
+
+
+class TestLazyImport:
+    """测试延迟导入"""
+
+    def test_import_does_not_load_spire(self):
+        """测试导入包不会加载 Spire.Doc"""
+        output = run_python(
+            "import sys, docxlib\n"
+            "docxlib.DEFAULT_FONT, docxlib.FillMode, docxlib.is_valid_docx\n"
+            "print('spire.doc' in sys.modules)"
+        )
+        assert output == "False"
+
+    def test_spire_available_probe(self):
+        """测试 SPIRE_AVAILABLE 探测不会加载 Spire.Doc"""
+        output = run_python(
+            "import sys, docxlib\n"
+            "print(docxlib.SPIRE_AVAILABLE, 'spire.doc' in sys.modules)"
+        )
+        assert output == "True False"
+
+    def test_lazy_attribute_loads_submodule(self):
+        """测试首次访问引擎相关名称时才导入子模块"""
+        output = run_python(
+            "import sys, docxlib\n"
+            "from docxlib import load_docx\n"
+            "from docxlib.document import load_docx as original\n"
+            "print(load_docx is original, 'spire.doc' in sys.modules)"
+        )
+        assert output == "True True"
+
+    def test_all_names_resolvable(self):
+        """测试 __all__ 中的名称都可以访问"""
+        import docxlib
+
+        for name in docxlib.__all__:
+            assert getattr(docxlib, name) is not None
+        assert set(docxlib.__all__) <= set(dir(docxlib))
+
+    def test_unknown_attribute(self):
+        """测试访问不存在的名称"""
+        import docxlib
+
+        with pytest.raises(AttributeError):
+            docxlib.no_such_function
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["version"],
+            ["info"],
+            ["validate", "fixtures/templates/sample.docx"],
+            ["inspect", "fixtures/templates/sample.docx"],
+            ["extract-vars", "fixtures/templates/template_vars.docx"],
+        ],
+    )
+    def test_cli_commands_do_not_load_spire(self, argv):
+        """测试不需要引擎的 CLI 命令不会加载 Spire.Doc"""
+        output = run_python(
+            "import sys\n"
+            "from docxlib.cli import main\n"
+            "sys.argv = ['docxlib'] + sys.argv[1:]\n"
+            "code = main()\n"
+            "print('spire.doc' in sys.modules, code)",
+            *argv,
+        )
+        assert output.splitlines()[-1] == "False 0"
+
+    def test_cli_fill_does_not_load_spire(self, tmp_path):
+        """测试纯文本模板填充不会加载 Spire.Doc"""
+        template = "fixtures/templates/contract_template.docx"
+        from docxlib import DocxReader
+
+        data = {var: "x" for var in DocxReader(template).extract_template_vars()}
+        data_path = tmp_path / "data.json"
+        data_path.write_text(json.dumps(data), encoding="utf-8")
+        output_path = tmp_path / "out.docx"
+
+        output = run_python(
+            "import sys\n"
+            "from docxlib.cli import main\n"
+            "sys.argv = ['docxlib'] + sys.argv[1:]\n"
+            "code = main()\n"
+            "print('spire.doc' in sys.modules, code)",
+            "fill",
+            template,
+            str(data_path),
+            "-o",
+            str(output_path),
+        )
+        assert output.splitlines()[-1] == "False 0"
+        assert DocxReader(output_path).extract_template_vars() == []
+
+
+class TestImportTime:
+    """测试导入耗时"""
+
+    def test_import_time(self):
+        """测试导入 docxlib 的耗时不超过限制"""
+        output = run_python(
+            "import time\n"
+            "start = time.perf_counter()\n"
+            "import docxlib\n"
+            "print(time.perf_counter() - start)"
+        )
+        assert float(output) < IMPORT_TIME_LIMIT
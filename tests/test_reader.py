@@ -0,0 +1,226 @@
+"""
+DocxLib 只读文档（DocxReader）测试
+"""
+
+import zipfile
+from pathlib import Path
+
+import pytest
+from docxlib import (
+    DocxReader,
+    extract_template_vars,
+    get_cell_text,
+    get_section_count,
+    get_section_table_count,
+    get_table_column_text,
+    get_table_dimensions,
+    get_table_row_text,
+    get_table_text,
+    iterate_cells,
+    load_docx,
+)
+from docxlib.errors import DocumentError, PositionError, ValidationError
+
+FIXTURES = [
+    "fixtures/templates/sample.docx",
+    "fixtures/templates/contract_template.docx",
+    "fixtures/templates/template_vars.docx",
+]
+
+_W_NS = (
+    'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+    'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"'
+)
+
+
+def _run(text):
+    return f'<w:r><w:t xml:space="preserve">{text}</w:t></w:r>'
+
+
+def _cell(*paragraphs):
+    return "<w:tc>" + "".join(paragraphs) + "</w:tc>"
+
+
+def _table(rows):
+    return (
+        "<w:tbl><w:tblGrid/>"
+        + "".join("<w:tr>" + "".join(row) + "</w:tr>" for row in rows)
+        + "</w:tbl>"
+    )
+
+
+def make_docx(path, body):
+    """以 sample.docx 为基础，替换 word/document.xml 的正文"""
+    xml = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f"<w:document {_W_NS}><w:body>{body}</w:body></w:document>"
+    )
+    with zipfile.ZipFile(FIXTURES[0]) as src, zipfile.ZipFile(path, "w") as dst:
+        for name in src.namelist():
+            if name == "word/document.xml":
+                dst.writestr(name, xml)
+            else:
+                dst.writestr(name, src.read(name))
+    return path
+
+
+@pytest.fixture
+def structured_docx(tmp_path):
+    """包含嵌套表格、文本框、分节符、换行和制表符的文档"""
+    nested = _table([[_cell("<w:p>" + _run("N1") + "</w:p>")]])
+    text_box = (
+        "<w:r><mc:AlternateContent><mc:Choice Requires=\"wps\"><w:drawing>"
+        "<w:txbxContent><w:p>" + _run("${boxed}") + "</w:p></w:txbxContent>"
+        "</w:drawing></mc:Choice><mc:Fallback><w:pict><w:txbxContent><w:p>"
+        + _run("${boxed}")
+        + "</w:p></w:txbxContent></w:pict></mc:Fallback></mc:AlternateContent></w:r>"
+    )
+    body = "".join(
+        [
+            "<w:p>" + _run("A") + "<w:r><w:tab/><w:t>B</w:t><w:br/><w:t>C</w:t></w:r></w:p>",
+            _table(
+                [
+                    [
+                        _cell("<w:p>" + _run(" x ") + "</w:p>", "<w:p>" + _run("y") + "</w:p>"),
+                        _cell("<w:p>" + _run("${name}") + "</w:p>"),
+                    ],
+                    [
+                        _cell("<w:p>" + _run("o") + "</w:p>", nested, "<w:p>" + _run("p") + "</w:p>"),
+                        _cell("<w:p>" + _run("q") + "<w:r><w:delText>d</w:delText></w:r></w:p>"),
+                    ],
+                ]
+            ),
+            "<w:p><w:pPr><w:sectPr/></w:pPr>" + _run("end") + "</w:p>",
+            "<w:p>" + _run("${title}") + text_box + "</w:p>",
+            _table([[_cell("<w:p>" + _run("s2") + "</w:p>")]]),
+            "<w:sectPr/>",
+        ]
+    )
+    return make_docx(tmp_path / "structured.docx", body)
+
+
+class TestDocxReaderMatchesSpire:
+    """测试 DocxReader 与 Spire.Doc 读取结果一致"""
+
+    @pytest.mark.parametrize("path", FIXTURES)
+    def test_cells_match(self, path):
+        """测试所有单元格文本一致"""
+        doc = load_docx(path)
+        reader = DocxReader(path)
+        expected = [
+            (sec, tbl, row, col, get_cell_text(doc, sec, tbl, row, col))
+            for sec, tbl, row, col, _ in iterate_cells(doc)
+        ]
+        assert list(reader.iterate_cells()) == expected
+
+    @pytest.mark.parametrize("path", FIXTURES)
+    def test_structure_match(self, path):
+        """测试节、表格、尺寸以及整表/行/列文本一致"""
+        doc = load_docx(path)
+        reader = DocxReader(path)
+
+        assert reader.get_section_count() == get_section_count(doc)
+        for sec in range(1, get_section_count(doc) + 1):
+            table_count = get_section_table_count(doc, sec)
+            assert reader.get_section_table_count(sec) == table_count
+            for tbl in range(1, table_count + 1):
+                rows, cols = get_table_dimensions(doc, sec, tbl)
+                assert reader.get_table_dimensions(sec, tbl) == (rows, cols)
+                assert reader.get_table_text(sec, tbl) == get_table_text(doc, sec, tbl)
+                assert reader.get_table_row_text(sec, tbl, rows) == get_table_row_text(
+                    doc, sec, tbl, rows
+                )
+                assert reader.get_table_column_text(sec, tbl, 1) == get_table_column_text(
+                    doc, sec, tbl, 1
+                )
+
+    @pytest.mark.parametrize("path", FIXTURES)
+    def test_template_vars_match(self, path):
+        """测试模板变量提取结果一致"""
+        doc = load_docx(path)
+        reader = DocxReader(path)
+        assert reader.extract_template_vars(unique=False) == extract_template_vars(
+            doc, unique=False
+        )
+        assert extract_template_vars(reader) == extract_template_vars(doc)
+
+    def test_structured_document_match(self, structured_docx):
+        """测试嵌套表格、文本框、分节符等结构的处理与 Spire.Doc 一致"""
+        doc = load_docx(structured_docx)
+        reader = DocxReader(structured_docx)
+
+        assert reader.get_section_count() == get_section_count(doc) == 2
+        assert reader.get_section_table_count(1) == 1
+        assert list(reader.iterate_cells()) == [
+            (sec, tbl, row, col, get_cell_text(doc, sec, tbl, row, col))
+            for sec, tbl, row, col, _ in iterate_cells(doc)
+        ]
+        assert reader.get_table_text(1, 1) == [["xy", "${name}"], ["op", "qd"]]
+        assert reader.extract_template_vars() == extract_template_vars(doc)
+        assert reader.extract_template_vars() == ["name", "title"]
+
+
+class TestDocxReader:
+    """测试 DocxReader 接口"""
+
+    def test_from_bytes(self):
+        """测试从字节数据读取"""
+        data = Path(FIXTURES[0]).read_bytes()
+        assert list(DocxReader(data).iterate_cells()) == list(
+            DocxReader(FIXTURES[0]).iterate_cells()
+        )
+
+    def test_find_text_and_get_cells(self):
+        """测试查找文本和通配符获取单元格"""
+        reader = DocxReader(FIXTURES[0])
+        sec, tbl, row, col, text = next(
+            cell for cell in reader.iterate_cells() if cell[4]
+        )
+        assert (sec, tbl, row, col) in reader.find_text(text)
+        assert reader.find_text("不存在的文本xyz") == []
+
+        cells = reader.get_cells(section=1, table=1, row=1)
+        assert [cell[3] for cell in cells] == list(
+            range(1, reader.get_table_dimensions(1, 1)[1] + 1)
+        )
+        assert reader.get_cells(section=99) == []
+
+    @pytest.mark.parametrize(
+        "method, args",
+        [
+            ("get_cell_text", (1, 1, 999, 1)),
+            ("get_cell_text", (0, 1, 1, 1)),
+            ("get_table_dimensions", (1, 99)),
+            ("get_table_text", (99, 1)),
+            ("get_table_row_text", (1, 1, 999)),
+            ("get_table_column_text", (1, 1, 999)),
+            ("get_section_table_count", (99,)),
+        ],
+    )
+    def test_invalid_position(self, method, args):
+        """测试位置越界"""
+        reader = DocxReader(FIXTURES[0])
+        with pytest.raises(PositionError):
+            getattr(reader, method)(*args)
+
+    def test_file_not_found(self):
+        """测试文件不存在"""
+        with pytest.raises(DocumentError):
+            DocxReader("nonexistent.docx")
+
+    def test_invalid_file(self, tmp_path):
+        """测试无效文件"""
+        bad = tmp_path / "bad.docx"
+        bad.write_bytes(b"not a zip")
+        with pytest.raises(ValidationError):
+            DocxReader(bad)
+        with pytest.raises(ValidationError):
+            DocxReader(b"not a zip")
+
+    def test_missing_document_part(self, tmp_path):
+        """测试缺少 word/document.xml"""
+        path = tmp_path / "empty.docx"
+        with zipfile.ZipFile(path, "w") as package:
+            package.writestr("[Content_Types].xml", "<Types/>")
+        with pytest.raises(ValidationError):
+            DocxReader(path)
@@ -0,0 +1,282 @@
+"""
+DocxLib 样式模块测试
+"""
+
+import zipfile
+from io import BytesIO
+
+import pytest
+from docxlib import (
+    StyleSpec,
+    apply_font_style,
+    fill_date,
+    fill_grid,
+    fill_text,
+    get_cell,
+    get_document_styles,
+    get_format_stats,
+    get_table_dimensions,
+    get_table_styles,
+    iterate_cells,
+    load_docx,
+    parse_color,
+    register_style,
+    reset_format_stats,
+    set_minimal_formatting,
+    to_docx_bytes,
+)
+from docxlib.errors import PositionError, ValidationError
+
+SAMPLE = "fixtures/templates/sample.docx"
+
+
+def first_run(doc, row, col):
+    """获取第1节第1个表格指定单元格的第一个文本范围（索引从 1 开始）"""
+    cell = doc.Sections.get_Item(0).Tables.get_Item(0).Rows.get_Item(row - 1).Cells.get_Item(col - 1)
+    return cell.Paragraphs.get_Item(0).ChildObjects.get_Item(0)
+
+
+class TestParseColor:
+    """测试颜色解析缓存"""
+
+    def test_cached(self):
+        """测试同一颜色（不同写法）返回同一对象"""
+        assert parse_color("red") is parse_color("red")
+        assert parse_color("#ff0000") is parse_color("FF0000")
+        assert parse_color(" Red ") is parse_color("red")
+
+    def test_shared_color_applied(self):
+        """测试共用的颜色对象可以应用到多个文本范围"""
+        doc = load_docx(SAMPLE)
+        fill_text(doc, (1, 1, 1, 2), "甲", color="blue")
+        fill_text(doc, (1, 1, 2, 2), "乙", color="#0000FF")
+        for row in (1, 2):
+            color = first_run(doc, row, 2).CharacterFormat.TextColor
+            assert (color.R, color.G, color.B) == (0, 0, 255)
+
+
+class TestStyleSpec:
+    """测试 StyleSpec"""
+
+    def test_immutable_and_hashable(self):
+        """测试不可修改、可哈希"""
+        spec = StyleSpec(font_name="黑体", bold=True)
+        with pytest.raises(AttributeError):
+            spec.bold = False
+        assert spec == StyleSpec(font_name="黑体", bold=True)
+        assert len({spec, StyleSpec(font_name="黑体", bold=True)}) == 1
+        assert spec != StyleSpec()
+
+    def test_replace_and_from_dict(self):
+        """测试 replace 和 from_dict"""
+        spec = StyleSpec(font_size=14)
+        assert spec.replace(bold=True) == StyleSpec(font_size=14, bold=True)
+        assert spec.bold is False
+        assert StyleSpec.from_dict(spec) is spec
+        assert StyleSpec.from_dict({"italic": True}) == StyleSpec(italic=True)
+        with pytest.raises(ValidationError):
+            spec.replace(size=1)
+        with pytest.raises(ValidationError):
+            StyleSpec.from_dict(["bold"])
+
+    def test_fill_text_style(self):
+        """测试 fill_text 使用 StyleSpec"""
+        from spire.doc import HorizontalAlignment
+
+        doc = load_docx(SAMPLE)
+        spec = StyleSpec(font_name="黑体", font_size=18, color="red", italic=True, h_align="center")
+        fill_text(doc, (1, 1, 1, 2), "标题", style=spec)
+        run = first_run(doc, 1, 2)
+        assert run.CharacterFormat.FontName == "黑体"
+        assert run.CharacterFormat.FontSize == 18
+        assert run.CharacterFormat.Italic
+        assert run.CharacterFormat.TextColor.R == 255
+        assert run.OwnerParagraph.Format.HorizontalAlignment == HorizontalAlignment.Center
+
+    def test_fill_date_style(self):
+        """测试 fill_date 使用 StyleSpec，年月日使用宋体"""
+        doc = load_docx(SAMPLE)
+        fill_date(doc, (1, 1, 3, 2), "2024年1月15日", style=StyleSpec(font_name="Arial", font_size=11, bold=True))
+        paragraph = doc.Sections.get_Item(0).Tables.get_Item(0).Rows.get_Item(2).Cells.get_Item(1).Paragraphs.get_Item(0)
+        number, separator = paragraph.ChildObjects.get_Item(0), paragraph.ChildObjects.get_Item(1)
+        assert (number.Text, number.CharacterFormat.FontName) == ("2024", "Arial")
+        assert (separator.Text, separator.CharacterFormat.FontName) == ("年", "宋体")
+        assert number.CharacterFormat.Bold and separator.CharacterFormat.Bold
+        assert separator.CharacterFormat.FontSize == 11
+
+    def test_fill_grid_column_styles(self):
+        """测试 fill_grid 的列样式可混用 StyleSpec 和字典"""
+        doc = load_docx(SAMPLE)
+        fill_grid(
+            doc,
+            [["a", "b"]],
+            position=(1, 1, 1, 2),
+            column_styles=[StyleSpec(bold=True), {"font_size": 20}],
+        )
+        assert first_run(doc, 1, 2).CharacterFormat.Bold
+        assert first_run(doc, 1, 3).CharacterFormat.FontSize == 20
+
+
+class TestRegisterStyle:
+    """测试命名段落样式"""
+
+    def test_fill_text_references_style(self):
+        """测试填充时只引用样式，不写入直接格式"""
+        from spire.doc import VerticalAlignment
+
+        doc = load_docx(SAMPLE)
+        spec = StyleSpec(font_name="黑体", font_size=13, color="red", bold=True, h_align="center", v_align="bottom")
+        assert register_style(doc, "FieldValue", spec) == "FieldValue"
+        fill_text(doc, (1, 1, 0, 2), "值", style="FieldValue")
+
+        run = first_run(doc, 2, 2)
+        assert run.OwnerParagraph.StyleName == "FieldValue"
+        assert run.CharacterFormat.FontName == "黑体"
+        assert run.CharacterFormat.Bold
+        cell = doc.Sections.get_Item(0).Tables.get_Item(0).Rows.get_Item(1).Cells.get_Item(1)
+        assert cell.CellFormat.VerticalAlignment == VerticalAlignment.Bottom
+
+        with zipfile.ZipFile(BytesIO(to_docx_bytes(doc))) as package:
+            document_xml = package.read("word/document.xml").decode("utf-8")
+            styles_xml = package.read("word/styles.xml").decode("utf-8")
+        rows = get_table_dimensions(doc, 1, 1)[0]
+        assert document_xml.count('<w:pStyle w:val="FieldValue" />') == rows
+        assert "<w:b />" not in document_xml
+        assert styles_xml.count('w:styleId="FieldValue"') == 1
+
+    def test_register_twice(self):
+        """测试重复注册"""
+        doc = load_docx(SAMPLE)
+        register_style(doc, "FieldValue", {"bold": True})
+        assert register_style(doc, "FieldValue", StyleSpec(bold=True)) == "FieldValue"
+        with pytest.raises(ValidationError):
+            register_style(doc, "FieldValue", StyleSpec(bold=False))
+        with pytest.raises(ValidationError):
+            register_style(doc, "Normal", StyleSpec())
+
+    def test_register_not_counted(self):
+        """测试注册样式不计入直接格式的写入统计"""
+        doc = load_docx(SAMPLE)
+        reset_format_stats()
+        register_style(doc, "FieldValue", StyleSpec(font_name="黑体", bold=True))
+        assert get_format_stats() == {"written": 0, "skipped": 0}
+        assert doc.Styles.FindByName("FieldValue").CharacterFormat.Bold
+
+    def test_unknown_and_template_styles(self):
+        """测试未注册的名称报错，模板中已有的样式可以直接引用"""
+        doc = load_docx(SAMPLE)
+        with pytest.raises(ValidationError, match="未注册"):
+            fill_text(doc, (1, 1, 1, 2), "值", style="NoSuchStyle")
+        with pytest.raises(ValidationError, match="第 1 列样式"):
+            fill_grid(doc, [["x"]], position=(1, 1, 1, 2), column_styles=["NoSuchStyle"])
+        fill_text(doc, (1, 1, 1, 2), "值", style="Heading 1")
+        assert first_run(doc, 1, 2).OwnerParagraph.StyleName == "Heading1"  # StyleName 返回样式 ID
+
+    def test_fill_grid_and_date(self):
+        """测试 fill_grid 和 fill_date 使用样式名称"""
+        doc = load_docx(SAMPLE)
+        register_style(doc, "Cell", StyleSpec(font_name="Arial", italic=True))
+        fill_grid(doc, [["a", "b"]], position=(1, 1, 1, 2), column_styles=["Cell", None])
+        assert first_run(doc, 1, 2).OwnerParagraph.StyleName == "Cell"
+
+        fill_date(doc, (1, 1, 3, 2), "2024年1月15日", style="Cell")
+        paragraph = doc.Sections.get_Item(0).Tables.get_Item(0).Rows.get_Item(2).Cells.get_Item(1).Paragraphs.get_Item(0)
+        assert paragraph.StyleName == "Cell"
+        assert paragraph.ChildObjects.get_Item(0).CharacterFormat.FontName == "Arial"
+        assert paragraph.ChildObjects.get_Item(1).CharacterFormat.FontName == "宋体"
+
+
+class TestMinimalFormatting:
+    """测试最小格式模式"""
+
+    @pytest.fixture(autouse=True)
+    def minimal(self):
+        set_minimal_formatting(True)
+        reset_format_stats()
+        yield
+        set_minimal_formatting(False)
+
+    def test_skips_inherited_properties(self):
+        """测试与继承格式相同的属性不写入，效果不变"""
+        doc = load_docx(SAMPLE)
+        fill_text(doc, (1, 1, 1, 2), "值", font_name="黑体", font_size=14)
+        run = first_run(doc, 1, 2)
+        assert (run.CharacterFormat.FontName, run.CharacterFormat.FontSize) == ("黑体", 14)
+        assert not run.CharacterFormat.Bold and not run.CharacterFormat.Italic
+        # 粗体、斜体与继承格式相同，被跳过
+        assert get_format_stats()["skipped"] >= 2
+
+        with zipfile.ZipFile(BytesIO(to_docx_bytes(doc))) as package:
+            document_xml = package.read("word/document.xml").decode("utf-8")
+        assert '<w:b w:val="0" />' not in document_xml
+        assert '<w:i w:val="0" />' not in document_xml
+
+    def test_baseline_reused(self):
+        """测试同一次填充只读取一次继承格式，不同的属性仍然写入"""
+        doc = load_docx(SAMPLE)
+        fill_grid(
+            doc,
+            [["a", "b"], ["c", "d"]],
+            position=(1, 1, 1, 2),
+            column_styles=[StyleSpec(bold=True), StyleSpec(bold=True)],
+        )
+        stats = get_format_stats()
+        # 每个单元格：字体、字号、颜色、粗体写入，斜体跳过
+        assert stats["skipped"] == 4
+        assert first_run(doc, 2, 3).CharacterFormat.Bold
+
+    def test_apply_font_style_minimal(self):
+        """测试 apply_font_style 的 minimal 参数优先于全局设置"""
+        doc = load_docx(SAMPLE)
+        fill_text(doc, (1, 1, 1, 2), "值")
+        run = first_run(doc, 1, 2)
+        reset_format_stats()
+        apply_font_style(run, "", 0, "", bold=True, minimal=False)
+        assert get_format_stats() == {"written": 2, "skipped": 0}
+        reset_format_stats()
+        apply_font_style(run, "", 0, "", bold=True)
+        assert get_format_stats() == {"written": 0, "skipped": 2}
+
+
+class TestStyleSnapshot:
+    """测试批量样式快照"""
+
+    def test_table_styles(self):
+        """测试列式结果与单元格一一对应"""
+        doc = load_docx(SAMPLE)
+        fill_text(doc, (1, 1, 1, 2), "值", font_name="黑体", font_size=14, color="red",
+                  bold=True, underline=True, h_align="center", v_align="bottom")
+        get_cell(doc, 1, 1, 2, 1).CellFormat.BackColor = parse_color("#D9D9D9")
+
+        styles = get_table_styles(doc, 1, 1)
+        rows, cols = get_table_dimensions(doc, 1, 1)
+        assert len({len(column) for column in styles.values()}) == 1
+        assert len(styles["row"]) == rows * cols
+
+        i = list(zip(styles["row"], styles["col"])).index((1, 2))
+        assert (styles["font_name"][i], styles["font_size"][i]) == ("黑体", 14)
+        assert styles["bold"][i] and styles["underline"][i] and not styles["italic"][i]
+        assert (styles["color"][i], styles["h_align"][i], styles["v_align"][i]) == ("#FF0000", "center", "bottom")
+
+        j = list(zip(styles["row"], styles["col"])).index((2, 1))
+        assert styles["background_color"][j] == "#D9D9D9"
+        assert styles["background_color"][i] == ""
+
+    def test_table_styles_errors(self):
+        """测试表格不存在"""
+        with pytest.raises(PositionError):
+            get_table_styles(load_docx(SAMPLE), 1, 99)
+
+    def test_document_styles(self):
+        """测试文档快照包含所有单元格和正文段落"""
+        doc = load_docx(SAMPLE)
+        styles = get_document_styles(doc)
+        cells, paragraphs = styles["cells"], styles["paragraphs"]
+        assert len(cells["section"]) == sum(1 for _ in iterate_cells(doc))
+        first_table = [
+            font for sec, tbl, font in zip(cells["section"], cells["table"], cells["font_name"])
+            if (sec, tbl) == (1, 1)
+        ]
+        assert first_table == get_table_styles(doc, 1, 1)["font_name"]
+        assert len(paragraphs["index"]) == doc.Sections.get_Item(0).Paragraphs.Count
+        assert len({len(column) for column in paragraphs.values()}) == 1
@@ -3,7 +3,16 @@ DocxLib 表格操作模块测试
 """
 
 import pytest
-from docxlib import load_docx, get_cell, get_cells, find_text, iterate_cells
+from docxlib import (
+    fill_text,
+    load_docx,
+    get_cell,
+    get_cells,
+    find_text,
+    iterate_cells,
+    get_document_index,
+    invalidate_index,
+)
 from docxlib.errors import PositionError
 
 
@@ -60,3 +69,136 @@ class TestIterateCells:
     def test_iterate_cells_yield(self):
         """测试生成器正确返回"""
         pass
+
+
+class TestDocumentIndex:
+    """测试单元格文本索引"""
+
+    def test_index_matches_full_scan(self):
+        """测试索引结果与逐个单元格比对一致"""
+        from docxlib import get_cell_text
+
+        doc = load_docx("fixtures/templates/sample.docx")
+        index = get_document_index(doc)
+        expected = [
+            (sec, tbl, row, col)
+            for sec, tbl, row, col, _ in iterate_cells(doc)
+            if get_cell_text(doc, sec, tbl, row, col) == "姓名"
+        ]
+        assert expected
+        assert index.find("姓名") == expected
+        assert find_text(doc, "姓名") == expected
+        assert len(index) == len(list(iterate_cells(doc)))
+
+    def test_index_updated_by_fill(self):
+        """测试通过 docxlib 填充后索引同步更新"""
+        from docxlib import fill_text
+
+        doc = load_docx("fixtures/templates/sample.docx")
+        index = get_document_index(doc)
+        fill_text(doc, (1, 1, 1, 1), "索引测试")
+
+        assert get_document_index(doc) is index
+        assert index.get_text((1, 1, 1, 1)) == "索引测试"
+        assert find_text(doc, "索引测试") == [(1, 1, 1, 1)]
+
+    def test_index_recovers_from_direct_edit(self):
+        """测试直接修改文档后：过期的命中会重新核对，新文本需 invalidate_index"""
+        doc = load_docx("fixtures/templates/sample.docx")
+        old_text = get_document_index(doc).get_text((1, 1, 1, 1))
+
+        cell = get_cell(doc, 1, 1, 1, 1)
+        cell.Paragraphs.Clear()
+        cell.AddParagraph().AppendText("直接修改")
+
+        assert (1, 1, 1, 1) not in find_text(doc, old_text)
+        assert find_text(doc, "直接修改") == [(1, 1, 1, 1)]
+
+    def test_miss_rebuilds_once(self):
+        """测试先未命中时重建一次索引，能找到直接写入的文本；确认不存在的文本不再重建"""
+        doc = load_docx("fixtures/templates/sample.docx")
+        get_document_index(doc)
+
+        cell = get_cell(doc, 1, 1, 1, 1)
+        cell.Paragraphs.Clear()
+        cell.AddParagraph().AppendText("直接修改")
+
+        # 第一次查找即未命中，不依赖先前的过期命中
+        assert find_text(doc, "直接修改") == [(1, 1, 1, 1)]
+
+        assert find_text(doc, "不存在的标签") == []
+        index = get_document_index(doc)
+        assert find_text(doc, "不存在的标签") == []
+        assert get_document_index(doc) is index
+
+
+class TestHandleCache:
+    """测试节/表格/行对象缓存"""
+
+    def test_handles_reused(self):
+        """测试同一次调用内复用行对象"""
+        from docxlib import get_cell_text
+        from docxlib.table import _HandleCache, _get_cell_text, _get_row_cells
+
+        doc = load_docx("fixtures/templates/sample.docx")
+        handles = _HandleCache()
+        cells, _ = _get_row_cells(doc, 1, 1, 2, handles)
+        assert _get_row_cells(doc, 1, 1, 2, handles)[0] is cells
+        assert get_cell_text(doc, 1, 1, 2, 1) == _get_cell_text(cells.get_Item(0))
+
+    def test_cached_reads_match(self):
+        """测试使用缓存读取的行、列文本与逐个单元格读取一致"""
+        from docxlib import (
+            get_cell_text,
+            get_table_column_text,
+            get_table_dimensions,
+            get_table_row_text,
+            get_table_text,
+        )
+
+        doc = load_docx("fixtures/templates/sample.docx")
+        rows, cols = get_table_dimensions(doc, 1, 1)
+        expected = [
+            [get_cell_text(doc, 1, 1, row, col) for col in range(1, cols + 1)]
+            for row in range(1, rows + 1)
+        ]
+        assert get_table_text(doc, 1, 1) == expected
+        assert get_table_row_text(doc, 1, 1, 2) == expected[1]
+        assert get_table_column_text(doc, 1, 1, 1) == [row[0] for row in expected]
+
+    def test_direct_row_removal(self):
+        """测试直接删除行后无需 invalidate_index 即可正确定位和填充"""
+        from docxlib import get_cell_text, get_table_dimensions
+
+        doc = load_docx("fixtures/templates/sample.docx")
+        rows, cols = get_table_dimensions(doc, 1, 1)
+        third_row = get_cell_text(doc, 1, 1, 3, 1)
+
+        table = doc.Sections.get_Item(0).Tables.get_Item(0)
+        table.Rows.RemoveAt(1)
+
+        assert get_table_dimensions(doc, 1, 1) == (rows - 1, cols)
+        assert get_cell_text(doc, 1, 1, 2, 1) == third_row
+        fill_text(doc, (1, 1, 2, 1), "WRITTEN")
+        assert table.Rows.get_Item(1).Cells.get_Item(0).Paragraphs.get_Item(0).Text == "WRITTEN"
+        with pytest.raises(PositionError):
+            get_cell(doc, 1, 1, rows, 1)
+
+    def test_direct_row_added(self):
+        """测试直接追加行后可以获取新行的单元格"""
+        from docxlib import get_table_dimensions
+
+        doc = load_docx("fixtures/templates/sample.docx")
+        rows, _ = get_table_dimensions(doc, 1, 1)
+        get_cell(doc, 1, 1, rows, 1)
+
+        doc.Sections.get_Item(0).Tables.get_Item(0).AddRow()
+        assert get_cell(doc, 1, 1, rows + 1, 1) is not None
+
+    def test_invalid_position(self):
+        """测试越界和非法索引"""
+        doc = load_docx("fixtures/templates/sample.docx")
+        positions = [(1, 1, 999, 1), (1, 99, 1, 1), (0, 1, 1, 1), (1, 1, 0, 1), (1, 1, 1, 99)]
+        for position in positions:
+            with pytest.raises(PositionError):
+                get_cell(doc, *position)
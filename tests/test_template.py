@@ -9,6 +9,7 @@ from docxlib import (
     extract_template_vars,
     validate_template_data,
     save_docx,
+    compile_template,
 )
 from docxlib.errors import VariableNotFoundError
 
@@ -145,12 +146,12 @@ class TestBackwardCompatibility:
 class TestTemplateIntegration:
     """集成测试"""
 
-    def test_fill_and_save_workflow(self):
+    def test_fill_and_save_workflow(self, tmp_path):
         """测试完整工作流：加载-填充-保存"""
         doc = load_docx("fixtures/templates/sample.docx")
         data = {"name": "测试用户"}
         fill_template(doc, data, missing_var_action="ignore")
-        save_docx(doc, "output/test_template_output.docx")
+        save_docx(doc, tmp_path / "test_template_output.docx")
         # 不抛出异常即通过
 
     def test_extract_validate_fill_workflow(self):
@@ -169,3 +170,235 @@ class TestTemplateIntegration:
         # 3. 填充
         fill_template(doc, data, missing_var_action="ignore")
         # 不抛出异常即通过
+
+
+class TestSinglePassSubstitution:
+    """测试单次遍历的变量替换"""
+
+    def test_fill_all_variables_in_one_pass(self):
+        """测试一次替换全部变量（含默认值和表格）"""
+        doc = load_docx("fixtures/templates/template_vars.docx")
+        data = {"name": "张三", "age": 25, "date": "2024年1月15日", "amount": "100"}
+        stats = fill_template(doc, data)
+        assert stats == {"total": 12, "replaced": 5, "missing": []}
+        assert extract_template_vars(doc) == []
+
+        section = doc.Sections.get_Item(0)
+        texts = [
+            section.Paragraphs.get_Item(i).Text
+            for i in range(section.Paragraphs.Count)
+        ]
+        assert "姓名：张三" in texts
+        assert "部门：未知" in texts
+
+    def test_missing_variable_leaves_document_untouched(self):
+        """测试缺失变量报错时文档未被修改"""
+        doc = load_docx("fixtures/templates/template_vars.docx")
+        with pytest.raises(VariableNotFoundError):
+            fill_template(doc, {"name": "张三"})
+        assert "name" in extract_template_vars(doc)
+
+    def test_placeholder_split_across_runs(self):
+        """测试跨文本块拆分的占位符"""
+        from spire.doc import Document
+
+        doc = Document()
+        paragraph = doc.AddSection().AddParagraph()
+        paragraph.AppendText("A${na")
+        paragraph.AppendText("me}B${x")
+        paragraph.AppendText("}C")
+
+        stats = fill_template(doc, {"name": "张三", "x": "X"})
+        assert stats["replaced"] == 2
+        assert paragraph.Text == "A张三BXC"
+
+    def test_nested_table_and_text_box(self):
+        """测试嵌套表格和文本框中的变量"""
+        from spire.doc import Document
+
+        def make_document():
+            doc = Document()
+            section = doc.AddSection()
+            section.AddParagraph().AppendText("正文 ${name}")
+            table = section.AddTable(True)
+            table.ResetCells(1, 1)
+            nested = table.Rows.get_Item(0).Cells.get_Item(0).AddTable(True)
+            nested.ResetCells(1, 1)
+            nested.Rows.get_Item(0).Cells.get_Item(0).AddParagraph().AppendText("嵌套 ${code}")
+            text_box = section.AddParagraph().AppendTextBox(100, 50)
+            text_box.Body.AddParagraph().AppendText("文本框 ${name}")
+            return doc, nested, text_box
+
+        doc, nested, text_box = make_document()
+        stats = fill_template(doc, {"name": "张三", "code": "A1"})
+        assert stats == {"total": 3, "replaced": 2, "missing": []}
+        assert nested.Rows.get_Item(0).Cells.get_Item(0).Paragraphs.get_Item(0).Text == "嵌套 A1"
+        assert text_box.Body.Paragraphs.get_Item(0).Text == "文本框 张三"
+
+        doc, nested, _ = make_document()
+        with pytest.raises(VariableNotFoundError):
+            fill_template(doc, {"name": "张三"})
+        assert "${code}" in doc.GetText()
+
+        from docxlib import to_docx_bytes
+
+        template = compile_template(to_docx_bytes(make_document()[0]))
+        assert set(template.variables) == {"name", "code"}
+        text = template.render({"name": "张三", "code": "A1"}).GetText()
+        assert "嵌套 A1" in text and "文本框 张三" in text
+
+
+class TestCompiledTemplate:
+    """测试模板编译与渲染"""
+
+    DATA = {"name": "张三", "age": "25", "date": "2024年1月15日", "amount": "100"}
+
+    def test_compile_records_variables(self):
+        """测试编译后的变量信息"""
+        template = compile_template("fixtures/templates/template_vars.docx")
+        assert template.variables == ["name", "age", "dept", "date", "amount"]
+        assert template.defaults == {"dept": "未知"}
+        assert "dept" not in template.required_vars
+        assert template.placeholder_count == 12
+
+    def test_extract_and_validate_from_compiled(self):
+        """测试从编译结果直接提取和验证变量"""
+        template = compile_template("fixtures/templates/template_vars.docx")
+        doc = load_docx("fixtures/templates/template_vars.docx")
+        assert extract_template_vars(template) == extract_template_vars(doc)
+        assert extract_template_vars(template, unique=False) == extract_template_vars(
+            doc, unique=False
+        )
+
+        result = validate_template_data(template, {"name": "张三"})
+        assert result["is_valid"] is False
+        assert set(result["missing_vars"]) == {"age", "dept", "date", "amount"}
+
+    def test_render_returns_independent_documents(self):
+        """测试每次渲染得到独立文档"""
+        template = compile_template("fixtures/templates/template_vars.docx")
+        doc1 = template.render(self.DATA)
+        doc2 = template.render(dict(self.DATA, name="李四"))
+
+        assert extract_template_vars(doc1) == []
+        text1 = doc1.Sections.get_Item(0).Paragraphs.get_Item(2).Text
+        text2 = doc2.Sections.get_Item(0).Paragraphs.get_Item(2).Text
+        assert text1 == "姓名：张三"
+        assert text2 == "姓名：李四"
+
+    def test_render_bytes(self):
+        """测试渲染为字节数据"""
+        template = compile_template("fixtures/templates/template_vars.docx")
+        data = template.render_bytes(self.DATA)
+        assert extract_template_vars(load_docx(data)) == []
+
+    def test_render_missing_variable(self):
+        """测试渲染时缺失变量"""
+        template = compile_template("fixtures/templates/template_vars.docx")
+        with pytest.raises(VariableNotFoundError):
+            template.render({"name": "张三"})
+
+        doc = template.render({"name": "张三"}, missing_var_action="ignore")
+        assert "age" in extract_template_vars(doc)
+
+
+def make_loop_document(rows):
+    """创建包含一个表格的文档，rows 为各行单元格文本"""
+    from spire.doc import Document
+
+    doc = Document()
+    section = doc.AddSection()
+    section.AddParagraph().AppendText("标题：${title}")
+    table = section.AddTable(True)
+    table.ResetCells(len(rows), len(rows[0]))
+    for row_idx, row in enumerate(rows):
+        for col_idx, text in enumerate(row):
+            cell = table.Rows.get_Item(row_idx).Cells.get_Item(col_idx)
+            cell.AddParagraph().AppendText(text)
+    return doc
+
+
+class TestRowLoops:
+    """测试表格行循环变量"""
+
+    ROWS = [
+        ["名称", "金额"],
+        ["${items[].name}", "${items[].amount|0} ${unit}"],
+        ["合计", "${total}"],
+    ]
+    DATA = {
+        "title": "报销单",
+        "unit": "元",
+        "total": "4",
+        "items": [{"name": "a", "amount": 1}, {"name": "b"}, {"name": "c", "amount": 3}],
+    }
+    EXPECTED = [["名称", "金额"], ["a", "1 元"], ["b", "0 元"], ["c", "3 元"], ["合计", "4"]]
+
+    def test_fill_template_expands_rows(self):
+        """测试按列表元素复制模板行"""
+        from docxlib import get_table_text
+
+        doc = make_loop_document(self.ROWS)
+        assert extract_template_vars(doc) == ["title", "items", "unit", "total"]
+
+        stats = fill_template(doc, self.DATA)
+        assert get_table_text(doc, 1, 1) == self.EXPECTED
+        assert stats["total"] == 5
+        assert extract_template_vars(doc) == []
+
+    def test_compiled_template_matches_fill_template(self):
+        """测试编译后渲染与 fill_template 结果一致，且多次渲染互不影响"""
+        from docxlib import DocxReader, get_table_text, to_docx_bytes
+
+        template = compile_template(to_docx_bytes(make_loop_document(self.ROWS)))
+        assert template.row_loops == {"items": ["name", "amount"]}
+        assert "items" in template.required_vars
+        assert extract_template_vars(template) == ["title", "items", "unit", "total"]
+        assert DocxReader(template.source).extract_template_vars() == template.variables
+
+        doc = template.render(self.DATA)
+        assert get_table_text(doc, 1, 1) == self.EXPECTED
+        empty = template.render(dict(self.DATA, items=[]))
+        assert get_table_text(empty, 1, 1) == [["名称", "金额"], ["合计", "4"]]
+
+    def test_missing_list_and_fields(self):
+        """测试缺失列表和字段的处理方式"""
+        from docxlib import get_table_text
+
+        data = {"title": "", "unit": "", "total": ""}
+        with pytest.raises(VariableNotFoundError):
+            fill_template(make_loop_document(self.ROWS), data)
+        with pytest.raises(VariableNotFoundError, match=r"items\[\]\.name"):
+            fill_template(make_loop_document(self.ROWS), dict(data, items=[{}]))
+
+        doc = make_loop_document(self.ROWS)
+        fill_template(doc, data, missing_var_action="ignore")
+        assert get_table_text(doc, 1, 1)[1][0] == "${items[].name}"
+
+        doc = make_loop_document(self.ROWS)
+        fill_template(doc, data, missing_var_action="empty")
+        assert len(get_table_text(doc, 1, 1)) == 2
+
+    def test_invalid_loops(self):
+        """测试循环变量位置和数据类型错误"""
+        from docxlib.errors import ValidationError, VariableSyntaxError
+
+        mixed = [["${a[].x}", "${b[].y}"]]
+        with pytest.raises(VariableSyntaxError):
+            fill_template(make_loop_document(mixed), {"a": [], "b": []})
+        with pytest.raises(ValidationError):
+            fill_template(make_loop_document(self.ROWS), dict(self.DATA, items="abc"))
+
+        doc = make_loop_document([["x"]])
+        doc.Sections.get_Item(0).AddParagraph().AppendText("${items[].name}")
+        with pytest.raises(VariableSyntaxError):
+            fill_template(doc, self.DATA)
+
+    def test_xml_fast_path_falls_back(self):
+        """测试 fill_template_bytes 遇到循环行时回退到 Spire.Doc"""
+        from docxlib import DocxReader, fill_template_bytes, to_docx_bytes
+
+        source = to_docx_bytes(make_loop_document(self.ROWS))
+        result, stats = fill_template_bytes(source, self.DATA)
+        assert stats["backend"] == "spire"
+        assert DocxReader(result).get_table_text(1, 1) == self.EXPECTED
@@ -0,0 +1,192 @@
+"""
+DocxLib XML 模板填充（fill_template_bytes）测试
+"""
+
+import zipfile
+from io import BytesIO
+
+import pytest
+from docxlib import (
+    DocxReader,
+    extract_template_vars,
+    fill_template,
+    fill_template_bytes,
+    load_docx,
+    to_docx_bytes,
+)
+from docxlib.errors import DocumentError, ValidationError, VariableNotFoundError
+
+TEMPLATE_VARS = "fixtures/templates/template_vars.docx"
+CONTRACT = "fixtures/templates/contract_template.docx"
+
+_W_NS = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+
+
+def make_docx(body, base=CONTRACT):
+    """以现有模板为基础，替换 word/document.xml 的正文，返回字节数据"""
+    xml = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f"<w:document {_W_NS}><w:body>{body}<w:sectPr/></w:body></w:document>"
+    )
+    output = BytesIO()
+    with zipfile.ZipFile(base) as src, zipfile.ZipFile(output, "w") as dst:
+        for name in src.namelist():
+            if name == "word/document.xml":
+                dst.writestr(name, xml)
+            else:
+                dst.writestr(name, src.read(name))
+    return output.getvalue()
+
+
+def paragraph_texts(docx_bytes):
+    """读取正文段落文本"""
+    return [text for text in DocxReader(docx_bytes)._iter_paragraph_texts() if text]
+
+
+def spire_fill(path, data, **kwargs):
+    doc = load_docx(path)
+    stats = fill_template(doc, data, **kwargs)
+    return to_docx_bytes(doc), stats
+
+
+class TestFillTemplateBytes:
+    """测试 XML 快速路径"""
+
+    @pytest.mark.parametrize("path", [TEMPLATE_VARS, CONTRACT])
+    def test_matches_spire(self, path):
+        """测试结果与 Spire.Doc 的 fill_template 一致"""
+        data = {
+            var: f"值<{var}>&"
+            for var in extract_template_vars(load_docx(path))
+        }
+        xml_bytes, xml_stats = fill_template_bytes(
+            path, data, missing_var_action="empty"
+        )
+        spire_bytes, spire_stats = spire_fill(path, data, missing_var_action="empty")
+
+        assert xml_stats.pop("backend") == "xml"
+        assert xml_stats == spire_stats
+        assert list(DocxReader(xml_bytes).iterate_cells()) == list(
+            DocxReader(spire_bytes).iterate_cells()
+        )
+        assert paragraph_texts(xml_bytes) == [
+            text for text in paragraph_texts(spire_bytes) if "Evaluation" not in text
+        ]
+        # 结果可以被 Spire.Doc 正常加载
+        assert extract_template_vars(load_docx(xml_bytes)) == []
+
+    def test_other_parts_copied(self):
+        """测试未修改的部件内容保持不变"""
+        result, _ = fill_template_bytes(CONTRACT, {}, missing_var_action="empty")
+        with zipfile.ZipFile(CONTRACT) as src, zipfile.ZipFile(BytesIO(result)) as dst:
+            assert src.namelist() == dst.namelist()
+            for name in src.namelist():
+                if name != "word/document.xml":
+                    assert src.read(name) == dst.read(name)
+
+    def test_split_runs(self):
+        """测试被拆分到多个文本块中的占位符"""
+        body = (
+            "<w:p><w:r><w:rPr><w:b/></w:rPr><w:t>姓名：${na</w:t></w:r>"
+            "<w:proofErr w:type=\"spellStart\"/>"
+            "<w:r><w:t>me}</w:t></w:r><w:r><w:t>。</w:t></w:r></w:p>"
+        )
+        result, stats = fill_template_bytes(make_docx(body), {"name": "张三"})
+
+        assert stats["backend"] == "xml"
+        assert stats["replaced"] == 1
+        assert paragraph_texts(result) == ["姓名：张三。"]
+        with zipfile.ZipFile(BytesIO(result)) as package:
+            xml = package.read("word/document.xml").decode("utf-8")
+        # 替换文本写入占位符起始的文本块，保留其格式
+        assert "<w:rPr><w:b/></w:rPr><w:t>姓名：张三</w:t>" in xml
+
+    def test_escaping_and_whitespace(self):
+        """测试特殊字符转义和首尾空白"""
+        body = "<w:p><w:r><w:t>${a}</w:t></w:r><w:r><w:t>${b}</w:t></w:r></w:p>"
+        result, _ = fill_template_bytes(make_docx(body), {"a": "<&>", "b": " x "})
+
+        assert paragraph_texts(result) == ["<&> x "]
+        with zipfile.ZipFile(BytesIO(result)) as package:
+            xml = package.read("word/document.xml").decode("utf-8")
+        assert "&lt;&amp;&gt;" in xml
+        assert '<w:t xml:space="preserve"> x </w:t>' in xml
+
+    def test_text_box_falls_back(self):
+        """测试文本框等扫描范围之外的变量回退到 fill_template 一并替换"""
+        from spire.doc import Document
+
+        doc = Document()
+        section = doc.AddSection()
+        section.AddParagraph().AppendText("正文 ${a}")
+        section.AddParagraph().AppendTextBox(100, 50).Body.AddParagraph().AppendText("文本框 ${a}")
+
+        result, stats = fill_template_bytes(to_docx_bytes(doc), {"a": "1"})
+
+        assert stats["backend"] == "spire"
+        assert stats["total"] == 2
+        text = load_docx(result).GetText()
+        assert "${a}" not in text
+        assert "文本框 1" in text
+
+    def test_missing_var_actions(self):
+        """测试缺失变量处理方式"""
+        body = "<w:p><w:r><w:t>${a}-${b|默认}</w:t></w:r></w:p>"
+        source = make_docx(body)
+
+        with pytest.raises(VariableNotFoundError):
+            fill_template_bytes(source, {})
+
+        result, stats = fill_template_bytes(source, {}, missing_var_action="ignore")
+        assert paragraph_texts(result) == ["${a}-默认"]
+        assert stats["replaced"] == 1
+
+        result, _ = fill_template_bytes(source, {}, missing_var_action="empty")
+        assert paragraph_texts(result) == ["-默认"]
+
+    def test_header_footer(self, tmp_path):
+        """测试页眉页脚中的变量"""
+        from spire.doc import Document, FileFormat
+
+        doc = Document()
+        section = doc.AddSection()
+        section.AddParagraph().AppendText("正文 ${body}")
+        section.HeadersFooters.Header.AddParagraph().AppendText("页眉 ${header}")
+        section.HeadersFooters.Footer.AddParagraph().AppendText("页脚 ${footer}")
+        path = tmp_path / "header_footer.docx"
+        doc.SaveToFile(str(path), FileFormat.Docx)
+
+        result, stats = fill_template_bytes(
+            path, {"body": "1", "header": "2", "footer": "3"}
+        )
+        assert stats["backend"] == "xml"
+        assert stats["replaced"] == 3
+        texts = paragraph_texts(result)
+        assert "页眉 2" in texts and "页脚 3" in texts
+        assert DocxReader(result).extract_template_vars() == []
+
+    def test_invalid_source(self, tmp_path):
+        """测试无效输入"""
+        with pytest.raises(DocumentError):
+            fill_template_bytes("nonexistent.docx", {})
+        with pytest.raises(ValidationError):
+            fill_template_bytes(b"not a zip", {})
+
+
+class TestSpireFallback:
+    """测试回退到 Spire.Doc"""
+
+    def test_multiline_value(self):
+        """测试替换值包含换行时回退"""
+        result, stats = fill_template_bytes(
+            CONTRACT, {"party_a": "第一行\n第二行"}, missing_var_action="ignore"
+        )
+        assert stats["backend"] == "spire"
+        assert "party_a" not in extract_template_vars(load_docx(result))
+
+    def test_placeholder_across_tab(self):
+        """测试变量跨越制表符时回退"""
+        body = "<w:p><w:r><w:t>${a|x</w:t><w:tab/><w:t>y}</w:t></w:r></w:p>"
+        result, stats = fill_template_bytes(make_docx(body), {"a": "1"})
+        assert stats["backend"] == "spire"
+        assert stats["replaced"] == 1